@@ -1,7 +1,8 @@
 #!/bin/bash
 # Regenerate Cinema-Quality 3D Asset
-# Usage: ./regenerate_asset.sh [asset-id] [section]
+# Usage: ./regenerate_asset.sh [asset-id] [section] [generator flags...]
 # Example: ./regenerate_asset.sh station-home home
+# Example: ./regenerate_asset.sh station-home home --progressive
 
 set -e  # Exit on error
 
@@ -15,6 +16,7 @@ NC='\033[0m' # No Color
 # Default values
 ASSET_ID="${1:-station-home}"
 SECTION="${2:-home}"
+EXTRA_ARGS=("${@:3}")
 
 echo -e "${BLUE}╔════════════════════════════════════════════════════════════╗${NC}"
 echo -e "${BLUE}║   Cinema-Quality 3D Asset Regeneration Script             ║${NC}"
@@ -48,15 +50,15 @@ if [ ! -f "$BLENDER_SCRIPT" ]; then
     exit 1
 fi
 
-echo -e "${BLUE}[1/3]${NC} Running Blender generation..."
+echo -e "${BLUE}[1/4]${NC} Running Blender generation..."
 echo -e "${YELLOW}      This will take 10-30 seconds...${NC}"
 echo ""
 
 # Run Blender in background mode
-blender -b -P "$BLENDER_SCRIPT" -- --id "$ASSET_ID" --section "$SECTION"
+blender -b -P "$BLENDER_SCRIPT" -- --id "$ASSET_ID" --section "$SECTION" "${EXTRA_ARGS[@]}"
 
 echo ""
-echo -e "${BLUE}[2/3]${NC} Verifying output files..."
+echo -e "${BLUE}[2/4]${NC} Verifying output files..."
 
 # Check if GLB was created
 if [ ! -f "$OUTPUT_GLB" ]; then
@@ -80,7 +82,11 @@ echo -e "${GREEN}✓ GLB:${NC} $OUTPUT_GLB (${GLB_SIZE})"
 echo -e "${GREEN}✓ Metadata:${NC} $OUTPUT_META (${META_SIZE})"
 echo ""
 
-echo -e "${BLUE}[3/3]${NC} Asset regeneration complete!"
+echo -e "${BLUE}[3/4]${NC} Updating scene manifest..."
+python3 "$SCRIPT_DIR/tools/blender-scripts/build_scene_manifest.py"
+echo ""
+
+echo -e "${BLUE}[4/4]${NC} Asset regeneration complete!"
 echo ""
 echo -e "${GREEN}╔════════════════════════════════════════════════════════════╗${NC}"
 echo -e "${GREEN}║   ✓ Cinema-Quality Asset Ready                            ║${NC}"
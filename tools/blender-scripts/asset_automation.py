@@ -6,12 +6,33 @@ Usage: python asset_automation.py --config assets/meta/asset-list.json
 """
 
 import json
+import os
+import queue
+import signal
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 from datetime import datetime
 import argparse
 
+from build_scene_manifest import write_scene_manifest
+import asset_registry
+import build_farm
+import build_metrics
+import job_resources
+
+# Wall-clock limit per job phase in seconds; override with --timeout PHASE=SECONDS
+PHASE_TIMEOUTS = {
+    "generate": 1200,
+}
+IDLE_TIMEOUT = 300      # A run printing nothing for this long is treated as hung
+MAX_RETRIES = 2         # Extra attempts after a failed or timed-out run
+RETRY_BACKOFF = 10      # Seconds before the first retry, doubled for each further retry
+KILL_GRACE = 10         # Seconds between SIGTERM and SIGKILL when reaping a process group
+
 
 def load_asset_list(config_path):
     """Load the asset list configuration"""
@@ -25,51 +46,183 @@ def save_asset_list(config_path, asset_list):
         json.dump(asset_list, f, indent=2)
 
 
-def run_blender_script(script_path, asset_id, section):
-    """Run Blender script in headless mode"""
+def parse_timeouts(values):
+    """PHASE=SECONDS overrides on top of PHASE_TIMEOUTS"""
+    timeouts = dict(PHASE_TIMEOUTS)
+    for value in values or []:
+        phase, _, seconds = value.partition('=')
+        if phase not in timeouts or not seconds:
+            raise ValueError(f"Expected PHASE=SECONDS with PHASE in {', '.join(timeouts)}: {value}")
+        timeouts[phase] = float(seconds)
+    return timeouts
+
+
+def reap_process_group(process):
+    """Terminate the process group a supervised run started, escalating to SIGKILL
+
+    Blender can leave helper processes behind; the group outlives the
+    leader, so it is signalled even after the leader has exited.
+    """
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        return
+    try:
+        process.wait(timeout=KILL_GRACE)
+    except subprocess.TimeoutExpired:
+        pass
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    process.wait()
+
+
+def supervise(cmd, timeout, idle_timeout, prefix='', on_line=None):
+    """Run cmd in its own process group, streaming output; returns (exit code, reason, peak memory)
+
+    The run is killed when it exceeds timeout or prints nothing for
+    idle_timeout seconds. The exit code is None when it was killed.
+    Output lines are prefixed with prefix when jobs run side by side,
+    and passed to on_line when given.
+    """
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        start_new_session=True
+    )
+
+    lines = queue.Queue()
+
+    def pump():
+        for line in process.stdout:
+            lines.put(line)
+        lines.put(None)
+
+    threading.Thread(target=pump, daemon=True).start()
+
+    start = last_output = time.monotonic()
+    reason = None
+    peak = 0
+    last_sample = 0
+    while True:
+        if time.monotonic() - last_sample >= 1:
+            peak = max(peak, job_resources.group_peak_memory(process.pid) or 0)
+            last_sample = time.monotonic()
+
+        try:
+            line = lines.get(timeout=1)
+        except queue.Empty:
+            # Leader gone but an orphan still holds the pipe open
+            if process.poll() is not None:
+                break
+            line = ''
+        if line is None:
+            break
+        if line:
+            print(f"{prefix}{line}", end='')
+            last_output = time.monotonic()
+            if on_line:
+                on_line(line)
+
+        now = time.monotonic()
+        if now - start > timeout:
+            reason = f"timed out after {timeout:.0f}s"
+        elif now - last_output > idle_timeout:
+            reason = f"no output for {idle_timeout:.0f}s"
+        if reason:
+            break
+
+    reap_process_group(process)
+    return (None if reason else process.returncode), reason, peak
+
+
+def run_blender_script(script_path, asset_id, section, phase='generate', timeouts=None,
+                       idle_timeout=IDLE_TIMEOUT, retries=MAX_RETRIES, backoff=RETRY_BACKOFF,
+                       threads=None, prefix='', stages=None):
+    """Run Blender script in headless mode with timeouts, retries and process-group cleanup
+
+    threads caps Blender's render/bake threads (-t). With stages, the
+    generator's stage timings ({stage: seconds}) are collected into it.
+    Returns (success, peak memory in bytes across attempts, attempts made).
+    """
     cmd = [
         "blender",
         "-b",  # Background mode
+        *(["-t", str(threads)] if threads else []),  # Render/bake thread cap
         "-P", str(script_path),  # Python script
         "--",  # Separator for script args
         "--id", asset_id,
         "--section", section
     ]
+    timeout = (timeouts or PHASE_TIMEOUTS)[phase]
+    peak = 0
+
+    def collect(line):
+        """Add a stage timing line the generator printed to stages"""
+        timing = build_metrics.parse_stage_line(line)
+        if timing and stages is not None:
+            stages[timing[0]] = stages.get(timing[0], 0) + timing[1]
+
+    for attempt in range(retries + 1):
+        if attempt:
+            delay = backoff * 2 ** (attempt - 1)
+            print(f"⚠ Retrying {asset_id} in {delay:.0f}s (attempt {attempt + 1}/{retries + 1})")
+            time.sleep(delay)
+
+        print(f"\nRunning: {' '.join(cmd)}\n")
+
+        # Only the last attempt's stage timings are kept
+        if stages is not None:
+            stages.clear()
+
+        try:
+            returncode, reason, attempt_peak = supervise(cmd, timeout, idle_timeout, prefix, collect)
+        except FileNotFoundError:
+            print("✗ Error: Blender not found in PATH")
+            print("Please ensure Blender is installed and added to your PATH")
+            print("\nOn macOS:")
+            print("  export PATH=\"$PATH:/Applications/Blender.app/Contents/MacOS\"")
+            print("\nOr specify full path to blender binary")
+            return False, peak, attempt + 1
+
+        peak = max(peak, attempt_peak)
+        if returncode == 0:
+            return True, peak, attempt + 1
+        if reason:
+            print(f"✗ Blender {phase} phase {reason}; process group killed")
+        else:
+            print(f"✗ Blender script failed with exit code {returncode}")
 
-    print(f"\nRunning: {' '.join(cmd)}\n")
+    return False, peak, retries + 1
 
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
 
-        print(result.stdout)
+def run_generation(generator_script, asset_id, section, build_id=None, metrics=None, **supervision):
+    """Run the generator for one asset; returns (success, peak memory)
 
-        if result.stderr:
-            print("Warnings/Errors:", result.stderr)
+    With metrics, the build's record (phase times, retries, peak memory
+    and GLB measurements) is appended to it for build_metrics. Phases
+    hold the whole run as "generate" plus each stage the generator timed
+    with build_metrics.stage_timer.
+    """
+    start = time.monotonic()
+    stages = {}
+    success, peak, attempts = run_blender_script(generator_script, asset_id, section, stages=stages, **supervision)
+    if metrics is not None:
+        metrics.append(build_metrics.asset_record(
+            build_id, asset_id, section, success,
+            {"generate": time.monotonic() - start, **stages}, attempts - 1, peak
+        ))
+    return success, peak
 
-        return True
 
-    except subprocess.CalledProcessError as e:
-        print(f"✗ Blender script failed with exit code {e.returncode}")
-        print(f"stdout: {e.stdout}")
-        print(f"stderr: {e.stderr}")
-        return False
+def generate_asset(asset, generator_script, history=None, **supervision):
+    """Generate a single asset; supervision and metrics options go to run_generation
 
-    except FileNotFoundError:
-        print("✗ Error: Blender not found in PATH")
-        print("Please ensure Blender is installed and added to your PATH")
-        print("\nOn macOS:")
-        print("  export PATH=\"$PATH:/Applications/Blender.app/Contents/MacOS\"")
-        print("\nOr specify full path to blender binary")
-        return False
-
-
-def generate_asset(asset, generator_script):
-    """Generate a single asset"""
+    The run's peak memory is recorded in history for future scheduling.
+    """
     asset_id = asset['id']
     section = asset['section']
     status = asset.get('status', 'planned')
@@ -86,7 +239,9 @@ def generate_asset(asset, generator_script):
         return False
 
     # Run Blender generation script
-    success = run_blender_script(generator_script, asset_id, section)
+    success, peak = run_generation(generator_script, asset_id, section, **supervision)
+    if history is not None:
+        job_resources.record_peak(history, asset_id, peak)
 
     if success:
         asset['status'] = 'complete'
@@ -100,6 +255,55 @@ def generate_asset(asset, generator_script):
     return success
 
 
+def schedule_jobs(assets, run_job, jobs, threads, max_threads, max_memory, history):
+    """Run run_job(asset) for each asset, up to jobs at a time within the CPU and memory budget
+
+    Each job is charged threads and its estimated peak memory. Assets are
+    started in list order, but one that does not fit yet is passed over
+    for a later one that does. Returns {asset id: success}.
+    """
+    pending = list(assets)
+    running = {}
+    results = {}
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        while pending or running:
+            for asset in list(pending):
+                if len(running) >= jobs:
+                    break
+                memory = job_resources.estimate_memory(history, asset['id'])
+                in_use = [(t, m) for _, t, m in running.values()]
+                if not job_resources.fits(in_use, threads, memory, max_threads, max_memory):
+                    continue
+                pending.remove(asset)
+                print(f"[Scheduler] Starting {asset['id']} ({threads} thread(s), "
+                      f"~{job_resources.format_gb(memory)} estimated)")
+                running[pool.submit(run_job, asset)] = (asset, threads, memory)
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                asset, _, _ = running.pop(future)
+                results[asset['id']] = future.result()
+
+    return results
+
+
+def run_farm(farm_dir, config_path, run_job, jobs, wait=0):
+    """Work the shared farm queue with jobs local workers; returns (succeeded, failed)
+
+    wait is how long each worker polls a drained queue for new jobs before exiting.
+    """
+    base = build_farm.worker_name()
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [
+            pool.submit(build_farm.run_worker, farm_dir, config_path, run_job,
+                        base if jobs == 1 else f"{base}#{i}", wait)
+            for i in range(jobs)
+        ]
+        counts = [future.result() for future in futures]
+    return sum(c[0] for c in counts), sum(c[1] for c in counts)
+
+
 def main():
     """Main execution"""
     parser = argparse.ArgumentParser(
@@ -128,9 +332,91 @@ def main():
         action='store_true',
         help='Show what would be generated without actually generating'
     )
+    parser.add_argument(
+        '--timeout',
+        action='append',
+        metavar='PHASE=SECONDS',
+        help=f'Wall-clock limit for a phase (default: {PHASE_TIMEOUTS})'
+    )
+    parser.add_argument(
+        '--idle-timeout',
+        type=float,
+        default=IDLE_TIMEOUT,
+        help=f'Kill a run that prints nothing for this many seconds (default: {IDLE_TIMEOUT})'
+    )
+    parser.add_argument(
+        '--retries',
+        type=int,
+        default=MAX_RETRIES,
+        help=f'Extra attempts after a failed or timed-out run (default: {MAX_RETRIES})'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        help='Maximum Blender jobs running at once (default: 1)'
+    )
+    parser.add_argument(
+        '--cpu-budget',
+        type=int,
+        default=job_resources.cpu_budget(),
+        help='Threads shared by all jobs; each job gets cpu-budget / jobs (default: all CPUs)'
+    )
+    parser.add_argument(
+        '--memory-budget',
+        type=float,
+        help='GB of RAM shared by all jobs (default: 80%% of available memory)'
+    )
+    parser.add_argument(
+        '--farm',
+        metavar='DIR',
+        help='Shared farm directory: queue the selected assets there and work the queue until it drains'
+    )
+    parser.add_argument(
+        '--worker',
+        action='store_true',
+        help='With --farm, only join as a worker (queue nothing; for the other build boxes)'
+    )
+    parser.add_argument(
+        '--wait',
+        type=float,
+        metavar='SECONDS',
+        help='With --farm, keep polling a drained queue this long for new jobs before exiting '
+             f'(default: {build_farm.WORKER_WAIT_SECONDS} with --worker, else 0)'
+    )
+    parser.add_argument(
+        '--registry',
+        metavar='PATH',
+        help=f'Track status in an indexed SQLite registry (e.g. {asset_registry.DEFAULT_REGISTRY}); '
+             'synced from --config before the run (re-imported if the JSON was edited) and exported back after it'
+    )
+    parser.add_argument(
+        '--metrics',
+        default=str(build_metrics.METRICS_PATH),
+        help='Build metrics store each run appends to (default: assets/.cache/build-metrics.jsonl)'
+    )
+    parser.add_argument(
+        '--backoff',
+        type=float,
+        default=RETRY_BACKOFF,
+        help=f'Seconds before the first retry, doubling after (default: {RETRY_BACKOFF})'
+    )
 
     args = parser.parse_args()
 
+    try:
+        timeouts = parse_timeouts(args.timeout)
+    except ValueError as e:
+        print(f"✗ Error: {e}")
+        sys.exit(1)
+
+    if args.worker and not args.farm:
+        parser.error('--worker requires --farm')
+    if args.wait is not None and not args.farm:
+        parser.error('--wait requires --farm')
+    if args.registry and args.farm:
+        parser.error('--registry cannot be combined with --farm (farm results go straight to --config)')
+
     # Resolve paths
     script_dir = Path(__file__).parent.absolute()
     project_root = script_dir.parent.parent
@@ -156,34 +442,86 @@ def main():
     print(f"Config: {config_path}")
     print(f"Generator: {generator_script}")
     print(f"Dry run: {args.dry_run}")
+    if args.farm:
+        print(f"Farm: {args.farm}{' (worker only)' if args.worker else ''}")
     print(f"{'='*70}\n")
 
+    jobs = max(1, args.jobs)
+    wait = args.wait if args.wait is not None else (build_farm.WORKER_WAIT_SECONDS if args.worker else 0)
+    threads = max(1, args.cpu_budget // jobs)
+    supervision = {
+        "timeouts": timeouts,
+        "idle_timeout": args.idle_timeout,
+        "retries": args.retries,
+        "backoff": args.backoff,
+        "threads": threads,
+        "build_id": build_metrics.new_build_id(),
+        "metrics": [],
+    }
+
+    def run_farm_job(asset_id, section):
+        return run_generation(generator_script, asset_id, section, **supervision,
+                              prefix=f"[{asset_id}] " if jobs > 1 else '')[0]
+
+    # Farm workers take their jobs from the shared queue, not the asset list
+    if args.worker:
+        success_count, fail_count = run_farm(args.farm, config_path, run_farm_job, jobs, wait)
+        build_metrics.append_records(supervision['metrics'], args.metrics)
+        print(f"\n✓ Worker finished: {success_count} succeeded, {fail_count} failed")
+        sys.exit(1 if fail_count else 0)
+
     # Load asset list
-    asset_list = load_asset_list(config_path)
-    assets = asset_list.get('assets', [])
+    if args.registry:
+        registry_path = project_root / args.registry
+        conn = asset_registry.connect(registry_path)
+        try:
+            sync = asset_registry.sync_from_json(conn, config_path)
+        except ValueError as e:
+            print(f"✗ Error: {e}")
+            sys.exit(1)
+        if sync == 'seeded':
+            print(f"✓ Seeded registry {registry_path} from {config_path.name}")
+        elif sync == 'resynced':
+            print(f"✓ Re-imported {config_path.name} into the registry (edited since the last export)")
+
+        # Indexed query instead of a scan; only matching rows are loaded
+        total = sum(asset_registry.status_counts(conn).values())
+        assets_to_generate = asset_registry.query(
+            conn, asset_id=args.id, status=None if args.force else 'planned'
+        )
+        conn.close()
 
-    if not assets:
-        print("No assets found in config")
-        return
+        if not total:
+            print("No assets found in registry")
+            return
+
+        print(f"Found {total} asset(s) in registry, {len(assets_to_generate)} selected\n")
+    else:
+        asset_list = load_asset_list(config_path)
+        assets = asset_list.get('assets', [])
 
-    print(f"Found {len(assets)} asset(s) in config\n")
+        if not assets:
+            print("No assets found in config")
+            return
 
-    # Filter assets
-    assets_to_generate = []
+        print(f"Found {len(assets)} asset(s) in config\n")
 
-    for asset in assets:
-        asset_id = asset['id']
-        status = asset.get('status', 'planned')
+        # Filter assets
+        assets_to_generate = []
 
-        # Filter by ID if specified
-        if args.id and asset_id != args.id:
-            continue
+        for asset in assets:
+            asset_id = asset['id']
+            status = asset.get('status', 'planned')
 
-        # Filter by status
-        if args.force or status == 'planned':
-            assets_to_generate.append(asset)
-        else:
-            print(f"⊘ Skipping {asset_id} (status: {status})")
+            # Filter by ID if specified
+            if args.id and asset_id != args.id:
+                continue
+
+            # Filter by status
+            if args.force or status == 'planned':
+                assets_to_generate.append(asset)
+            else:
+                print(f"⊘ Skipping {asset_id} (status: {status})")
 
     if not assets_to_generate:
         print("\nNo assets to generate")
@@ -202,23 +540,76 @@ def main():
     print("Starting generation...")
     print("="*70)
 
-    success_count = 0
-    fail_count = 0
-
-    for asset in assets_to_generate:
-        success = generate_asset(asset, generator_script)
-
-        if success:
-            success_count += 1
-        else:
-            fail_count += 1
+    max_memory = int(args.memory_budget * 1024 ** 3) if args.memory_budget else job_resources.memory_budget()
+    history = job_resources.load_history()
+    print(f"Budget: {jobs} job(s), {threads} thread(s) each, {job_resources.format_gb(max_memory)} memory")
+
+    if args.farm:
+        # Results reach asset-list.json through the queue, once each
+        conn = build_farm.connect(args.farm)
+        build_farm.enqueue(conn, assets_to_generate)
+        conn.close()
+        print(f"[Farm] Queued {len(assets_to_generate)} asset(s) in {args.farm}")
+
+        run_farm(args.farm, config_path, run_farm_job, jobs, wait)
+
+        # Count every node's results, not just this box's
+        conn = build_farm.connect(args.farm)
+        states = build_farm.job_states(conn, [asset['id'] for asset in assets_to_generate])
+        conn.close()
+        success_count = sum(1 for state in states.values() if state == 'complete')
+        fail_count = len(states) - success_count
+    else:
+        def run_job(asset):
+            success = generate_asset(
+                asset, generator_script,
+                history=history,
+                prefix=f"[{asset['id']}] " if jobs > 1 else '',
+                **supervision
+            )
+            if args.registry and asset['status'] in asset_registry.STATUS_TIMESTAMPS:
+                # One-row update as each job finishes; the JSON export happens once at the end
+                conn = asset_registry.connect(registry_path)
+                at = asset[asset_registry.STATUS_TIMESTAMPS[asset['status']]]
+                asset_registry.set_status(conn, asset['id'], asset['status'], at)
+                conn.close()
+            return success
+
+        results = schedule_jobs(assets_to_generate, run_job, jobs, threads, args.cpu_budget, max_memory, history)
+        job_resources.save_history(history)
+
+        success_count = sum(1 for success in results.values() if success)
+        fail_count = len(results) - success_count
+
+    # Per-asset metrics from this box's jobs, for trend dashboards
+    build_metrics.append_records(supervision['metrics'], args.metrics)
+    if supervision['metrics']:
+        print(f"✓ Recorded build metrics for {len(supervision['metrics'])} asset(s): {args.metrics}")
 
     # Update asset list
     if not args.dry_run:
-        asset_list['updated'] = datetime.now().isoformat()
-        save_asset_list(config_path, asset_list)
+        if args.registry:
+            # The site and the build tools keep reading asset-list.json
+            conn = asset_registry.connect(registry_path)
+            try:
+                asset_registry.write_json(conn, config_path, updated=datetime.now().isoformat())
+            except ValueError as e:
+                print(f"✗ Error: {e}")
+                print(f"  This run's results are kept in {registry_path}")
+                sys.exit(1)
+            finally:
+                conn.close()
+        elif not args.farm:
+            asset_list['updated'] = datetime.now().isoformat()
+            save_asset_list(config_path, asset_list)
         print(f"\n✓ Updated asset list: {config_path}")
 
+        # Compile completed assets into the single-request scene manifest
+        try:
+            write_scene_manifest(project_root, config_path)
+        except (FileNotFoundError, ValueError) as e:
+            print(f"✗ Scene manifest not updated: {e}")
+
     # Summary
     print(f"\n{'='*70}")
     print("Generation Summary")
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Asset Budget Checker
+Enforces download-size budgets per asset, per section and for the whole
+scene, with a per-buffer breakdown of where each GLB's bytes go
+Usage: python asset_budgets.py --config assets/meta/asset-list.json
+       python asset_budgets.py --budgets my-budgets.json
+"""
+
+import argparse
+import gzip
+import json
+import sys
+from pathlib import Path
+
+from glb_utils import byte_breakdown
+
+DEFAULT_BUDGETS = {
+    "glb_bytes": 5000000,
+    "category_glb_bytes": {},
+    "section_bytes": None,
+    "scene_bytes": 20000000,
+    "scene_compressed_bytes": 10000000,
+}
+
+OFFENDER_COUNT = 10
+
+
+def load_json(path):
+    """Load a JSON file"""
+    with open(path) as f:
+        return json.load(f)
+
+
+def load_budgets(style=None, budgets_path=None):
+    """Budgets from a budget file, else the style guide, over the spec defaults"""
+    budgets = dict(DEFAULT_BUDGETS)
+    if budgets_path:
+        budgets.update(load_json(budgets_path))
+    elif style:
+        budgets.update(style.get('budgets', {}))
+    budgets.pop('description', None)
+    return budgets
+
+
+def compressed_size(path):
+    """gzip transfer size of a file (what a static host serves)"""
+    return len(gzip.compress(Path(path).read_bytes(), compresslevel=6, mtime=0))
+
+
+def asset_downloads(metadata):
+    """Alternative sets of GLB files a device downloads for an asset, relative to assets/
+
+    The progressive stages and the main file load together; each quality
+    tier other than the main file is a separate alternative.
+    """
+    stages = metadata.get('progressive', {}).get('stages', [])
+    files = [stage['file'] for stage in stages]
+    if metadata['file'] not in files:
+        files.append(metadata['file'])
+    tiers = [[tier['file']] for tier in metadata.get('tiers', []) if tier['file'] != metadata['file']]
+    return [files] + tiers
+
+
+def asset_files(metadata):
+    """Every GLB file the site may download for an asset, relative to assets/"""
+    return list(dict.fromkeys(file for files in asset_downloads(metadata) for file in files))
+
+
+def measure_asset(metadata, assets_dir, compressed=True):
+    """Bytes, compressed bytes and per-buffer breakdown for one asset's GLB files
+
+    Every file is listed in files (for the per-GLB limit), while bytes,
+    compressed and breakdown describe the heaviest download alternative,
+    since a device fetches only one quality tier.
+    compressed=False skips the gzip pass (per-asset limits only use raw bytes).
+    """
+    report = {"id": metadata['id'], "section": metadata.get('section'), "bytes": 0,
+              "compressed": 0, "files": {}, "breakdown": {}}
+
+    measured = {}
+    for file in asset_files(metadata):
+        path = assets_dir / file
+        if not path.exists():
+            raise FileNotFoundError(f"GLB file not found: {path}")
+
+        breakdown = byte_breakdown(path)
+        measured[file] = (breakdown, compressed_size(path) if compressed else 0)
+        report['files'][file] = sum(breakdown.values())
+
+    heaviest = max(asset_downloads(metadata), key=lambda files: sum(report['files'][f] for f in files))
+    report['bytes'] = sum(report['files'][file] for file in heaviest)
+    report['compressed'] = sum(measured[file][1] for file in heaviest)
+    for file in heaviest:
+        for category, value in measured[file][0].items():
+            report['breakdown'][category] = report['breakdown'].get(category, 0) + value
+
+    return report
+
+
+def asset_limit(budgets, category):
+    """Per-GLB limit for a category (the tighter of the category and global limits)"""
+    limits = [budgets.get('glb_bytes'), budgets.get('category_glb_bytes', {}).get(category)]
+    limits = [limit for limit in limits if limit]
+    return min(limits) if limits else None
+
+
+def check_asset_budget(report, budgets, category):
+    """Violations for one measured asset"""
+    limit = asset_limit(budgets, category)
+    if limit is None:
+        return []
+    return [
+        f"{file}: {size:,} bytes exceeds the {limit:,} byte per-GLB budget"
+        for file, size in report['files'].items()
+        if size > limit
+    ]
+
+
+def check_scene_budgets(reports, budgets):
+    """Violations for per-section and whole-scene totals"""
+    violations = []
+
+    section_limit = budgets.get('section_bytes')
+    if section_limit:
+        sections = {}
+        for report in reports:
+            sections[report['section']] = sections.get(report['section'], 0) + report['bytes']
+        for section, size in sections.items():
+            if size > section_limit:
+                violations.append(f"section {section}: {size:,} bytes exceeds the {section_limit:,} byte budget")
+
+    total = sum(r['bytes'] for r in reports)
+    if budgets.get('scene_bytes') and total > budgets['scene_bytes']:
+        violations.append(f"scene: {total:,} bytes exceeds the {budgets['scene_bytes']:,} byte budget")
+
+    compressed = sum(r['compressed'] for r in reports)
+    if budgets.get('scene_compressed_bytes') and compressed > budgets['scene_compressed_bytes']:
+        violations.append(
+            f"scene: {compressed:,} compressed bytes exceeds the {budgets['scene_compressed_bytes']:,} byte budget"
+        )
+
+    return violations
+
+
+def rank_offenders(reports, count=OFFENDER_COUNT):
+    """Biggest (asset, buffer category, bytes) contributors across all reports"""
+    items = [
+        (report['id'], category, size)
+        for report in reports
+        for category, size in report['breakdown'].items()
+        if category != 'other'
+    ]
+    return sorted(items, key=lambda item: -item[2])[:count]
+
+
+def print_report(reports, budgets, violations):
+    """Print the budget table, breakdown and ranked offenders"""
+    print(f"\n{'='*70}")
+    print("Asset Budgets")
+    print(f"{'='*70}")
+    for report in reports:
+        print(f"{report['id']} ({report['section']}): {report['bytes'] / 1024:.1f} KB, "
+              f"{report['compressed'] / 1024:.1f} KB gzip")
+        for category, size in sorted(report['breakdown'].items(), key=lambda item: -item[1]):
+            share = size / report['bytes'] * 100 if report['bytes'] else 0
+            print(f"  {category:<12} {size / 1024:>10.1f} KB  {share:5.1f}%")
+
+    total = sum(r['bytes'] for r in reports)
+    compressed = sum(r['compressed'] for r in reports)
+    print(f"\nScene: {total / 1024:.1f} KB of {budgets['scene_bytes'] / 1024:.0f} KB, "
+          f"{compressed / 1024:.1f} KB gzip of {budgets['scene_compressed_bytes'] / 1024:.0f} KB")
+    print(f"{'='*70}")
+
+    if violations:
+        print("\n✗ Budget violations:")
+        for violation in violations:
+            print(f"  - {violation}")
+        print("\nBiggest offenders:")
+        for rank, (asset_id, category, size) in enumerate(rank_offenders(reports), 1):
+            print(f"  {rank:>2}. {asset_id} {category}: {size / 1024:.1f} KB")
+    else:
+        print("✓ All assets within budget")
+
+
+def main():
+    """Main execution"""
+    parser = argparse.ArgumentParser(
+        description='Check GLB download sizes against per-asset, per-section and scene budgets'
+    )
+    parser.add_argument(
+        '--config',
+        default='assets/meta/asset-list.json',
+        help='Path to asset-list.json'
+    )
+    parser.add_argument(
+        '--budgets',
+        help='Budget JSON file (default: the "budgets" block of style-guide.json)'
+    )
+
+    args = parser.parse_args()
+
+    script_dir = Path(__file__).parent.absolute()
+    project_root = script_dir.parent.parent
+    config_path = project_root / args.config
+    assets_dir = project_root / "assets"
+    meta_dir = assets_dir / "meta"
+
+    if not config_path.exists():
+        print(f"✗ Error: Config file not found: {config_path}")
+        sys.exit(1)
+
+    if args.budgets and not Path(args.budgets).exists():
+        print(f"✗ Error: Budget file not found: {args.budgets}")
+        sys.exit(1)
+
+    style_path = meta_dir / "style-guide.json"
+    style = load_json(style_path) if style_path.exists() else {}
+    try:
+        budgets = load_budgets(style, args.budgets)
+    except ValueError as e:
+        print(f"✗ Error: Invalid budget file {args.budgets}: {e}")
+        sys.exit(1)
+
+    reports = []
+    violations = []
+    for asset in load_json(config_path).get('assets', []):
+        if asset.get('status') != 'complete':
+            continue
+        meta_path = meta_dir / f"{asset['id']}.json"
+        if not meta_path.exists():
+            print(f"⊘ Skipping {asset['id']} (no metadata at {meta_path})")
+            continue
+
+        try:
+            report = measure_asset(load_json(meta_path), assets_dir)
+        except (FileNotFoundError, ValueError) as e:
+            print(f"✗ Error: {e}")
+            sys.exit(1)
+
+        reports.append(report)
+        violations += check_asset_budget(report, budgets, asset.get('category'))
+
+    violations += check_scene_budgets(reports, budgets)
+    print_report(reports, budgets, violations)
+
+    sys.exit(1 if violations else 0)
+
+
+if __name__ == "__main__":
+    main()
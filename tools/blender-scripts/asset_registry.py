@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Asset Registry
+Indexed SQLite store for the asset list: queries by status, section,
+priority and category, per-row status updates, and export back to the
+asset-list.json format the site and build tools read
+
+While a registry is in use it is the single writer of asset-list.json.
+It records a digest of the JSON it last read or wrote, so edits made
+elsewhere (by hand, or by build_farm.commit_results on a farm run) are
+re-imported before the next run, and an export never overwrites them.
+Usage: python asset_registry.py import --config assets/meta/asset-list.json
+       python asset_registry.py query --status planned --category prop
+       python asset_registry.py set-status station-store complete
+       python asset_registry.py export --config assets/meta/asset-list.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+
+DEFAULT_REGISTRY = "assets/.cache/asset-registry.sqlite"
+
+INDEXED_FIELDS = ('status', 'section', 'priority', 'category')
+
+# Timestamp written alongside a status change
+STATUS_TIMESTAMPS = {
+    "complete": "completed_at",
+    "failed": "failed_at",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS assets (
+    id TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    status TEXT,
+    section TEXT,
+    priority TEXT,
+    category TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS assets_status ON assets (status, position);
+CREATE INDEX IF NOT EXISTS assets_section ON assets (section, position);
+CREATE INDEX IF NOT EXISTS assets_priority ON assets (priority, position);
+CREATE INDEX IF NOT EXISTS assets_category ON assets (category, position);
+CREATE TABLE IF NOT EXISTS list_fields (
+    key TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def connect(registry_path):
+    """Open (creating if needed) the registry"""
+    registry_path = Path(registry_path)
+    registry_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(registry_path, timeout=30)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def put_asset(conn, asset, position=None):
+    """Insert or replace one asset row (keeps its list position when it already exists)"""
+    if position is None:
+        row = conn.execute("SELECT position FROM assets WHERE id = ?", (asset['id'],)).fetchone()
+        position = row[0] if row else conn.execute("SELECT COALESCE(MAX(position) + 1, 0) FROM assets").fetchone()[0]
+    conn.execute(
+        "INSERT OR REPLACE INTO assets (id, position, status, section, priority, category, data) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (asset['id'], position, *(asset.get(field) for field in INDEXED_FIELDS), json.dumps(asset))
+    )
+
+
+def import_json(conn, asset_list):
+    """Replace the registry contents with an asset-list.json document"""
+    with conn:
+        conn.execute("DELETE FROM assets")
+        conn.execute("DELETE FROM list_fields")
+        for position, (key, value) in enumerate(asset_list.items()):
+            # The assets entry only records where the list goes; its rows live in assets
+            stored = 'null' if key == 'assets' else json.dumps(value)
+            conn.execute("INSERT INTO list_fields VALUES (?, ?, ?)", (key, position, stored))
+        for position, asset in enumerate(asset_list.get('assets', [])):
+            put_asset(conn, asset, position)
+
+
+def digest(text):
+    """SHA-256 of a JSON document's text"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def export_text(conn):
+    """The registry serialized exactly as write_json writes it"""
+    return json.dumps(export_json(conn), indent=2)
+
+
+def record_sync(conn, json_text):
+    """Remember that asset-list.json holds json_text and matches the registry as it is now"""
+    with conn:
+        conn.executemany("INSERT OR REPLACE INTO sync_state VALUES (?, ?)", [
+            ('json_digest', digest(json_text)),
+            ('registry_digest', digest(export_text(conn))),
+        ])
+
+
+def sync_state(conn):
+    """{json_digest, registry_digest} from the last import or export (empty before the first)"""
+    return dict(conn.execute("SELECT key, value FROM sync_state").fetchall())
+
+
+def import_file(conn, config_path):
+    """Replace the registry contents with asset-list.json and record the sync"""
+    text = Path(config_path).read_text()
+    import_json(conn, json.loads(text))
+    record_sync(conn, text)
+
+
+def sync_from_json(conn, config_path):
+    """Bring the registry up to date with asset-list.json before a run
+
+    Returns 'seeded' (registry was empty), 'resynced' (the JSON was edited
+    since the last export and the registry was not, so it is re-imported)
+    or 'current'. Raises ValueError when both changed, since either side
+    would lose the other's edits.
+    """
+    text = Path(config_path).read_text()
+    if not status_counts(conn):
+        import_file(conn, config_path)
+        return 'seeded'
+
+    state = sync_state(conn)
+    if digest(text) == state.get('json_digest'):
+        return 'current'
+    if digest(export_text(conn)) == state.get('registry_digest'):
+        import_file(conn, config_path)
+        return 'resynced'
+    if json.loads(text) == export_json(conn):
+        record_sync(conn, text)
+        return 'current'
+
+    raise ValueError(
+        f"{Path(config_path).name} and the registry were both changed since the last export; "
+        "run 'asset_registry.py import' to keep the JSON or 'asset_registry.py export --force' to keep the registry"
+    )
+
+
+def query(conn, asset_id=None, **filters):
+    """Assets in list order, filtered by id and any of status/section/priority/category
+
+    A filter value may be a single value or a list of accepted values.
+    """
+    clauses = []
+    params = []
+    if asset_id is not None:
+        clauses.append("id = ?")
+        params.append(asset_id)
+    for field, value in filters.items():
+        if field not in INDEXED_FIELDS:
+            raise ValueError(f"Cannot filter on {field}; indexed fields are {', '.join(INDEXED_FIELDS)}")
+        if value is None:
+            continue
+        values = value if isinstance(value, (list, tuple)) else [value]
+        clauses.append(f"{field} IN ({','.join('?' * len(values))})")
+        params.extend(values)
+
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    rows = conn.execute(f"SELECT data FROM assets{where} ORDER BY position", params).fetchall()
+    return [json.loads(data) for data, in rows]
+
+
+def set_status(conn, asset_id, status, at=None):
+    """Atomically update one asset's status (and its completed_at/failed_at); False if unknown"""
+    at = at or datetime.now().isoformat()
+    timestamp = STATUS_TIMESTAMPS.get(status)
+    with conn:
+        if timestamp:
+            cursor = conn.execute(
+                "UPDATE assets SET status = ?, data = json_set(data, '$.status', ?, ?, ?) WHERE id = ?",
+                (status, status, f"$.{timestamp}", at, asset_id)
+            )
+        else:
+            cursor = conn.execute(
+                "UPDATE assets SET status = ?, data = json_set(data, '$.status', ?) WHERE id = ?",
+                (status, status, asset_id)
+            )
+    return cursor.rowcount == 1
+
+
+def status_counts(conn):
+    """{status: count}"""
+    return dict(conn.execute("SELECT status, COUNT(*) FROM assets GROUP BY status ORDER BY status").fetchall())
+
+
+def export_json(conn, updated=None):
+    """The registry as an asset-list.json document (top-level fields in their original order)"""
+    asset_list = {}
+    for key, value in conn.execute("SELECT key, value FROM list_fields ORDER BY position"):
+        asset_list[key] = query(conn) if key == 'assets' else json.loads(value)
+    if 'assets' not in asset_list:
+        asset_list['assets'] = query(conn)
+    if updated:
+        asset_list['updated'] = updated
+    return asset_list
+
+
+def write_json(conn, config_path, updated=None, force=False):
+    """Export the registry to config_path atomically
+
+    Refuses (ValueError) when config_path was changed since the registry
+    last read or wrote it, unless force is set: those rows are not the
+    registry's to overwrite.
+    """
+    config_path = Path(config_path)
+    recorded = sync_state(conn).get('json_digest')
+    if not force and recorded and config_path.exists() and digest(config_path.read_text()) != recorded:
+        raise ValueError(
+            f"{config_path.name} was changed since the registry last synced with it; "
+            "re-import it or export with --force"
+        )
+
+    if updated:
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO list_fields VALUES (?, "
+                "COALESCE((SELECT position FROM list_fields WHERE key = 'updated'), "
+                "(SELECT COALESCE(MAX(position) + 1, 0) FROM list_fields)), ?)",
+                ('updated', json.dumps(updated))
+            )
+
+    text = export_text(conn)
+    tmp_path = config_path.with_suffix('.tmp')
+    with open(tmp_path, 'w') as f:
+        f.write(text)
+    os.replace(tmp_path, config_path)
+    record_sync(conn, text)
+
+
+def main():
+    """Main execution"""
+    parser = argparse.ArgumentParser(
+        description='Indexed SQLite registry for asset-list.json'
+    )
+    parser.add_argument('--registry', default=DEFAULT_REGISTRY, help=f'Registry path (default: {DEFAULT_REGISTRY})')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    import_parser = subparsers.add_parser('import', help='Load asset-list.json into the registry')
+    import_parser.add_argument('--config', default='assets/meta/asset-list.json', help='Path to asset-list.json')
+
+    export_parser = subparsers.add_parser('export', help='Write the registry back to asset-list.json')
+    export_parser.add_argument('--config', default='assets/meta/asset-list.json', help='Path to asset-list.json')
+    export_parser.add_argument('--force', action='store_true',
+                               help='Overwrite asset-list.json even if it was edited since the last sync')
+
+    query_parser = subparsers.add_parser('query', help='List matching assets')
+    query_parser.add_argument('--id', help='Asset ID')
+    for field in INDEXED_FIELDS:
+        query_parser.add_argument(f'--{field}', help=f'Filter by {field} (comma-separated for several)')
+    query_parser.add_argument('--json', action='store_true', help='Print matching assets as JSON')
+
+    status_parser = subparsers.add_parser('set-status', help='Update one asset status')
+    status_parser.add_argument('id', help='Asset ID')
+    status_parser.add_argument('status', help='New status (e.g. planned, complete, failed)')
+
+    args = parser.parse_args()
+
+    project_root = Path(__file__).parent.parent.parent
+    registry_path = project_root / args.registry
+    conn = connect(registry_path)
+
+    if args.command == 'import':
+        config_path = project_root / args.config
+        if not config_path.exists():
+            print(f"✗ Error: Config file not found: {config_path}")
+            sys.exit(1)
+        import_file(conn, config_path)
+        counts = status_counts(conn)
+        print(f"✓ Imported {sum(counts.values())} asset(s) into {registry_path}: "
+              + ", ".join(f"{count} {status}" for status, count in counts.items()))
+
+    elif args.command == 'export':
+        config_path = project_root / args.config
+        try:
+            write_json(conn, config_path, force=args.force)
+        except ValueError as e:
+            print(f"✗ Error: {e}")
+            sys.exit(1)
+        print(f"✓ Exported {sum(status_counts(conn).values())} asset(s) to {config_path}")
+
+    elif args.command == 'query':
+        filters = {field: getattr(args, field).split(',') if getattr(args, field) else None
+                   for field in INDEXED_FIELDS}
+        assets = query(conn, asset_id=args.id, **filters)
+        if args.json:
+            print(json.dumps(assets, indent=2))
+        else:
+            for asset in assets:
+                print(f"  {asset['id']} ({asset.get('category')}, {asset.get('section')}): "
+                      f"{asset.get('status')}, {asset.get('priority')} priority")
+            print(f"{len(assets)} asset(s)")
+
+    elif args.command == 'set-status':
+        if not set_status(conn, args.id, args.status):
+            print(f"✗ Error: Unknown asset: {args.id}")
+            sys.exit(1)
+        print(f"✓ {args.id}: {args.status}")
+
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -48,11 +48,14 @@ def ensure_uvs(obj):
         print(f"  ✓ UV map exists for {obj.name}")
 
 
-def setup_bake_settings():
-    """Configure bake settings"""
+def setup_bake_settings(threads=None):
+    """Configure bake settings; threads caps Cycles CPU threads (None uses every core)"""
     scene = bpy.context.scene
     scene.render.engine = 'CYCLES'
     scene.cycles.device = 'CPU'  # Change to 'GPU' if available
+    if threads:
+        scene.render.threads_mode = 'FIXED'
+        scene.render.threads = threads
     scene.cycles.samples = 128
     scene.cycles.max_bounces = 3
     scene.cycles.bake_type = 'COMBINED'
@@ -172,7 +175,7 @@ def export_glb(filepath):
         return False
 
 
-def process_blend_file(blend_path, output_dir, bake=True):
+def process_blend_file(blend_path, output_dir, bake=True, threads=None):
     """Process a single blend file"""
     print(f"\n{'='*60}")
     print(f"Processing: {blend_path.name}")
@@ -197,7 +200,7 @@ def process_blend_file(blend_path, output_dir, bake=True):
     # Bake if requested
     if bake:
         print("\n--- Baking Phase ---")
-        setup_bake_settings()
+        setup_bake_settings(threads)
 
         for obj in mesh_objects:
             bake_lighting(obj, resolution=1024)
@@ -238,6 +241,13 @@ def main():
     # Check if --no-bake flag is present
     bake = "--no-bake" not in argv
 
+    # Cycles thread cap (set by the scheduler; Blender's -t does the same globally)
+    threads = None
+    if "--threads" in argv:
+        idx = argv.index("--threads")
+        if idx + 1 < len(argv):
+            threads = int(argv[idx + 1])
+
     # Check if custom output directory is specified
     output_dir = models_dir
     if "--output" in argv:
@@ -254,7 +264,7 @@ def main():
     print(f"{'='*60}")
 
     # Process the file
-    success = process_blend_file(blend_path, output_dir, bake=bake)
+    success = process_blend_file(blend_path, output_dir, bake=bake, threads=threads)
 
     if success:
         print(f"\n{'='*60}")
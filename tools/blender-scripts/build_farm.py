@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Build Farm Queue
+Shared job queue for running asset generation on several build boxes:
+workers claim jobs with renewable leases and results reach asset-list.json
+exactly once. The farm directory must be on a filesystem every worker
+mounts with working POSIX locks (SQLite and flock rely on them).
+Usage: python build_farm.py status --farm /mnt/farm
+       python asset_automation.py --farm /mnt/farm [--worker [--wait 600]]
+"""
+
+import argparse
+import fcntl
+import json
+import os
+import socket
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+LEASE_SECONDS = 120      # A claimed job returns to the queue if its lease is not renewed in time
+HEARTBEAT_SECONDS = 30   # How often a worker renews the lease on its job
+POLL_SECONDS = 5         # Idle workers re-check the queue this often while others are busy
+WORKER_WAIT_SECONDS = 600  # How long a --worker polls a drained queue for jobs before exiting
+MAX_ATTEMPTS = 3         # Claims per job before an expired lease marks it failed
+
+QUEUE_NAME = "queue.sqlite"
+LOCK_NAME = "asset-list.lock"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    asset_id TEXT PRIMARY KEY,
+    section TEXT NOT NULL,
+    state TEXT NOT NULL,           -- queued, running, complete, failed
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_expires REAL,
+    heartbeat REAL,
+    finished_at TEXT,
+    committed INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+
+def worker_name():
+    """Identity recorded on claimed jobs: host and process"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def connect(farm_dir):
+    """Open (creating if needed) the farm queue
+
+    Autocommit mode; writers take BEGIN IMMEDIATE so claims are serialized.
+    Rollback journaling rather than WAL, which needs shared memory that
+    network filesystems do not provide.
+    """
+    farm_dir = Path(farm_dir)
+    farm_dir.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(farm_dir / QUEUE_NAME, timeout=60, isolation_level=None)
+    conn.execute(SCHEMA)
+    return conn
+
+
+@contextmanager
+def transaction(conn):
+    """Write transaction holding the database lock from the start"""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+@contextmanager
+def file_lock(path):
+    """Exclusive flock on path for the duration of the block"""
+    with open(path, 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def enqueue(conn, assets):
+    """Queue assets (dicts with id and section); jobs already running are left alone"""
+    with transaction(conn):
+        for asset in assets:
+            conn.execute(
+                """
+                INSERT INTO jobs (asset_id, section, state) VALUES (?, ?, 'queued')
+                ON CONFLICT(asset_id) DO UPDATE SET
+                    section = excluded.section, state = 'queued', attempts = 0, worker = NULL,
+                    lease_expires = NULL, heartbeat = NULL, finished_at = NULL, committed = 0
+                WHERE jobs.state != 'running'
+                """,
+                (asset['id'], asset['section'])
+            )
+
+
+def claim(conn, worker):
+    """Claim the next queued job, or one whose lease expired; returns (asset_id, section) or None
+
+    A job whose lease has expired MAX_ATTEMPTS times is marked failed
+    instead of being handed out again.
+    """
+    while True:
+        with transaction(conn):
+            now = time.time()
+            row = conn.execute(
+                """
+                SELECT asset_id, section, attempts FROM jobs
+                WHERE state = 'queued' OR (state = 'running' AND lease_expires < ?)
+                ORDER BY rowid LIMIT 1
+                """,
+                (now,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            asset_id, section, attempts = row
+            if attempts >= MAX_ATTEMPTS:
+                conn.execute(
+                    "UPDATE jobs SET state = 'failed', worker = NULL, lease_expires = NULL, finished_at = ? "
+                    "WHERE asset_id = ?",
+                    (datetime.now().isoformat(), asset_id)
+                )
+                print(f"✗ {asset_id}: lease expired {attempts} time(s), marked failed")
+                continue
+
+            conn.execute(
+                "UPDATE jobs SET state = 'running', worker = ?, attempts = attempts + 1, "
+                "lease_expires = ?, heartbeat = ? WHERE asset_id = ?",
+                (worker, now + LEASE_SECONDS, now, asset_id)
+            )
+            return asset_id, section
+
+
+def renew_lease(conn, asset_id, worker):
+    """Extend the lease on a job this worker holds; False if the lease was lost"""
+    now = time.time()
+    with transaction(conn):
+        cursor = conn.execute(
+            "UPDATE jobs SET lease_expires = ?, heartbeat = ? "
+            "WHERE asset_id = ? AND worker = ? AND state = 'running'",
+            (now + LEASE_SECONDS, now, asset_id, worker)
+        )
+    return cursor.rowcount == 1
+
+
+@contextmanager
+def heartbeat(farm_dir, asset_id, worker):
+    """Renew the job lease in the background while the block runs
+
+    Yields an Event that is set if the lease was lost (another worker
+    may then own the job, and this worker's result is discarded).
+    """
+    stop = threading.Event()
+    lost = threading.Event()
+
+    def beat():
+        conn = connect(farm_dir)
+        try:
+            while not stop.wait(HEARTBEAT_SECONDS):
+                try:
+                    renewed = renew_lease(conn, asset_id, worker)
+                except sqlite3.OperationalError as e:
+                    print(f"⚠ [Farm] Lease renewal for {asset_id} failed, retrying: {e}")
+                    continue
+                if not renewed:
+                    lost.set()
+                    return
+        finally:
+            conn.close()
+
+    thread = threading.Thread(target=beat, daemon=True)
+    thread.start()
+    try:
+        yield lost
+    finally:
+        stop.set()
+        thread.join()
+
+
+def complete(conn, asset_id, worker, success):
+    """Record a job's outcome if this worker still holds it; returns whether it was recorded"""
+    with transaction(conn):
+        cursor = conn.execute(
+            "UPDATE jobs SET state = ?, lease_expires = NULL, finished_at = ? "
+            "WHERE asset_id = ? AND worker = ? AND state = 'running'",
+            ('complete' if success else 'failed', datetime.now().isoformat(), asset_id, worker)
+        )
+    return cursor.rowcount == 1
+
+
+def commit_results(conn, farm_dir, config_path):
+    """Apply finished, uncommitted jobs to asset-list.json; returns the asset IDs applied
+
+    Runs under an exclusive lock, so only one worker applies a given job.
+    The written values come from the queue, so re-applying after a crash
+    between the file write and the committed flag writes the same result.
+    This writes the JSON directly, so farm runs cannot use a registry; a
+    registry re-imports these edits on its next run (see asset_registry).
+    """
+    with file_lock(Path(farm_dir) / LOCK_NAME):
+        rows = conn.execute(
+            "SELECT asset_id, state, finished_at FROM jobs "
+            "WHERE state IN ('complete', 'failed') AND committed = 0"
+        ).fetchall()
+        if not rows:
+            return []
+
+        with open(config_path) as f:
+            asset_list = json.load(f)
+        assets = {asset['id']: asset for asset in asset_list.get('assets', [])}
+        for asset_id, state, finished_at in rows:
+            asset = assets.get(asset_id)
+            if asset is None:
+                continue
+            asset['status'] = state
+            asset['completed_at' if state == 'complete' else 'failed_at'] = finished_at
+        asset_list['updated'] = max(finished_at for _, _, finished_at in rows)
+
+        tmp_path = Path(config_path).with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(asset_list, f, indent=2)
+        os.replace(tmp_path, config_path)
+
+        with transaction(conn):
+            conn.executemany("UPDATE jobs SET committed = 1 WHERE asset_id = ?", [(r[0],) for r in rows])
+
+    return [asset_id for asset_id, _, _ in rows]
+
+
+def pending_count(conn):
+    """Jobs not yet finished (queued or running anywhere)"""
+    return conn.execute("SELECT COUNT(*) FROM jobs WHERE state IN ('queued', 'running')").fetchone()[0]
+
+
+def job_states(conn, asset_ids):
+    """State of each given job: {asset_id: state}"""
+    placeholders = ','.join('?' * len(asset_ids))
+    return dict(conn.execute(
+        f"SELECT asset_id, state FROM jobs WHERE asset_id IN ({placeholders})", list(asset_ids)
+    ).fetchall())
+
+
+def run_worker(farm_dir, config_path, run_job, worker=None, wait=0):
+    """Claim and run jobs until the queue is drained; returns (succeeded, failed) counts
+
+    run_job(asset_id, section) -> bool does the work. Workers wait while
+    other workers still hold jobs, so an expired lease is picked up.
+    A drained queue is polled for another wait seconds before the worker
+    exits, so workers can start before anything has been queued.
+    """
+    worker = worker or worker_name()
+    conn = connect(farm_dir)
+    succeeded = failed = 0
+    print(f"[Farm] Worker {worker} on {farm_dir}")
+
+    try:
+        busy_at = time.monotonic()
+        waiting = False
+        while True:
+            job = claim(conn, worker)
+            if job is None:
+                # Check before committing so a job finished meanwhile is still applied
+                drained = pending_count(conn) == 0
+                commit_results(conn, farm_dir, config_path)
+                if not drained:
+                    busy_at = time.monotonic()
+                    waiting = False
+                elif time.monotonic() - busy_at >= wait:
+                    break
+                elif not waiting:
+                    print(f"[Farm] Queue drained; waiting up to {wait:.0f}s for new jobs")
+                    waiting = True
+                time.sleep(POLL_SECONDS)
+                continue
+
+            asset_id, section = job
+            print(f"[Farm] Claimed {asset_id} ({section})")
+            with heartbeat(farm_dir, asset_id, worker) as lost:
+                success = run_job(asset_id, section)
+
+            if lost.is_set() or not complete(conn, asset_id, worker, success):
+                print(f"⚠ [Farm] Lease on {asset_id} was lost; result discarded")
+                continue
+
+            succeeded += success
+            failed += not success
+            busy_at = time.monotonic()
+            waiting = False
+            for committed in commit_results(conn, farm_dir, config_path):
+                print(f"[Farm] ✓ Committed {committed} to {Path(config_path).name}")
+    finally:
+        conn.close()
+
+    return succeeded, failed
+
+
+def print_status(conn):
+    """Print every job's state"""
+    rows = conn.execute(
+        "SELECT asset_id, state, attempts, worker, lease_expires, committed FROM jobs ORDER BY rowid"
+    ).fetchall()
+
+    print(f"\n{'='*70}")
+    print("Build Farm Queue")
+    print(f"{'='*70}")
+    if not rows:
+        print("⊘ Queue is empty")
+    now = time.time()
+    for asset_id, state, attempts, worker, lease_expires, committed in rows:
+        line = f"  {asset_id}: {state} (attempt {attempts})"
+        if state == 'running':
+            line += f" on {worker}, lease {lease_expires - now:+.0f}s"
+        elif state in ('complete', 'failed') and not committed:
+            line += ", not yet committed"
+        print(line)
+    print(f"{'='*70}")
+
+
+def main():
+    """Main execution"""
+    parser = argparse.ArgumentParser(
+        description='Inspect the shared build farm queue (workers run via asset_automation.py --farm)'
+    )
+    parser.add_argument('command', choices=['status'], help='status: show every job')
+    parser.add_argument('--farm', required=True, help='Shared farm directory')
+
+    args = parser.parse_args()
+
+    if not (Path(args.farm) / QUEUE_NAME).exists():
+        print(f"✗ Error: No farm queue in {args.farm}")
+        sys.exit(1)
+
+    conn = connect(args.farm)
+    print_status(conn)
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Build Metrics
+Local time-series store of per-asset build metrics (phase durations, retries,
+peak memory, triangles, vertices and GLB bytes per attribute and texture),
+appended by asset_automation.py on every build and exported as Prometheus
+text or JSON Lines for dashboards and regression checks
+Generators time their stages with stage_timer, which prints one marked
+JSON line per stage for asset_automation.py to collect
+Usage: python build_metrics.py export --format prometheus --output build.prom
+       python build_metrics.py export --format jsonl --asset station-home --last 50
+       python build_metrics.py regressions [--window 10] [--threshold 10]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from glb_utils import byte_breakdown, count_triangles, count_vertices, read_glb_json
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+METRICS_PATH = PROJECT_ROOT / "assets" / ".cache" / "build-metrics.jsonl"
+MODELS_DIR = PROJECT_ROOT / "assets" / "models"
+
+METRIC_PREFIX = "cinematic_asset"
+STAGE_MARKER = "[stage-timing] "  # Prefix of the JSON line a generator prints per timed stage
+
+# Record values compared against their recent history by `regressions`
+TREND_FIELDS = ('glb_bytes', 'texture_bytes', 'triangles', 'vertices', 'peak_memory')
+REGRESSION_WINDOW = 10       # Earlier builds of the same asset the latest is compared with
+REGRESSION_THRESHOLD = 10.0  # Percent growth over the window median that counts as a regression
+
+
+@contextmanager
+def stage_timer(stage):
+    """Time one generator stage and print it as a marked JSON line on stdout"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = round(time.perf_counter() - start, 3)
+        print(STAGE_MARKER + json.dumps({"stage": stage, "seconds": seconds}), flush=True)
+
+
+def parse_stage_line(line):
+    """(stage, seconds) from a stage_timer line, or None for any other output"""
+    if not line.startswith(STAGE_MARKER):
+        return None
+    try:
+        record = json.loads(line[len(STAGE_MARKER):])
+        return record['stage'], float(record['seconds'])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def new_build_id():
+    """Identifier shared by every record of one orchestrator run"""
+    return datetime.now().strftime('%Y%m%dT%H%M%S') + f"-{os.getpid()}"
+
+
+def measure_glb(glb_path):
+    """Triangles, vertices, total bytes, bytes per category (attribute, indices, textures, ...)"""
+    gltf = read_glb_json(glb_path)
+    breakdown = byte_breakdown(glb_path)
+    return {
+        "triangles": count_triangles(gltf),
+        "vertices": count_vertices(gltf),
+        "glb_bytes": sum(breakdown.values()),
+        "texture_bytes": breakdown.get('textures', 0),
+        "bytes": breakdown,
+    }
+
+
+def asset_record(build_id, asset_id, section, success, phases, retries, peak_memory, glb_path=None):
+    """One asset's metrics for one build; GLB measurements only for successful builds"""
+    record = {
+        "build": build_id,
+        "timestamp": datetime.now().isoformat(),
+        "asset": asset_id,
+        "section": section,
+        "success": success,
+        "phases": {phase: round(seconds, 3) for phase, seconds in phases.items()},
+        "retries": retries,
+        "peak_memory": peak_memory or None,
+    }
+
+    glb_path = Path(glb_path) if glb_path else MODELS_DIR / f"{asset_id}.glb"
+    if success and glb_path.is_file():
+        try:
+            record.update(measure_glb(glb_path))
+        except (OSError, ValueError, KeyError) as e:
+            print(f"⚠ [Metrics] Could not measure {glb_path.name}: {e}")
+
+    return record
+
+
+def append_records(records, path=METRICS_PATH):
+    """Append records to the store as JSON Lines (one write, so concurrent builds do not interleave)"""
+    if not records:
+        return
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'a') as f:
+        f.write(''.join(json.dumps(record, sort_keys=True) + '\n' for record in records))
+
+
+def load_records(path=METRICS_PATH, asset_id=None, last=None):
+    """Records in build order, optionally for one asset and only the last builds"""
+    path = Path(path)
+    if not path.exists():
+        return []
+
+    records = []
+    with open(path) as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A build killed mid-write leaves a partial last line
+                print(f"⚠ [Metrics] Skipping unreadable line {line_number} in {path.name}")
+                continue
+            if asset_id is None or record.get('asset') == asset_id:
+                records.append(record)
+
+    if last:
+        builds = set(list(dict.fromkeys(record['build'] for record in records))[-last:])
+        records = [record for record in records if record['build'] in builds]
+    return records
+
+
+def latest_records(records):
+    """Most recent record per asset"""
+    latest = {}
+    for record in records:
+        latest[record['asset']] = record
+    return list(latest.values())
+
+
+def escape_label(value):
+    """Escape a Prometheus label value"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def prometheus_text(records):
+    """Prometheus text exposition of the latest record per asset
+
+    Samples carry no timestamps: the node_exporter textfile collector
+    rejects files that have them, and Prometheus drops old ones. The
+    build time is a gauge of its own instead. The exposition format
+    allows one sample per series, so history stays in the JSON Lines
+    store; scrape this after each build to build up the time series.
+    """
+    metrics = {}
+
+    def add(name, help_text, labels, value):
+        if value is None:
+            return
+        label_text = ','.join(f'{key}="{escape_label(val)}"' for key, val in labels.items())
+        metrics.setdefault(name, (help_text, []))[1].append(f"{name}{{{label_text}}} {value}")
+
+    for record in latest_records(records):
+        labels = {"asset": record['asset'], "section": record.get('section', '')}
+
+        add(f"{METRIC_PREFIX}_build_timestamp_seconds", "Unix time the asset's last build was recorded",
+            labels, round(datetime.fromisoformat(record['timestamp']).timestamp(), 3))
+        add(f"{METRIC_PREFIX}_build_success", "1 if the asset's last build succeeded",
+            labels, int(record['success']))
+        for phase, seconds in record.get('phases', {}).items():
+            add(f"{METRIC_PREFIX}_phase_duration_seconds", "Wall time of a build phase, retries included",
+                {**labels, "phase": phase}, seconds)
+        add(f"{METRIC_PREFIX}_build_retries", "Retries the last build needed",
+            labels, record.get('retries'))
+        add(f"{METRIC_PREFIX}_peak_memory_bytes", "Peak resident memory of the Blender process group",
+            labels, record.get('peak_memory'))
+        add(f"{METRIC_PREFIX}_triangles", "Triangles drawn by the exported GLB",
+            labels, record.get('triangles'))
+        add(f"{METRIC_PREFIX}_vertices", "Vertices uploaded for the exported GLB",
+            labels, record.get('vertices'))
+        add(f"{METRIC_PREFIX}_glb_bytes", "Size of the exported GLB",
+            labels, record.get('glb_bytes'))
+        add(f"{METRIC_PREFIX}_texture_bytes", "Embedded texture bytes in the exported GLB",
+            labels, record.get('texture_bytes'))
+        for category, size in record.get('bytes', {}).items():
+            add(f"{METRIC_PREFIX}_glb_category_bytes",
+                "GLB bytes by category: JSON, indices, each vertex attribute, textures, animation",
+                {**labels, "category": category}, size)
+
+    lines = []
+    for name, (help_text, samples) in metrics.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} gauge")
+        lines.extend(samples)
+    return '\n'.join(lines) + '\n' if lines else ''
+
+
+def find_regressions(records, window=REGRESSION_WINDOW, threshold=REGRESSION_THRESHOLD):
+    """(asset, field, latest, baseline median, growth %) where the latest build grew past threshold
+
+    Only successful builds are compared; build durations are left out
+    because they vary with machine load.
+    """
+    by_asset = {}
+    for record in records:
+        if record.get('success'):
+            by_asset.setdefault(record['asset'], []).append(record)
+
+    regressions = []
+    for asset_id, history in by_asset.items():
+        latest, earlier = history[-1], history[-window - 1:-1]
+        for field in TREND_FIELDS:
+            values = sorted(r[field] for r in earlier if r.get(field))
+            if not values or not latest.get(field):
+                continue
+            baseline = values[len(values) // 2]
+            growth = (latest[field] - baseline) / baseline * 100
+            if growth > threshold:
+                regressions.append((asset_id, field, latest[field], baseline, growth))
+    return regressions
+
+
+def main():
+    """Main execution"""
+    parser = argparse.ArgumentParser(
+        description='Export build metrics and check them for regressions'
+    )
+    parser.add_argument('--metrics', default=str(METRICS_PATH), help='Metrics store (JSON Lines)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    export_parser = subparsers.add_parser('export', help='Export metrics for dashboards')
+    export_parser.add_argument('--format', choices=['prometheus', 'jsonl'], default='prometheus',
+                               help='prometheus: latest build per asset; jsonl: full history')
+    export_parser.add_argument('--output', help='Output file (default: stdout)')
+    export_parser.add_argument('--asset', help='Only this asset ID')
+    export_parser.add_argument('--last', type=int, help='Only the last N builds')
+
+    regression_parser = subparsers.add_parser('regressions', help='Compare each asset\'s latest build with its history')
+    regression_parser.add_argument('--window', type=int, default=REGRESSION_WINDOW,
+                                   help=f'Earlier builds to compare with (default: {REGRESSION_WINDOW})')
+    regression_parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                                   help=f'Percent growth that counts as a regression (default: {REGRESSION_THRESHOLD})')
+
+    args = parser.parse_args()
+
+    if args.command == 'export':
+        records = load_records(args.metrics, asset_id=args.asset, last=args.last)
+        if args.format == 'prometheus':
+            text = prometheus_text(records)
+        else:
+            text = ''.join(json.dumps(record, sort_keys=True) + '\n' for record in records)
+
+        if args.output:
+            # Atomic so a collector never reads a half-written file
+            tmp_path = Path(args.output).with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                f.write(text)
+            os.replace(tmp_path, args.output)
+            print(f"✓ Exported {len(records)} record(s) to {args.output}")
+        else:
+            sys.stdout.write(text)
+
+    elif args.command == 'regressions':
+        records = load_records(args.metrics)
+        if not records:
+            print(f"⊘ No build metrics in {args.metrics}")
+            return
+
+        regressions = find_regressions(records, args.window, args.threshold)
+
+        print(f"\n{'='*70}")
+        print(f"Build Metric Regressions (>{args.threshold:g}% over the median of {args.window} builds)")
+        print(f"{'='*70}")
+        for asset_id, field, latest, baseline, growth in regressions:
+            print(f"✗ {asset_id}: {field} {latest:,} vs {baseline:,} (+{growth:.1f}%)")
+        if not regressions:
+            print(f"✓ No regressions across {len({r['asset'] for r in records})} asset(s)")
+        print(f"{'='*70}")
+
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Scene Manifest Builder
+Compiles metadata for every completed asset into one compact manifest
+so the site can load the whole catalog with a single request
+Usage: python build_scene_manifest.py --config assets/meta/asset-list.json
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+from glb_utils import glb_stats
+from scene_layout import compute_asset_bounds
+
+MANIFEST_VERSION = 1
+MANIFEST_NAME = "scene-manifest.json"
+HASH_LENGTH = 16
+
+
+def load_json(path):
+    """Load a JSON file"""
+    with open(path) as f:
+        return json.load(f)
+
+
+def build_manifest_entry(metadata, assets_dir):
+    """Merge asset metadata with stats read from its GLB"""
+    glb_path = assets_dir / metadata['file']
+    if not glb_path.exists():
+        raise FileNotFoundError(f"GLB file not found: {glb_path}")
+
+    stats = glb_stats(glb_path)
+    content_hash = stats['hash'][:HASH_LENGTH]
+
+    entry = dict(metadata)
+    entry.update({
+        "url": f"{metadata['file']}?v={content_hash}",
+        "hash": content_hash,
+        "bytes": stats['bytes'],
+        "triangles": stats['triangles'],
+        "vertices": stats['vertices'],
+        "bounds": compute_asset_bounds(glb_path),
+    })
+
+    # Each quality tier gets its own content-hashed URL so it can be cached immutably too
+    if 'tiers' in metadata:
+        entry['tiers'] = [build_tier_entry(tier, assets_dir) for tier in metadata['tiers']]
+    return entry
+
+
+def build_tier_entry(tier, assets_dir):
+    """A tier descriptor with the url, hash and bytes of its GLB"""
+    tier_path = assets_dir / tier['file']
+    if not tier_path.exists():
+        raise FileNotFoundError(f"GLB file not found: {tier_path}")
+
+    stats = glb_stats(tier_path)
+    content_hash = stats['hash'][:HASH_LENGTH]
+    return {
+        **tier,
+        "url": f"{tier['file']}?v={content_hash}",
+        "hash": content_hash,
+        "bytes": stats['bytes'],
+    }
+
+
+def build_manifest(asset_list, meta_dir, assets_dir):
+    """Build the manifest dict for every completed asset, in generation order"""
+    assets = asset_list.get('assets', [])
+    order = asset_list.get('generation_order', [])
+    rank = {asset_id: i for i, asset_id in enumerate(order)}
+    completed = sorted(
+        (a for a in assets if a.get('status') == 'complete'),
+        key=lambda a: rank.get(a['id'], len(rank))
+    )
+
+    entries = []
+    for asset in completed:
+        meta_path = meta_dir / f"{asset['id']}.json"
+        if not meta_path.exists():
+            print(f"⊘ Skipping {asset['id']} (no metadata at {meta_path})")
+            continue
+
+        metadata = load_json(meta_path)
+        entries.append(build_manifest_entry(metadata, assets_dir))
+
+    hashes = [h for e in entries for h in [e['hash'], *(tier['hash'] for tier in e.get('tiers', []))]]
+    catalog = hashlib.sha256(''.join(hashes).encode()).hexdigest()
+
+    return {
+        "version": MANIFEST_VERSION,
+        "catalogHash": catalog[:HASH_LENGTH],
+        "totalBytes": sum(e['bytes'] for e in entries),
+        "sections": asset_list.get('sections', []),
+        "assets": entries,
+    }
+
+
+def write_manifest(manifest, manifest_path):
+    """Write the manifest as compact JSON"""
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f, separators=(',', ':'))
+
+
+def write_scene_manifest(project_root, config_path=None):
+    """Build and write the scene manifest for a project; returns the manifest path"""
+    assets_dir = project_root / "assets"
+    meta_dir = assets_dir / "meta"
+    config_path = config_path or meta_dir / "asset-list.json"
+
+    manifest = build_manifest(load_json(config_path), meta_dir, assets_dir)
+    manifest_path = meta_dir / MANIFEST_NAME
+    write_manifest(manifest, manifest_path)
+
+    print(f"✓ Scene manifest: {manifest_path} "
+          f"({len(manifest['assets'])} asset(s), {manifest['totalBytes'] / 1024:.1f} KB of GLB)")
+    return manifest_path
+
+
+def main():
+    """Main execution"""
+    parser = argparse.ArgumentParser(
+        description='Compile completed asset metadata into a single scene manifest'
+    )
+    parser.add_argument(
+        '--config',
+        default='assets/meta/asset-list.json',
+        help='Path to asset-list.json'
+    )
+
+    args = parser.parse_args()
+
+    script_dir = Path(__file__).parent.absolute()
+    project_root = script_dir.parent.parent
+    config_path = project_root / args.config
+
+    if not config_path.exists():
+        print(f"✗ Error: Config file not found: {config_path}")
+        sys.exit(1)
+
+    try:
+        write_scene_manifest(project_root, config_path)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"✗ Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
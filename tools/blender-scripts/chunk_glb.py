@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+GLB Spatial Chunker
+Splits each mesh into spatially coherent chunks with their own tight
+bounds so three.js can frustum-cull the parts of a station off screen
+Usage: python chunk_glb.py assets/models/station-home.glb [--chunk-size 6] [--max-draw-calls 32] [--draw-call-cost 4096]
+"""
+
+import argparse
+import heapq
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from glb_utils import MODE_TRIANGLES, accessor_bytes, read_glb, write_glb
+from simplify_glb import accessor_array, add_geometry, compact_accessors
+
+DEFAULT_CHUNK_SIZE = 6.0        # Never split chunks whose longest side is at most this (metres)
+DEFAULT_MIN_TRIANGLES = 512     # Never create chunks smaller than this
+DEFAULT_MAX_DRAW_CALLS = 32     # Draw-call budget for the whole GLB, chunked or not
+DEFAULT_DRAW_CALL_COST = 4096   # Triangles' worth of GPU work one extra draw call costs
+
+
+class MeshTriangles:
+    """Per-triangle bounds, centroid and source primitive for one mesh"""
+
+    def __init__(self, gltf, bin_chunk, primitives):
+        self.primitives = primitives
+        self.arrays = []
+        centroids, lo, hi, owners = [], [], [], []
+        for primitive_index, primitive in enumerate(primitives):
+            attributes = {name: accessor_array(gltf, bin_chunk, index)
+                          for name, index in primitive['attributes'].items()}
+            triangles = accessor_array(gltf, bin_chunk, primitive['indices']).astype(np.int64).reshape(-1, 3)
+            self.arrays.append((attributes, triangles))
+            corners = attributes['POSITION'][triangles]
+            centroids.append(corners.mean(axis=1))
+            lo.append(corners.min(axis=1))
+            hi.append(corners.max(axis=1))
+            owners.append(np.stack([np.full(len(triangles), primitive_index), np.arange(len(triangles))], axis=1))
+
+        self.centroids = np.concatenate(centroids)
+        self.lo = np.concatenate(lo)
+        self.hi = np.concatenate(hi)
+        self.owners = np.concatenate(owners)
+
+
+class Chunk:
+    """A set of triangles (as indices into the mesh-wide triangle table)"""
+
+    def __init__(self, mesh, triangles, geometry):
+        self.mesh = mesh
+        self.triangles = triangles
+        self.extent = geometry.hi[triangles].max(axis=0) - geometry.lo[triangles].min(axis=0)
+        self.area = 2 * (self.extent[0] * self.extent[1] + self.extent[1] * self.extent[2]
+                         + self.extent[2] * self.extent[0])
+        # One draw call per source primitive the chunk has triangles from
+        self.draw_calls = len(np.unique(geometry.owners[triangles, 0]))
+
+    def split_saving(self, left, right, draw_call_cost):
+        """Triangles a split lets the frustum cull, less its extra draw calls in triangles
+
+        Given this chunk is on screen, each half is taken to be on screen
+        with probability proportional to its bounds' surface area (as in a
+        BVH's surface area heuristic). The extra draw calls are charged in
+        full, since both halves are usually visible together.
+        """
+        if not self.area:
+            return -np.inf
+        drawn = (left.area * len(left.triangles) + right.area * len(right.triangles)) / self.area
+        extra = left.draw_calls + right.draw_calls - self.draw_calls
+        return len(self.triangles) - drawn - extra * draw_call_cost
+
+    def split(self, geometry):
+        """Median split along the longest axis; returns two chunks"""
+        axis = int(np.argmax(self.extent))
+        order = self.triangles[np.argsort(geometry.centroids[self.triangles, axis], kind='stable')]
+        half = len(order) // 2
+        return (Chunk(self.mesh, order[:half], geometry),
+                Chunk(self.mesh, order[half:], geometry))
+
+
+def plan_chunks(geometries, chunk_size, min_triangles, max_draw_calls, draw_call_cost, draw_calls):
+    """Split chunks across all meshes, best saving first; returns the chunk list per mesh
+
+    A split is taken only while the off-screen geometry it lets the
+    renderer cull outweighs its extra draw calls (see Chunk.split_saving).
+    draw_calls is what the whole GLB draws before any split; a split is
+    skipped when its extra draw calls would exceed max_draw_calls.
+    """
+    leaves = [[] for _ in geometries]
+    heap = []
+    counter = 0
+
+    def consider(chunk):
+        nonlocal counter
+        geometry = geometries[chunk.mesh]
+        if chunk.extent.max() <= chunk_size or len(chunk.triangles) < 2 * min_triangles:
+            leaves[chunk.mesh].append(chunk)
+            return
+        left, right = chunk.split(geometry)
+        saving = chunk.split_saving(left, right, draw_call_cost)
+        if saving <= 0:
+            leaves[chunk.mesh].append(chunk)
+            return
+        heapq.heappush(heap, (-saving, counter, chunk, left, right))
+        counter += 1
+
+    for mesh, geometry in enumerate(geometries):
+        consider(Chunk(mesh, np.arange(len(geometry.centroids)), geometry))
+
+    while heap:
+        _, _, chunk, left, right = heapq.heappop(heap)
+        extra = left.draw_calls + right.draw_calls - chunk.draw_calls
+        if draw_calls + extra > max_draw_calls:
+            leaves[chunk.mesh].append(chunk)
+            continue
+        draw_calls += extra
+        consider(left)
+        consider(right)
+
+    return leaves
+
+
+def chunkable(mesh):
+    """Whether a mesh is indexed triangles without morph targets or skinning"""
+    return all(p.get('mode', MODE_TRIANGLES) == MODE_TRIANGLES and 'indices' in p
+               and not p.get('targets') and 'JOINTS_0' not in p.get('attributes', {})
+               for p in mesh.get('primitives', []))
+
+
+def build_chunk_meshes(gltf, data, geometry, chunks):
+    """One new mesh per chunk, each with a primitive per source primitive it draws from"""
+    # Stable order along the longest axis of the whole mesh
+    centroids = geometry.centroids
+    axis = int(np.argmax(centroids.max(axis=0) - centroids.min(axis=0)))
+    chunks = sorted(chunks, key=lambda c: centroids[c.triangles, axis].mean())
+
+    meshes = []
+    for chunk in chunks:
+        chunk_owners = geometry.owners[chunk.triangles]
+        new_primitives = []
+        for primitive_index, primitive in enumerate(geometry.primitives):
+            selected = np.sort(chunk_owners[chunk_owners[:, 0] == primitive_index, 1])
+            if not len(selected):
+                continue
+            attributes, triangles = geometry.arrays[primitive_index]
+            used, local = np.unique(triangles[selected], return_inverse=True)
+            new_attributes, indices = add_geometry(
+                gltf, data, primitive['attributes'],
+                {name: array[used] for name, array in attributes.items()},
+                local.reshape(-1, 3)
+            )
+            new_primitive = {key: value for key, value in primitive.items() if key not in ('attributes', 'indices')}
+            new_primitive.update({"attributes": new_attributes, "indices": indices})
+            new_primitives.append(new_primitive)
+        meshes.append({"primitives": new_primitives})
+
+    return meshes
+
+
+def chunk_gltf(gltf, bin_chunk, chunk_size=DEFAULT_CHUNK_SIZE, min_triangles=DEFAULT_MIN_TRIANGLES,
+               max_draw_calls=DEFAULT_MAX_DRAW_CALLS, draw_call_cost=DEFAULT_DRAW_CALL_COST):
+    """Replace every chunkable mesh node's mesh with child chunk nodes; returns (bin_chunk, report)
+
+    The draw-call budget is shared by every mesh in the GLB. The original
+    node keeps its name and transform, so the site still finds the asset
+    by name and positions it as before.
+    """
+    data = [accessor_bytes(gltf, bin_chunk, i) for i in range(len(gltf.get('accessors', [])))]
+    nodes = gltf.get('nodes', [])
+    report = []
+
+    mesh_nodes = [node for node in nodes if 'mesh' in node]
+    draw_calls = sum(len(gltf['meshes'][node['mesh']].get('primitives', [])) for node in mesh_nodes)
+    candidates = [node for node in mesh_nodes if chunkable(gltf['meshes'][node['mesh']])]
+    geometries = [MeshTriangles(gltf, bin_chunk, gltf['meshes'][node['mesh']]['primitives']) for node in candidates]
+    plans = plan_chunks(geometries, chunk_size, min_triangles, max_draw_calls, draw_call_cost, draw_calls)
+
+    for node, geometry, chunks in zip(candidates, geometries, plans):
+        if len(chunks) < 2:
+            continue
+        mesh = gltf['meshes'][node['mesh']]
+        chunk_meshes = build_chunk_meshes(gltf, data, geometry, chunks)
+
+        name = node.get('name', 'mesh')
+        children = []
+        for i, chunk in enumerate(chunk_meshes):
+            chunk['name'] = f"{mesh.get('name', name)}_chunk{i}"
+            gltf['meshes'].append(chunk)
+            nodes.append({"name": f"{name}_chunk{i}", "mesh": len(gltf['meshes']) - 1})
+            children.append(len(nodes) - 1)
+
+        del node['mesh']
+        node['children'] = node.get('children', []) + children
+        report.append((name, len(chunk_meshes), sum(len(m['primitives']) for m in chunk_meshes)))
+
+    # Remove meshes no node references any more
+    used = sorted({node['mesh'] for node in nodes if 'mesh' in node})
+    remap = {old: new for new, old in enumerate(used)}
+    gltf['meshes'] = [gltf['meshes'][i] for i in used]
+    for node in nodes:
+        if 'mesh' in node:
+            node['mesh'] = remap[node['mesh']]
+
+    return compact_accessors(gltf, data, bin_chunk), report
+
+
+def chunk_glb(glb_path, output_path=None, **options):
+    """Chunk a GLB file in place (or to output_path); returns the report"""
+    output_path = output_path or glb_path
+    gltf, bin_chunk = read_glb(glb_path)
+    bin_chunk, report = chunk_gltf(gltf, bin_chunk, **options)
+    write_glb(output_path, gltf, bin_chunk)
+    return report
+
+
+def print_report(glb_path, report):
+    """Print chunk and draw-call counts per mesh node"""
+    print(f"[Chunk] {Path(glb_path).name}")
+    if not report:
+        print("  ⊘ Nothing to chunk")
+    for name, chunks, draw_calls in report:
+        print(f"  ✓ {name}: {chunks} chunk(s), {draw_calls} draw call(s)")
+
+
+def main():
+    """Main execution"""
+    parser = argparse.ArgumentParser(
+        description='Split GLB meshes into spatial chunks with tight bounds for frustum culling'
+    )
+    parser.add_argument('glb', help='GLB file to chunk')
+    parser.add_argument('--output', help='Output path (default: rewrite in place)')
+    parser.add_argument('--chunk-size', type=float, default=DEFAULT_CHUNK_SIZE,
+                        help=f'Target longest chunk side in metres (default: {DEFAULT_CHUNK_SIZE})')
+    parser.add_argument('--min-triangles', type=int, default=DEFAULT_MIN_TRIANGLES,
+                        help=f'Smallest chunk worth its own draw calls (default: {DEFAULT_MIN_TRIANGLES})')
+    parser.add_argument('--max-draw-calls', type=int, default=DEFAULT_MAX_DRAW_CALLS,
+                        help=f'Draw-call budget across all meshes and chunks (default: {DEFAULT_MAX_DRAW_CALLS})')
+    parser.add_argument('--draw-call-cost', type=float, default=DEFAULT_DRAW_CALL_COST,
+                        help='Triangles one extra draw call is worth; splits must cull more than this '
+                             f'(default: {DEFAULT_DRAW_CALL_COST})')
+
+    args = parser.parse_args()
+
+    if not Path(args.glb).exists():
+        print(f"✗ Error: GLB file not found: {args.glb}")
+        sys.exit(1)
+
+    try:
+        report = chunk_glb(args.glb, args.output, chunk_size=args.chunk_size,
+                           min_triangles=args.min_triangles, max_draw_calls=args.max_draw_calls,
+                           draw_call_cost=args.draw_call_cost)
+    except ValueError as e:
+        print(f"✗ Error: {e}")
+        sys.exit(1)
+
+    print_report(args.output or args.glb, report)
+
+
+if __name__ == "__main__":
+    main()
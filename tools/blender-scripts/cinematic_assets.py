@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Cinematic Assets CLI
+One entry point for the asset tools. Each subcommand imports only the
+module it runs, so --help and the pure-Python tools start fast; Blender
+subcommands hand over to blender with the matching script
+Usage: tools/cinematic-assets validate assets/meta/station-home.json
+       tools/cinematic-assets generate --id station-home --section home
+       tools/cinematic-assets benchmark
+"""
+
+import os
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(SCRIPT_DIR))
+
+# Subcommands run inside Blender: name -> (script, description)
+BLENDER_COMMANDS = {
+    "generate": ("generate_cinematic_station.py", "Generate a cinematic station GLB (Blender)"),
+    "template": ("generate_asset_template.py", "Generate a parametric template asset (Blender)"),
+    "bake": ("bake_and_export.py", "Bake textures and export a .blend file: bake FILE.blend [--no-bake] (Blender)"),
+    "watch": ("watch_assets.py", "Regenerate assets as the style guide or generators change (Blender)"),
+}
+
+# Pure-Python subcommands: name -> (module whose main() runs, description)
+COMMANDS = {
+    "validate": ("validate_metadata", "Validate asset metadata against the schema, budgets and GLB"),
+    "stats": (None, "Bytes, triangles, vertices and bounds of GLB files"),
+    "plan": ("plan_preload", "Plan the preload schedule and write preload hints"),
+    "budgets": ("asset_budgets", "Check download-size budgets"),
+    "manifest": ("build_scene_manifest", "Build the scene manifest"),
+    "layout": ("scene_layout", "Recompute the scene layout"),
+    "diff": ("glb_diff", "Structural diff of two GLB files"),
+    "optimize": ("optimize_glb", "Drop unused attributes and deduplicate GLB data"),
+    "simplify": ("simplify_glb", "Decimate GLB meshes"),
+    "palette": ("palette_glb", "Collapse flat materials into a palette texture"),
+    "chunk": ("chunk_glb", "Split GLB meshes into frustum-cullable chunks"),
+    "automate": ("asset_automation", "Generate every planned asset in asset-list.json"),
+    "registry": ("asset_registry", "Query and update the SQLite asset registry"),
+    "farm": ("build_farm", "Inspect the shared build farm queue"),
+    "resources": ("job_resources", "Show CPU and memory budgets for Blender jobs"),
+    "metrics": ("build_metrics", "Export build metrics (Prometheus, JSON Lines) and check for regressions"),
+    "reproduce": ("reproducible_build", "Check that builds are byte-identical"),
+    "benchmark": (None, "Time CLI startup against the startup budget"),
+}
+
+STARTUP_BUDGET_MS = 100   # --help must start and finish within this
+BENCHMARK_RUNS = 5        # Best of this many runs is compared with the budget
+
+
+def print_help():
+    """Print the subcommand list"""
+    print("Usage: cinematic-assets <command> [args...]")
+    print("       cinematic-assets <command> --help\n")
+    print("Blender commands:")
+    for name, (_, description) in BLENDER_COMMANDS.items():
+        print(f"  {name:<10} {description}")
+    print("\nCommands:")
+    for name, (_, description) in COMMANDS.items():
+        print(f"  {name:<10} {description}")
+
+
+def run_blender(name, args):
+    """Replace this process with blender running the subcommand's script"""
+    script = os.path.join(SCRIPT_DIR, BLENDER_COMMANDS[name][0])
+    if name == "bake":
+        if not args or args[0].startswith('-'):
+            print("Usage: cinematic-assets bake FILE.blend [--no-bake] [--output DIR] [--threads N]")
+            sys.exit(1)
+        cmd = ["blender", "-b", args[0], "-P", script, "--"] + args[1:]
+    else:
+        cmd = ["blender", "-b", "-P", script, "--"] + args
+
+    try:
+        os.execvp(cmd[0], cmd)
+    except FileNotFoundError:
+        print("✗ Error: Blender not found in PATH")
+        sys.exit(1)
+
+
+def run_module(module_name, name, args):
+    """Run a tool module's main() as if it had been invoked directly"""
+    import importlib
+
+    sys.path.insert(0, SCRIPT_DIR)
+    module = importlib.import_module(module_name)
+    sys.argv = [f"cinematic-assets {name}"] + args
+    module.main()
+
+
+def run_stats(args):
+    """Print stats for each GLB path given"""
+    if not args or args[0] in ('-h', '--help'):
+        print("Usage: cinematic-assets stats FILE.glb [FILE.glb ...]")
+        sys.exit(0 if args else 1)
+
+    sys.path.insert(0, SCRIPT_DIR)
+    from glb_utils import glb_stats
+
+    failed = False
+    for path in args:
+        try:
+            stats = glb_stats(path)
+        except (OSError, ValueError) as e:
+            print(f"✗ {path}: {e}")
+            failed = True
+            continue
+        print(f"{path}: {stats['bytes'] / 1024:.1f} KB, {stats['triangles']:,} triangles, "
+              f"{stats['vertices']:,} vertices")
+        if stats['bounds']:
+            print(f"  bounds {stats['bounds']['min']} → {stats['bounds']['max']}")
+    if failed:
+        sys.exit(1)
+
+
+def time_command(args, runs=BENCHMARK_RUNS):
+    """Best wall time in ms of running this CLI with args"""
+    import subprocess
+    import time
+
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, os.path.abspath(__file__)] + args,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run_benchmark(args):
+    """Time --help against STARTUP_BUDGET_MS (exit 1 if over) and report validate
+
+    validate imports jsonschema, which alone takes longer than the budget,
+    so it is timed for reference only.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog='cinematic-assets benchmark',
+        description=f'Check that --help finishes within {STARTUP_BUDGET_MS} ms and time validate'
+    )
+    parser.add_argument('--metadata', default=os.path.join(PROJECT_ROOT, 'assets', 'meta', 'station-home.json'),
+                        help='Metadata file to validate')
+    parser.add_argument('--runs', type=int, default=BENCHMARK_RUNS, help='Runs per command (best is kept)')
+    parser.add_argument('--budget', type=float, default=STARTUP_BUDGET_MS, help='Budget in ms')
+    args = parser.parse_args(args)
+
+    if not os.path.exists(args.metadata):
+        print(f"✗ Error: File not found: {args.metadata}")
+        sys.exit(1)
+
+    print(f"\n{'='*70}")
+    print(f"Startup Benchmark (best of {args.runs}, budget {args.budget:.0f} ms)")
+    print(f"{'='*70}")
+
+    elapsed = time_command(["--help"], args.runs)
+    within = elapsed <= args.budget
+    print(f"{'✓' if within else '✗'} --help: {elapsed:.0f} ms")
+
+    # Validation failures still count: only the time is measured
+    elapsed = time_command(["validate", args.metadata], args.runs)
+    print(f"⊘ validate: {elapsed:.0f} ms (includes the jsonschema import; not budgeted)")
+
+    print(f"{'='*70}")
+    if not within:
+        sys.exit(1)
+
+
+def main():
+    """Main execution"""
+    if len(sys.argv) < 2 or sys.argv[1] in ('-h', '--help', 'help'):
+        print_help()
+        sys.exit(0 if len(sys.argv) >= 2 else 1)
+
+    name, args = sys.argv[1], sys.argv[2:]
+
+    if name in BLENDER_COMMANDS:
+        run_blender(name, args)
+    elif name == "stats":
+        run_stats(args)
+    elif name == "benchmark":
+        run_benchmark(args)
+    elif name in COMMANDS:
+        run_module(COMMANDS[name][0], name, args)
+    else:
+        print(f"✗ Error: Unknown command: {name}")
+        print_help()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
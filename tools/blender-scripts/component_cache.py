@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Component Cache
+On-disk cache of built station components (bench, light post, sign frame)
+stored as .blend libraries keyed on builder parameters, style guide and
+generator code version
+Usage: imported by generate_cinematic_station.py inside Blender
+
+Entries hold the builder's object with its modifier stack unapplied, not
+the evaluated mesh. Export evaluates each component at a different
+quality: preview, progressive stages and the mobile/high tiers lower the
+subdivision and bevel levels through export_quality, so one evaluated
+mesh could only serve one of them. What the cache saves is the builder
+work: primitive adds, bmesh edits, material setup and joins.
+"""
+
+import bpy
+import hashlib
+import inspect
+import json
+import os
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent.absolute()
+PROJECT_ROOT = SCRIPT_DIR.parent.parent
+CACHE_DIR = PROJECT_ROOT / "assets" / ".cache" / "components"
+
+# Bumped when the cache file layout changes
+CACHE_FORMAT = 1
+
+_enabled = True
+_code_versions = {}
+_stats = {"hits": 0, "misses": 0}
+
+
+def set_enabled(enabled):
+    """Turn the cache on or off for this session"""
+    global _enabled
+    _enabled = enabled
+
+
+def cache_stats():
+    """Hit/miss counters for this session"""
+    return dict(_stats)
+
+
+def code_version(builder):
+    """Hash of the source file that defines a builder; any edit invalidates its entries"""
+    source_file = inspect.getsourcefile(builder)
+    if source_file not in _code_versions:
+        _code_versions[source_file] = hashlib.sha256(Path(source_file).read_bytes()).hexdigest()
+    return _code_versions[source_file]
+
+
+def component_key(builder, style, args):
+    """Cache key for one builder call"""
+    payload = json.dumps({
+        "format": CACHE_FORMAT,
+        "builder": builder.__name__,
+        "code": code_version(builder),
+        "blender": bpy.app.version_string,
+        "args": [list(a) if isinstance(a, tuple) else a for a in args],
+        "style": style,
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:24]
+
+
+def _load(path):
+    """Append the cached component object (with its mesh, modifiers and materials)"""
+    with bpy.data.libraries.load(str(path), link=False) as (data_from, data_to):
+        data_to.objects = list(data_from.objects)
+
+    objects = [obj for obj in data_to.objects if obj is not None]
+    if len(objects) != 1:
+        raise ValueError(f"Expected one object in {path}, found {len(objects)}")
+
+    obj = objects[0]
+    bpy.context.scene.collection.objects.link(obj)
+    bpy.context.view_layer.objects.active = obj
+    return obj
+
+
+def _save(path, obj):
+    """Write the component and everything it references to a .blend library"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp.blend")
+    bpy.data.libraries.write(str(tmp_path), {obj}, compress=True)
+    os.replace(tmp_path, path)
+
+
+def cached_component(builder, style, *args):
+    """Return builder(style, *args), loading it from the on-disk cache when possible
+
+    The cached object keeps its modifier stack and materials exactly as
+    the builder left them, so joins downstream see identical input.
+    """
+    if not _enabled:
+        return builder(style, *args)
+
+    path = CACHE_DIR / f"{builder.__name__}-{component_key(builder, style, args)}.blend"
+
+    if path.exists():
+        try:
+            obj = _load(path)
+            _stats["hits"] += 1
+            return obj
+        except (OSError, ValueError) as e:
+            print(f"[Cache] ✗ Ignoring unreadable {path.name}: {e}")
+
+    obj = builder(style, *args)
+    _stats["misses"] += 1
+
+    try:
+        _save(path, obj)
+    except OSError as e:
+        print(f"[Cache] ✗ Could not write {path.name}: {e}")
+
+    return obj
+
+
+def clear_cache():
+    """Delete every cached component; returns the number of files removed"""
+    if not CACHE_DIR.exists():
+        return 0
+    removed = 0
+    for path in CACHE_DIR.glob("*.blend"):
+        path.unlink()
+        removed += 1
+    return removed
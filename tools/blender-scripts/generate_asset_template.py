@@ -10,7 +10,6 @@ import json
 import sys
 import argparse
 from pathlib import Path
-from datetime import datetime
 from mathutils import Vector
 
 # Get the directory containing this script
@@ -20,6 +19,15 @@ ASSETS_DIR = PROJECT_ROOT / "assets"
 META_DIR = ASSETS_DIR / "meta"
 MODELS_DIR = ASSETS_DIR / "models"
 
+# Blender does not put the script directory on sys.path
+sys.path.insert(0, str(SCRIPT_DIR))
+from scene_layout import update_scene_layout
+from reproducible_build import build_timestamp, canonicalize_glb, write_metadata_json
+from build_metrics import stage_timer
+from optimize_glb import optimize_glb, print_report
+import chunk_glb
+import palette_glb
+
 
 def load_style_guide():
     """Load the style guide JSON"""
@@ -300,7 +308,7 @@ def create_station_asset(asset_id, section, style):
     return final_obj
 
 
-def export_glb(filepath, obj):
+def export_glb(filepath, obj, reproducible=False, chunk=False, palette=False):
     """Export object as GLB without Draco compression (for web compatibility)"""
     # Select only the object
     bpy.ops.object.select_all(action='DESELECT')
@@ -328,43 +336,48 @@ def export_glb(filepath, obj):
 
     print(f"Exported GLB to: {filepath}")
 
+    print_report(filepath, *optimize_glb(filepath))
+
+    if palette:
+        palette_glb.print_report(filepath, palette_glb.palette_glb(filepath))
+
+    if chunk:
+        chunk_glb.print_report(filepath, chunk_glb.chunk_glb(filepath))
+
+    if reproducible:
+        canonicalize_glb(filepath)
+        print("Canonicalized GLB for reproducible output")
+
 
 def calculate_polycount(obj):
-    """Calculate triangle count for object"""
+    """Calculate triangle count for object as exported (modifiers applied, n-gons triangulated)"""
+    depsgraph = bpy.context.evaluated_depsgraph_get()
     polycount = 0
-    if obj.type == 'MESH':
-        polycount += len(obj.data.polygons)
 
-    # Include children
-    for child in obj.children:
-        if child.type == 'MESH':
-            polycount += len(child.data.polygons)
+    for candidate in [obj, *obj.children]:
+        if candidate.type != 'MESH':
+            continue
+        evaluated = candidate.evaluated_get(depsgraph)
+        mesh = evaluated.to_mesh()
+        mesh.calc_loop_triangles()
+        polycount += len(mesh.loop_triangles)
+        evaluated.to_mesh_clear()
 
     return polycount
 
 
-def generate_metadata(asset_id, section, glb_path, obj):
+def generate_metadata(asset_id, section, glb_path, obj, meta_dir=META_DIR, reproducible=False):
     """Generate metadata JSON for the asset"""
     # Calculate stats
     polycount = calculate_polycount(obj)
     filesize = glb_path.stat().st_size if glb_path.exists() else 0
 
-    # Position based on section
-    section_positions = {
-        'home': [0, 0, 0],
-        'store': [30, 0, 0],
-        'gallery': [60, 0, 0],
-        'blog': [90, 0, 0]
-    }
-
-    position = section_positions.get(section, [0, 0, 0])
-
     metadata = {
         "id": asset_id,
         "category": "hero_stop",
         "file": f"models/{glb_path.name}",
         "scale": [1.0, 1.0, 1.0],
-        "position": position,
+        "position": [0, 0, 0],  # Laid out from computed bounds by scene_layout
         "rotation": [0, 0, 0],
         "animation": {
             "type": "idle",
@@ -392,8 +405,8 @@ def generate_metadata(asset_id, section, glb_path, obj):
         },
         "metadata": {
             "author": "Asset Agent",
-            "created": datetime.now().isoformat(),
-            "modified": datetime.now().isoformat(),
+            "created": build_timestamp(reproducible),
+            "modified": build_timestamp(reproducible),
             "version": "1.0.0",
             "polycount": polycount,
             "fileSize": filesize,
@@ -402,16 +415,40 @@ def generate_metadata(asset_id, section, glb_path, obj):
     }
 
     # Write metadata
-    meta_path = META_DIR / f"{asset_id}.json"
+    meta_path = Path(meta_dir) / f"{asset_id}.json"
     meta_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(meta_path, 'w') as f:
-        json.dump(metadata, f, indent=2)
+    write_metadata_json(meta_path, metadata, reproducible=reproducible)
 
     print(f"Generated metadata: {meta_path}")
     return metadata
 
 
+def build_asset(project_root, asset_id, section, style, reproducible=False,
+                models_dir=MODELS_DIR, meta_dir=META_DIR, chunk=False, palette=False):
+    """Build, export and describe one asset; returns (glb_path, metadata)"""
+    # Create asset
+    with stage_timer('model'):
+        asset_obj = create_station_asset(asset_id, section, style)
+
+    # Export GLB
+    glb_path = Path(models_dir) / f"{asset_id}.glb"
+    with stage_timer('export'):
+        export_glb(glb_path, asset_obj, reproducible=reproducible, chunk=chunk, palette=palette)
+
+    # Generate metadata
+    with stage_timer('metadata'):
+        metadata = generate_metadata(asset_id, section, glb_path, asset_obj,
+                                     meta_dir=meta_dir, reproducible=reproducible)
+
+    # Place sections from computed bounds and refresh the spatial index
+    if Path(meta_dir).resolve() == (project_root / "assets" / "meta").resolve():
+        with stage_timer('layout'):
+            update_scene_layout(project_root)
+
+    return glb_path, metadata
+
+
 def main():
     """Main execution"""
     # Parse arguments (after --)
@@ -422,6 +459,13 @@ def main():
     parser.add_argument('--id', required=True, help='Asset ID (e.g., station-home)')
     parser.add_argument('--section', required=True, help='Section name (e.g., home)')
     parser.add_argument('--output-dir', default=str(MODELS_DIR), help='Output directory for GLB')
+    parser.add_argument('--meta-dir', default=str(META_DIR), help='Output directory for metadata')
+    parser.add_argument('--reproducible', action='store_true',
+                        help='Byte-reproducible output: canonical GLB ordering, fixed floats, normalized timestamps')
+    parser.add_argument('--chunk', action='store_true',
+                        help='Split the exported mesh into spatial chunks so off-screen parts are frustum-culled')
+    parser.add_argument('--palette', action='store_true',
+                        help='Collapse flat-colour materials into a palette texture and merge their draw calls')
 
     args = parser.parse_args(argv)
 
@@ -433,15 +477,14 @@ def main():
     # Load style guide
     style = load_style_guide()
 
-    # Create asset
-    asset_obj = create_station_asset(args.id, args.section, style)
-
-    # Export GLB
-    glb_path = Path(args.output_dir) / f"{args.id}.glb"
-    export_glb(glb_path, asset_obj)
-
-    # Generate metadata
-    metadata = generate_metadata(args.id, args.section, glb_path, asset_obj)
+    glb_path, metadata = build_asset(
+        PROJECT_ROOT, args.id, args.section, style,
+        reproducible=args.reproducible,
+        models_dir=args.output_dir,
+        meta_dir=args.meta_dir,
+        chunk=args.chunk,
+        palette=args.palette
+    )
 
     print(f"\n{'='*60}")
     print(f"✓ Asset generated successfully!")
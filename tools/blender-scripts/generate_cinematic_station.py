@@ -3,15 +3,136 @@
 Generate Cinematic Train Station
 Creates high-quality 3D train stations with advanced materials and geometry
 Usage: blender -b -P generate_cinematic_station.py -- --id station-home --section home
+       blender -b -P generate_cinematic_station.py -- --variants home,store,gallery,blog
 """
 
 import bpy
 import json
 import sys
 import argparse
+import time
 from pathlib import Path
 from math import radians, pi
+from contextlib import contextmanager
 import mathutils
+from mathutils.bvhtree import BVHTree
+import numpy as np
+
+# Blender does not put the script directory on sys.path
+sys.path.insert(0, str(Path(__file__).parent.absolute()))
+from scene_layout import update_scene_layout
+from reproducible_build import canonicalize_glb, write_metadata_json
+from build_metrics import stage_timer
+from optimize_glb import optimize_glb, print_report
+from glb_utils import count_triangles, has_vertex_colors, read_glb_json
+from simplify_glb import check_glb, simplify_glb
+import chunk_glb
+import lightmap_glb
+import palette_glb
+import component_cache
+from component_cache import cached_component
+
+# Shared base geometry, kept in an excluded collection and reused across sections
+BASE_COLLECTION = "station_base"
+_station_base = {}
+
+# Materials re-tinted with each section's accent colour
+SECTION_TINTED_MATERIALS = ("sign_led", "light_glass")
+
+# Extra prop builders per section: {section: [callable(style) -> object]}
+SECTION_PROPS = {}
+
+# Progressive packaging: streamed in order, each stage replacing the previous one.
+# The first stage is the coarse payload the site renders while the rest arrive.
+PROGRESSIVE_STAGES = [
+    {
+        "name": "coarse",
+        "suffix": ".coarse",
+        "subdivision_levels": 0,
+        "bevel_segments": 1,
+        "max_texture_size": 256,
+        "tangents": False
+    },
+    {
+        "name": "full",
+        "suffix": "",
+        "subdivision_levels": None,
+        "bevel_segments": None,
+        "max_texture_size": None,
+        "tangents": True
+    }
+]
+
+# Device quality tiers from one build; the loader picks one from device capability.
+# "high" raises subdivision to the render levels, "mobile" is also simplified and
+# gets vertex ambient occlusion instead of spending texture memory on it.
+QUALITY_TIERS = [
+    {
+        "name": "mobile",
+        "suffix": ".mobile",
+        "subdivision_levels": 0,
+        "bevel_segments": 1,
+        "max_texture_size": 512,
+        "use_render_levels": False,
+        "tangents": False,
+        "simplify_ratio": 0.5,
+        "vertex_ao": True
+    },
+    {
+        "name": "desktop",
+        "suffix": "",
+        "subdivision_levels": None,
+        "bevel_segments": None,
+        "max_texture_size": None,
+        "use_render_levels": False,
+        "tangents": True,
+        "simplify_ratio": None,
+        "vertex_ao": False
+    },
+    {
+        "name": "high",
+        "suffix": ".high",
+        "subdivision_levels": None,
+        "bevel_segments": None,
+        "max_texture_size": None,
+        "use_render_levels": True,
+        "tangents": True,
+        "simplify_ratio": None,
+        "vertex_ao": False
+    }
+]
+
+# Layout preview: cheapest modifiers, no tangents, no normal recalculation.
+# Written under assets/.preview so it never replaces a real build.
+PREVIEW_PROFILE = {
+    "subdivision_levels": 0,
+    "bevel_segments": 1,
+    "max_texture_size": 256,
+    "tangents": False,
+    "recalculate_normals": False
+}
+PREVIEW_DIR = Path('assets') / '.preview'
+
+# Fully baked lighting: sun, sky and emissive surfaces baked by Cycles into a lightmap
+# on its own UV set, shipped as the occlusion texture instead of runtime lights.
+# Texels are stored divided by the exposure percentile (recorded as lightMapIntensity).
+BAKED_LIGHTING = {
+    "uv_name": "lightmap",
+    "resolution": 1024,
+    "samples": 128,
+    "margin": 16,
+    "exposure_percentile": 99.5
+}
+
+# Vertex ambient occlusion: cosine-weighted rays per vertex against the subdivided
+# surface, written to a colour attribute that exports as COLOR_0 (no texture memory)
+VERTEX_AO = {
+    "attribute": "ao",
+    "samples": 32,
+    "distance": 1.5,   # Occluders further away than this (metres) are ignored
+    "bias": 0.002,     # Ray start offset along the normal, against self-hits
+    "block": 4096      # Vertices whose ray directions are built at once
+}
 
 def hex_to_rgb(hex_color):
     """Convert hex color to RGB"""
@@ -24,6 +145,14 @@ def clear_scene():
     bpy.ops.object.select_all(action='SELECT')
     bpy.ops.object.delete(use_global=False)
 
+    # Shared base geometry lives in an excluded collection the operators cannot see
+    base = bpy.data.collections.get(BASE_COLLECTION)
+    if base:
+        for obj in list(base.objects):
+            bpy.data.objects.remove(obj, do_unlink=True)
+        bpy.data.collections.remove(base)
+    _station_base.clear()
+
     # Clear materials
     for material in bpy.data.materials:
         bpy.data.materials.remove(material)
@@ -194,8 +323,8 @@ def create_modern_bench(style, position):
     return seat
 
 
-def create_elegant_sign(style, text="HOME"):
-    """Create elegant LED sign with metal frame"""
+def create_elegant_sign(style):
+    """Create elegant LED sign with metal frame (label text is added per section)"""
     # Sign frame
     bpy.ops.mesh.primitive_cube_add(size=2)
     frame = bpy.context.active_object
@@ -272,13 +401,8 @@ def create_modern_light_post(style, position):
     return post
 
 
-def create_cinematic_station(asset_id, section, style):
-    """Assemble complete cinematic train station"""
-    print(f"\n{'='*60}")
-    print(f"Creating CINEMATIC Station: {asset_id}")
-    print(f"Section: {section}")
-    print(f"{'='*60}\n")
-
+def create_station_base(style):
+    """Build the section-independent station geometry; returns component objects, platform first"""
     objects = []
 
     # Platform
@@ -286,37 +410,174 @@ def create_cinematic_station(asset_id, section, style):
     objects.append(platform)
 
     # Benches (2)
-    bench1 = create_modern_bench(style, (-3, -1, 0.05))
-    bench2 = create_modern_bench(style, (3, -1, 0.05))
+    bench1 = cached_component(create_modern_bench, style, (-3, -1, 0.05))
+    bench2 = cached_component(create_modern_bench, style, (3, -1, 0.05))
     objects.append(bench1)
     objects.append(bench2)
 
     # Sign
-    sign = create_elegant_sign(style, section.upper())
+    sign = cached_component(create_elegant_sign, style)
     objects.append(sign)
 
     # Light posts (2)
-    light1 = create_modern_light_post(style, (-5, 2, 0))
-    light2 = create_modern_light_post(style, (5, 2, 0))
+    light1 = cached_component(create_modern_light_post, style, (-5, 2, 0))
+    light2 = cached_component(create_modern_light_post, style, (5, 2, 0))
     objects.append(light1)
     objects.append(light2)
 
-    # Join all into one object
+    # Park the base in an excluded collection so it is never rendered or exported
+    base_collection = bpy.data.collections.new(BASE_COLLECTION)
+    bpy.context.scene.collection.children.link(base_collection)
+    for obj in objects:
+        for collection in list(obj.users_collection):
+            collection.objects.unlink(obj)
+        base_collection.objects.link(obj)
+    bpy.context.view_layer.layer_collection.children[BASE_COLLECTION].exclude = True
+
+    return objects
+
+
+def get_station_base(style):
+    """Shared base geometry for this Blender session, rebuilt only when the style guide changes"""
+    key = json.dumps(style, sort_keys=True)
+    names = _station_base.get(key)
+    if names and all(name in bpy.data.objects for name in names):
+        print("[Variants] ✓ Reusing shared base geometry")
+        return [bpy.data.objects[name] for name in names]
+
+    clear_scene()
+    objects = create_station_base(style)
+    _station_base[key] = [obj.name for obj in objects]
+    stats = component_cache.cache_stats()
+    print(f"[Variants] ✓ Built shared base geometry ({len(objects)} components, "
+          f"cache: {stats['hits']} hit(s), {stats['misses']} miss(es))")
+    return objects
+
+
+def clear_variant_objects():
+    """Remove everything except the shared base, plus data left without users"""
+    base = bpy.data.collections.get(BASE_COLLECTION)
+    base_objects = set(base.objects) if base else set()
+
+    for obj in list(bpy.data.objects):
+        if obj not in base_objects:
+            bpy.data.objects.remove(obj, do_unlink=True)
+
+    for datablocks in (bpy.data.meshes, bpy.data.curves, bpy.data.materials, bpy.data.lights):
+        for block in list(datablocks):
+            if block.users == 0:
+                datablocks.remove(block)
+
+
+def section_accent(style, section):
+    """Accent colour for a section: stations.<section>.accent, else the palette accent"""
+    station = style.get('stations', {}).get(section, {})
+    if 'accent' in station:
+        return hex_to_rgb(station['accent'])
+    if 'color_palette' in style:
+        return hex_to_rgb(style['color_palette']['accent']['hex'])
+    return None
+
+
+def apply_section_materials(objects, section, style):
+    """Swap the emissive sign and lamp materials for section-tinted copies"""
+    color = section_accent(style, section)
+    if color is None:
+        return
+
+    replacements = {}
+    for obj in objects:
+        for slot in obj.material_slots:
+            mat = slot.material
+            if mat is None or not mat.name.startswith(SECTION_TINTED_MATERIALS):
+                continue
+            if mat.name not in replacements:
+                tinted = mat.copy()
+                tinted.name = f"{mat.name.split('.')[0]}_{section}"
+                for node in tinted.node_tree.nodes:
+                    if node.type == 'BSDF_PRINCIPLED':
+                        node.inputs['Base Color'].default_value = (*color, 1.0)
+                    elif node.type == 'EMISSION':
+                        node.inputs['Color'].default_value = (*color, 1.0)
+                replacements[mat.name] = tinted
+            slot.material = replacements[mat.name]
+
+
+def create_sign_text(text, material):
+    """Extruded section label on the street side of the sign frame"""
+    bpy.ops.object.text_add(location=(0, -0.12, 2.5), rotation=(radians(90), 0, 0))
+    label = bpy.context.active_object
+    label.name = "sign_text"
+    label.data.body = text
+    label.data.align_x = 'CENTER'
+    label.data.align_y = 'CENTER'
+    label.data.size = 0.4
+    label.data.extrude = 0.01
+
+    bpy.ops.object.convert(target='MESH')
+    label = bpy.context.active_object
+    label.data.materials.append(material)
+    return label
+
+
+def create_section_props(section, style):
+    """Per-section props layered on the shared base (none defined yet)"""
+    builders = SECTION_PROPS.get(section, [])
+    return [build(style) for build in builders]
+
+
+def derive_section_variant(base_objects, asset_id, section, style):
+    """Copy the shared base and specialise it for one section"""
+    print(f"\n{'='*60}")
+    print(f"Creating CINEMATIC Station: {asset_id}")
+    print(f"Section: {section}")
+    print(f"{'='*60}\n")
+
+    objects = []
+    for base_obj in base_objects:
+        obj = base_obj.copy()
+        obj.data = base_obj.data.copy()
+        bpy.context.scene.collection.objects.link(obj)
+        objects.append(obj)
+
+    apply_section_materials(objects, section, style)
+    objects.extend(create_section_props(section, style))
+
+    # Join all into one object (the platform copy keeps its modifiers)
     bpy.ops.object.select_all(action='DESELECT')
     for obj in objects:
         obj.select_set(True)
-    bpy.context.view_layer.objects.active = platform
+    bpy.context.view_layer.objects.active = objects[0]
     bpy.ops.object.join()
 
     final_obj = bpy.context.active_object
     final_obj.name = asset_id
+    final_obj.data.name = asset_id
 
     # Center origin
     bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY', center='BOUNDS')
 
+    # The label stays a child object so the platform subdivision never rounds its glyphs
+    led_material = next(
+        (slot.material for slot in final_obj.material_slots
+         if slot.material and slot.material.name.startswith('sign_led')),
+        None
+    )
+    if led_material is not None:
+        label = create_sign_text(section.upper(), led_material)
+        label.parent = final_obj
+        label.matrix_parent_inverse = final_obj.matrix_world.inverted()
+
     return final_obj
 
 
+def create_cinematic_station(asset_id, section, style):
+    """Assemble complete cinematic train station"""
+    base_objects = get_station_base(style)
+    clear_variant_objects()
+    return derive_section_variant(base_objects, asset_id, section, style)
+
+
 def setup_hdri_lighting(style):
     """Setup HDRI environment for photorealistic lighting"""
     world = bpy.context.scene.world
@@ -354,22 +615,231 @@ def setup_hdri_lighting(style):
     sun.rotation_euler = (radians(45), radians(30), radians(45))
 
 
-def export_cinematic_glb(filepath, obj):
-    """Export as optimized GLB (no Draco for web compatibility)"""
+def bake_lightmap(obj):
+    """Bake direct and indirect diffuse light on obj into a new lightmap UV set
+
+    Emissive surfaces light their surroundings in Cycles, so the lamp and
+    sign glow is baked too. Returns {"pixels": linear RGB float array,
+    top row first; "scale": exposure; "texcoord": the UV set's index}.
+    """
+    scene = bpy.context.scene
+    mesh = obj.data
+    resolution = BAKED_LIGHTING['resolution']
+    print(f"\n[Bake] Baking {resolution}x{resolution} lightmap for {obj.name}")
+
+    saved = (scene.render.engine, scene.cycles.samples, scene.cycles.device)
+    scene.render.engine = 'CYCLES'
+    scene.cycles.device = 'CPU'
+    scene.cycles.samples = BAKED_LIGHTING['samples']
+
+    # Lightmap UVs: every face gets its own unshared texels
+    if not mesh.uv_layers:
+        mesh.uv_layers.new(name="UVMap")
+    render_uv = mesh.uv_layers.active_index
+    mesh.uv_layers.active = mesh.uv_layers.new(name=BAKED_LIGHTING['uv_name'])
+    texcoord = mesh.uv_layers.active_index
+
     bpy.ops.object.select_all(action='DESELECT')
     obj.select_set(True)
     bpy.context.view_layer.objects.active = obj
+    bpy.ops.object.mode_set(mode='EDIT')
+    bpy.ops.mesh.select_all(action='SELECT')
+    bpy.ops.uv.lightmap_pack(PREF_CONTEXT='ALL_FACES', PREF_PACK_IN_ONE=True, PREF_MARGIN_DIV=0.2)
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+    image = bpy.data.images.new(f"{obj.name}_lightmap", resolution, resolution, alpha=False, float_buffer=True)
+    image.colorspace_settings.name = 'Non-Color'
+
+    # Cycles bakes into the active image node of each material
+    bake_nodes = []
+    for slot in obj.material_slots:
+        if not slot.material or not slot.material.use_nodes:
+            continue
+        nodes = slot.material.node_tree.nodes
+        node = nodes.new(type='ShaderNodeTexImage')
+        node.image = image
+        nodes.active = node
+        bake_nodes.append((nodes, node))
+
+    try:
+        bpy.ops.object.bake(type='DIFFUSE', pass_filter={'DIRECT', 'INDIRECT'},
+                            margin=BAKED_LIGHTING['margin'], use_clear=True)
+        pixels = np.empty(resolution * resolution * 4, dtype=np.float32)
+        image.pixels.foreach_get(pixels)
+    finally:
+        for nodes, node in bake_nodes:
+            nodes.remove(node)
+        bpy.data.images.remove(image)
+        mesh.uv_layers.active_index = render_uv
+        scene.render.engine, scene.cycles.samples, scene.cycles.device = saved
+
+    # Blender stores rows bottom-up; glTF images are top-down
+    pixels = pixels.reshape(resolution, resolution, 4)[::-1, :, :3]
+    scale = max(float(np.percentile(pixels.max(axis=2), BAKED_LIGHTING['exposure_percentile'])), 1e-4)
+    print(f"[Bake] ✓ Lightmap baked on UV set {texcoord} (exposure {scale:.3f})")
+    return {"pixels": pixels, "scale": scale, "texcoord": texcoord}
+
+
+def lightmap_png(lightmap, max_texture_size=None):
+    """(PNG bytes, texcoord) of a baked lightmap, box-filtered down to max_texture_size"""
+    pixels = lightmap['pixels']
+    while max_texture_size and pixels.shape[0] > max_texture_size and pixels.shape[0] % 2 == 0:
+        height, width = pixels.shape[0] // 2, pixels.shape[1] // 2
+        pixels = pixels.reshape(height, 2, width, 2, 3).mean(axis=(1, 3))
+
+    encoded = np.round(np.clip(pixels / lightmap['scale'], 0.0, 1.0) * 255).astype(np.uint8)
+    png = palette_glb.encode_png(encoded.shape[1], encoded.shape[0], encoded.tobytes())
+    return png, lightmap['texcoord']
+
+
+def hemisphere_directions(count):
+    """Cosine-weighted unit directions around +Z on a Fibonacci spiral (deterministic)"""
+    i = np.arange(count) + 0.5
+    radius = np.sqrt(i / count)
+    angle = i * pi * (3 - np.sqrt(5))
+    return np.stack([radius * np.cos(angle), radius * np.sin(angle), np.sqrt(1 - radius ** 2)], axis=1)
+
+
+def bake_vertex_ao(obj):
+    """Write ambient occlusion per vertex of obj into the VERTEX_AO colour attribute
+
+    Rays are cast against the evaluated (subdivided, bevelled) mesh from
+    each cage vertex snapped onto that surface, so the colours the
+    modifiers interpolate at export match the geometry that is drawn.
+    Returns the number of vertices shaded.
+    """
+    start = time.perf_counter()
+    mesh = obj.data
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    bvh = BVHTree.FromObject(obj, depsgraph)
+
+    count = len(mesh.vertices)
+    origins = np.empty(count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', origins)
+    origins = origins.reshape(count, 3)
+    normals = np.empty(count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('normal', normals)
+    normals = normals.reshape(count, 3)
+
+    # Cage vertices sit off the subdivided surface; start from the nearest point on it
+    for index, point in enumerate(origins.tolist()):
+        location, normal, _, _ = bvh.find_nearest(point)
+        if location is not None:
+            origins[index] = location
+            normals[index] = normal
+
+    # Tangent frame per vertex; sample directions are built in blocks to bound memory
+    helper = np.where(np.abs(normals[:, 2:3]) < 0.9, [[0.0, 0.0, 1.0]], [[1.0, 0.0, 0.0]])
+    tangents = np.cross(helper, normals)
+    tangents /= np.maximum(np.linalg.norm(tangents, axis=1, keepdims=True), 1e-9)
+    frames = np.stack([tangents, np.cross(normals, tangents), normals], axis=1)
+    local = hemisphere_directions(VERTEX_AO['samples'])
+    starts = origins + normals * VERTEX_AO['bias']
+
+    # Nearer occluders darken more, fading out at the AO distance
+    distance = VERTEX_AO['distance']
+    occlusion = np.zeros(count)
+    ray_cast = bvh.ray_cast
+    for block in range(0, count, VERTEX_AO['block']):
+        directions = np.einsum('sk,vkj->vsj', local, frames[block:block + VERTEX_AO['block']])
+        for offset, (origin, rays) in enumerate(zip(starts[block:block + len(directions)].tolist(),
+                                                    directions.tolist())):
+            blocked = 0.0
+            for direction in rays:
+                hit = ray_cast(origin, direction, distance)
+                if hit[0] is not None:
+                    blocked += 1.0 - hit[3] / distance
+            occlusion[block + offset] = blocked
+
+    ao = 1.0 - occlusion / VERTEX_AO['samples']
+    colors = np.ones((count, 4), dtype=np.float32)
+    colors[:, :3] = ao[:, None]
+
+    attribute = mesh.color_attributes.get(VERTEX_AO['attribute'])
+    if attribute is None:
+        attribute = mesh.color_attributes.new(VERTEX_AO['attribute'], 'FLOAT_COLOR', 'POINT')
+    attribute.data.foreach_set('color', colors.ravel())
+    mesh.color_attributes.active_color = attribute
+    mesh.color_attributes.render_color_index = mesh.color_attributes.active_color_index
+
+    print(f"[AO] ✓ {count:,} vertices x {VERTEX_AO['samples']} rays in {time.perf_counter() - start:.1f}s "
+          f"(mean {ao.mean():.2f}, min {ao.min():.2f})")
+    return count
+
+
+@contextmanager
+def export_quality(obj, subdivision_levels=None, bevel_segments=None, max_texture_size=None,
+                   use_render_levels=False):
+    """Temporarily change modifier and texture quality on obj for export
+
+    None leaves a setting untouched; use_render_levels exports subdivision
+    at render rather than viewport levels. Everything is restored on exit.
+    """
+    saved_modifiers = []
+    for mod in obj.modifiers:
+        if mod.type == 'SUBSURF' and use_render_levels:
+            saved_modifiers.append((mod, 'levels', mod.levels))
+            mod.levels = mod.render_levels
+        elif mod.type == 'SUBSURF' and subdivision_levels is not None:
+            saved_modifiers.append((mod, 'levels', mod.levels))
+            saved_modifiers.append((mod, 'render_levels', mod.render_levels))
+            mod.levels = min(mod.levels, subdivision_levels)
+            mod.render_levels = min(mod.render_levels, subdivision_levels)
+        elif mod.type == 'BEVEL' and bevel_segments is not None:
+            saved_modifiers.append((mod, 'segments', mod.segments))
+            mod.segments = min(mod.segments, bevel_segments)
+
+    # Swap oversized images for downscaled copies
+    swapped_nodes = []
+    if max_texture_size is not None:
+        for slot in obj.material_slots:
+            if not slot.material or not slot.material.use_nodes:
+                continue
+            for node in slot.material.node_tree.nodes:
+                image = getattr(node, 'image', None)
+                if image is None or max(image.size) <= max_texture_size:
+                    continue
+                factor = max_texture_size / max(image.size)
+                small = image.copy()
+                small.scale(max(1, int(image.size[0] * factor)), max(1, int(image.size[1] * factor)))
+                swapped_nodes.append((node, image, small))
+                node.image = small
+
+    try:
+        yield obj
+    finally:
+        for mod, attr, value in saved_modifiers:
+            setattr(mod, attr, value)
+        for node, image, small in swapped_nodes:
+            node.image = image
+            bpy.data.images.remove(small)
+
+
+def export_cinematic_glb(filepath, obj, tangents=True, reproducible=False, chunk=False, palette=False,
+                         recalculate_normals=True, simplify_ratio=None, lightmap=None, vertex_ao=False):
+    """Export as optimized GLB (no Draco for web compatibility); chunk splits it for frustum culling
+
+    lightmap is (PNG bytes, texcoord) from lightmap_png: it is embedded as
+    the occlusion texture and no punctual lights are exported. vertex_ao
+    exports the colour attribute bake_vertex_ao wrote as COLOR_0.
+    """
+    bpy.ops.object.select_all(action='DESELECT')
+    obj.select_set(True)
+    for child in obj.children_recursive:
+        child.select_set(True)
+    bpy.context.view_layer.objects.active = obj
 
     # CRITICAL: Enable smooth shading before export
     bpy.ops.object.shade_smooth()
     print("[Export] ✓ Applied smooth shading")
 
     # Calculate normals for all meshes
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.mesh.select_all(action='SELECT')
-    bpy.ops.mesh.normals_make_consistent(inside=False)
-    bpy.ops.object.mode_set(mode='OBJECT')
-    print("[Export] ✓ Recalculated normals")
+    if recalculate_normals:
+        bpy.ops.object.mode_set(mode='EDIT')
+        bpy.ops.mesh.select_all(action='SELECT')
+        bpy.ops.mesh.normals_make_consistent(inside=False)
+        bpy.ops.object.mode_set(mode='OBJECT')
+        print("[Export] ✓ Recalculated normals")
 
     Path(filepath).parent.mkdir(parents=True, exist_ok=True)
 
@@ -383,36 +853,127 @@ def export_cinematic_glb(filepath, obj):
         export_yup=True,
         export_force_sampling=False,
         export_cameras=False,
-        export_lights=True,  # Export lights for better rendering
+        export_lights=lightmap is None,  # Baked exports carry their light in the lightmap
         export_materials='EXPORT',
         export_normals=True,  # CRITICAL: Export vertex normals
-        export_tangents=True  # For normal mapping
+        # The active colour attribute (vertex AO) as COLOR_0; exporter 4.2+ ignores export_colors
+        export_vertex_color='ACTIVE' if vertex_ao else 'MATERIAL',
+        export_tangents=tangents  # For normal mapping
     )
 
     print(f"\n✓ Exported cinematic GLB: {filepath}")
+    if vertex_ao and not has_vertex_colors(read_glb_json(filepath)):
+        print("[Export] ⚠ No COLOR_0 in the export; vertex AO is not recorded in the metadata")
+
+    # Before optimizing, which drops UV sets no texture samples
+    if lightmap is not None:
+        lightmap_glb.print_report(filepath, lightmap_glb.lightmap_glb(filepath, *lightmap))
+
+    # Drop tangents/UVs no material samples and compact the buffer
+    print_report(filepath, *optimize_glb(filepath))
+
+    if simplify_ratio is not None:
+        # Ship the full mesh rather than a simplification that does not match its source
+        failures = [(name, message) for ratio in (1.0, simplify_ratio)
+                    for name, passed, message in check_glb(filepath, ratio) if not passed]
+        if failures:
+            for name, message in failures:
+                print(f"[Export] ✗ Simplification check failed for {name}: {message}")
+            print("[Export] ⚠ Kept the unsimplified mesh")
+        else:
+            before, after, _ = simplify_glb(filepath, filepath, simplify_ratio)
+            print(f"[Export] ✓ Simplified {before:,} → {after:,} triangles (checked against the source)")
+
+    if palette:
+        palette_glb.print_report(filepath, palette_glb.palette_glb(filepath))
+
+    if chunk:
+        chunk_glb.print_report(filepath, chunk_glb.chunk_glb(filepath))
+
+    if reproducible:
+        canonicalize_glb(filepath)
+        print("[Export] ✓ Canonicalized for reproducible output")
 
     # Get file size
     file_size = Path(filepath).stat().st_size / 1024
     print(f"  File size: {file_size:.1f} KB")
 
 
-def generate_metadata(asset_id, section, glb_path, style):
-    """Generate asset metadata"""
-    section_positions = {
-        'home': [0, 0, 0],
-        'store': [30, 0, 0],
-        'gallery': [60, 0, 0],
-        'blog': [90, 0, 0]
-    }
+def export_progressive_glbs(glb_path, obj, reproducible=False, chunk=False, palette=False, lightmap=None,
+                            vertex_ao=False):
+    """Export every progressive stage of obj; returns stage descriptors in streaming order"""
+    stages = []
+
+    for stage in PROGRESSIVE_STAGES:
+        stage_path = glb_path.with_name(f"{glb_path.stem}{stage['suffix']}.glb")
+        print(f"\n[Progressive] Exporting '{stage['name']}' stage")
+
+        with export_quality(
+            obj,
+            subdivision_levels=stage['subdivision_levels'],
+            bevel_segments=stage['bevel_segments'],
+            max_texture_size=stage['max_texture_size']
+        ):
+            export_cinematic_glb(stage_path, obj, tangents=stage['tangents'],
+                                 reproducible=reproducible, chunk=chunk, palette=palette,
+                                 lightmap=lightmap and lightmap_png(lightmap, stage['max_texture_size']),
+                                 vertex_ao=vertex_ao)
+
+        stages.append({
+            "name": stage['name'],
+            "file": f"models/{stage_path.name}",
+            "fileSize": stage_path.stat().st_size
+        })
+
+    return stages
+
+
+def export_tier_glbs(glb_path, obj, reproducible=False, chunk=False, palette=False, lightmap=None,
+                     vertex_ao=False):
+    """Export every quality tier of obj; returns tier descriptors from lightest to heaviest
+
+    vertex_ao exports vertex AO in every tier, not just those that ask for it.
+    """
+    tiers = []
+
+    for tier in QUALITY_TIERS:
+        tier_path = glb_path.with_name(f"{glb_path.stem}{tier['suffix']}.glb")
+        print(f"\n[Tiers] Exporting '{tier['name']}' tier")
+
+        with export_quality(
+            obj,
+            subdivision_levels=tier['subdivision_levels'],
+            bevel_segments=tier['bevel_segments'],
+            max_texture_size=tier['max_texture_size'],
+            use_render_levels=tier['use_render_levels']
+        ):
+            export_cinematic_glb(tier_path, obj, tangents=tier['tangents'],
+                                 reproducible=reproducible, chunk=chunk, palette=palette,
+                                 simplify_ratio=tier['simplify_ratio'],
+                                 lightmap=lightmap and lightmap_png(lightmap, tier['max_texture_size']),
+                                 vertex_ao=vertex_ao or tier['vertex_ao'])
+
+        # Vertex AO is only claimed when COLOR_0 actually made it into the file
+        gltf = read_glb_json(tier_path)
+        tiers.append({
+            "name": tier['name'],
+            "file": f"models/{tier_path.name}",
+            "fileSize": tier_path.stat().st_size,
+            "triangles": count_triangles(gltf),
+            "vertexOcclusion": (vertex_ao or tier['vertex_ao']) and has_vertex_colors(gltf)
+        })
+
+    return tiers
 
-    position = section_positions.get(section, [0, 0, 0])
 
+def generate_metadata(asset_id, section, glb_path, style):
+    """Generate asset metadata"""
     metadata = {
         "id": asset_id,
         "category": "cinematic_station",
         "file": f"models/{glb_path.name}",
         "scale": [1.0, 1.0, 1.0],
-        "position": position,
+        "position": [0, 0, 0],  # Laid out from computed bounds by scene_layout
         "rotation": [0, 0, 0],
         "animation": {
             "type": "cinematic_idle",
@@ -443,50 +1004,190 @@ def generate_metadata(asset_id, section, glb_path, style):
     return metadata
 
 
-def main():
-    parser = argparse.ArgumentParser()
-    parser.add_argument('--id', required=True, help='Asset ID')
-    parser.add_argument('--section', required=True, help='Section name')
-
-    # Parse args after --
-    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
-    args = parser.parse_args(argv)
-
-    # Load style guide
-    project_root = Path(__file__).parent.parent.parent
+def load_style_guide(project_root):
+    """Load the style guide JSON"""
     style_path = project_root / 'assets' / 'meta' / 'style-guide.json'
 
     with open(style_path) as f:
-        style = json.load(f)
-
-    # Clear scene
-    clear_scene()
-
-    # Create cinematic station
-    asset_obj = create_cinematic_station(args.id, args.section, style)
-
-    # Setup lighting
-    setup_hdri_lighting(style)
+        return json.load(f)
+
+
+def build_asset(project_root, asset_id, section, style, progressive=False, reproducible=False,
+                models_dir=None, meta_dir=None, chunk=False, palette=False, preview=False, tiers=False,
+                baked=False, vertex_ao=False):
+    """Build, export and describe one station; returns (glb_path, meta_path)
+
+    preview exports with PREVIEW_PROFILE into assets/.preview unless
+    models_dir/meta_dir say otherwise; tiers also exports QUALITY_TIERS;
+    baked bakes the lighting into a lightmap and drops runtime lights;
+    vertex_ao exports vertex ambient occlusion (tiers that ask for it get it anyway).
+    """
+    # Create cinematic station (shared base is reused within a session)
+    with stage_timer('model'):
+        asset_obj = create_cinematic_station(asset_id, section, style)
+
+        # Setup lighting
+        setup_hdri_lighting(style)
+
+    lightmap = None
+    if baked:
+        with stage_timer('bake'):
+            lightmap = bake_lightmap(asset_obj)
+    if vertex_ao or (tiers and any(tier['vertex_ao'] for tier in QUALITY_TIERS)):
+        with stage_timer('vertex_ao'):
+            bake_vertex_ao(asset_obj)
 
     # Export paths
-    glb_path = project_root / 'assets' / 'models' / f'{args.id}.glb'
-    meta_path = project_root / 'assets' / 'meta' / f'{args.id}.json'
+    project_meta_dir = project_root / 'assets' / 'meta'
+    output_root = project_root / PREVIEW_DIR if preview else project_root / 'assets'
+    models_dir = Path(models_dir) if models_dir else output_root / 'models'
+    meta_dir = Path(meta_dir) if meta_dir else output_root / 'meta'
+    meta_dir.mkdir(parents=True, exist_ok=True)
+    glb_path = models_dir / f'{asset_id}.glb'
+    meta_path = meta_dir / f'{asset_id}.json'
 
     # Export GLB
-    export_cinematic_glb(glb_path, asset_obj)
+    with stage_timer('export'):
+        if progressive:
+            stages = export_progressive_glbs(glb_path, asset_obj, reproducible=reproducible, chunk=chunk,
+                                             palette=palette, lightmap=lightmap, vertex_ao=vertex_ao)
+        elif tiers:
+            tier_list = export_tier_glbs(glb_path, asset_obj, reproducible=reproducible, chunk=chunk,
+                                         palette=palette, lightmap=lightmap, vertex_ao=vertex_ao)
+        elif preview:
+            with export_quality(
+                asset_obj,
+                subdivision_levels=PREVIEW_PROFILE['subdivision_levels'],
+                bevel_segments=PREVIEW_PROFILE['bevel_segments'],
+                max_texture_size=PREVIEW_PROFILE['max_texture_size']
+            ):
+                export_cinematic_glb(glb_path, asset_obj, tangents=PREVIEW_PROFILE['tangents'],
+                                     reproducible=reproducible, chunk=chunk, palette=palette,
+                                     recalculate_normals=PREVIEW_PROFILE['recalculate_normals'],
+                                     vertex_ao=vertex_ao)
+        else:
+            export_cinematic_glb(glb_path, asset_obj, reproducible=reproducible, chunk=chunk, palette=palette,
+                                 lightmap=lightmap and lightmap_png(lightmap), vertex_ao=vertex_ao)
 
     # Generate and save metadata
-    metadata = generate_metadata(args.id, args.section, glb_path, style)
-    with open(meta_path, 'w') as f:
-        json.dump(metadata, f, indent=2)
+    with stage_timer('metadata'):
+        metadata = generate_metadata(asset_id, section, glb_path, style)
+        if progressive:
+            metadata['progressive'] = {"stages": stages}
+        elif tiers:
+            metadata['tiers'] = tier_list
+        metadata['lighting'] = {
+            "baked": baked,
+            "vertexOcclusion": vertex_ao and has_vertex_colors(read_glb_json(glb_path))
+        }
+        if baked:
+            # The lightmap texels are stored divided by this; the loader multiplies it back
+            metadata['lighting']['lightMapIntensity'] = round(lightmap['scale'], 4)
+        write_metadata_json(meta_path, metadata, reproducible=reproducible)
 
     print(f"✓ Generated metadata: {meta_path}")
 
+    # Place sections from computed bounds and refresh the spatial index
+    if meta_dir.resolve() == project_meta_dir.resolve():
+        with stage_timer('layout'):
+            update_scene_layout(project_root)
+
+    return glb_path, meta_path
+
+
+def section_asset_id(project_root, section):
+    """Asset ID registered for a section in asset-list.json (station-<section> otherwise)"""
+    list_path = project_root / 'assets' / 'meta' / 'asset-list.json'
+    if list_path.exists():
+        with open(list_path) as f:
+            for asset in json.load(f).get('assets', []):
+                if asset['section'] == section:
+                    return asset['id']
+    return f"station-{section}"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--id', help='Asset ID')
+    parser.add_argument('--section', help='Section name')
+    parser.add_argument('--variants',
+                        help='Comma-separated sections to build from one shared base (e.g. home,store,gallery,blog)')
+    parser.add_argument('--progressive', action='store_true',
+                        help='Also export a coarse first-frame GLB and describe the refinement order')
+    parser.add_argument('--reproducible', action='store_true',
+                        help='Byte-reproducible output: canonical GLB ordering, fixed floats, normalized timestamps '
+                             '(implies --no-component-cache)')
+    parser.add_argument('--tiers', action='store_true',
+                        help='Also export mobile and high quality tiers and list them in the metadata')
+    parser.add_argument('--preview', action='store_true',
+                        help='Fast layout preview: cheap modifiers, no tangents, written to assets/.preview')
+    parser.add_argument('--output-dir', help='Output directory for GLB (default: assets/models)')
+    parser.add_argument('--meta-dir', help='Output directory for metadata (default: assets/meta)')
+    parser.add_argument('--no-component-cache', action='store_true',
+                        help='Rebuild benches, light posts and sign frame instead of loading cached components')
+    parser.add_argument('--clear-component-cache', action='store_true',
+                        help='Delete every cached component before building')
+    parser.add_argument('--chunk', action='store_true',
+                        help='Split the exported mesh into spatial chunks so off-screen parts are frustum-culled')
+    parser.add_argument('--palette', action='store_true',
+                        help='Collapse flat-colour materials into a palette texture and merge their draw calls')
+    parser.add_argument('--baked', action='store_true',
+                        help='Bake sun, sky and emissive light into a lightmap and export without runtime lights')
+    parser.add_argument('--vertex-ao', action='store_true',
+                        help='Ray-trace ambient occlusion per vertex and export it as COLOR_0 (the mobile tier always gets it)')
+
+    # Parse args after --
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    args = parser.parse_args(argv)
+
+    if sum([args.preview, args.progressive, args.tiers]) > 1:
+        parser.error('--preview, --progressive and --tiers cannot be combined')
+    if args.preview and args.baked:
+        parser.error('--baked cannot be combined with --preview (baking is the slowest step)')
+
+    # Reproducible builds always build components fresh, so two builds run the same code path
+    component_cache.set_enabled(not (args.no_component_cache or args.reproducible))
+    if args.clear_component_cache:
+        print(f"[Cache] ✓ Cleared {component_cache.clear_cache()} cached component(s)")
+
+    project_root = Path(__file__).parent.parent.parent
+    style = load_style_guide(project_root)
+
+    if args.variants:
+        builds = [(section_asset_id(project_root, section), section)
+                  for section in args.variants.split(',') if section]
+    elif args.id and args.section:
+        builds = [(args.id, args.section)]
+    else:
+        parser.error('--id and --section are required unless --variants is given')
+
+    outputs = []
+    total_start = time.perf_counter()
+    for asset_id, section in builds:
+        start = time.perf_counter()
+        glb_path, meta_path = build_asset(
+            project_root, asset_id, section, style,
+            progressive=args.progressive,
+            reproducible=args.reproducible,
+            models_dir=args.output_dir,
+            meta_dir=args.meta_dir,
+            chunk=args.chunk,
+            palette=args.palette,
+            preview=args.preview,
+            tiers=args.tiers,
+            baked=args.baked,
+            vertex_ao=args.vertex_ao
+        )
+        outputs.append((glb_path, meta_path, time.perf_counter() - start))
+
     print(f"\n{'='*60}")
     print("✓ CINEMATIC ASSET COMPLETE!")
-    print(f"  GLB: {glb_path}")
-    print(f"  Metadata: {meta_path}")
-    print(f"  Quality: CINEMA-GRADE")
+    for glb_path, meta_path, seconds in outputs:
+        print(f"  GLB: {glb_path} ({seconds:.1f}s)")
+        print(f"  Metadata: {meta_path}")
+    if len(outputs) > 1:
+        print(f"  Total: {time.perf_counter() - total_start:.1f}s for {len(outputs)} variants")
+    print(f"  Quality: {'PREVIEW' if args.preview else 'CINEMA-GRADE'}")
     print(f"{'='*60}\n")
 
 
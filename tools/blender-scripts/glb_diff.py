@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+GLB Diff
+Structural comparison of two GLB files by mesh, primitive, attribute,
+material and texture, read from the JSON chunk only
+Usage: python glb_diff.py old.glb new.glb
+       python glb_diff.py --git HEAD assets/models/station-home.glb --max-growth 10
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from glb_utils import (
+    accessor_byte_length,
+    parse_glb,
+    primitive_triangle_count,
+    primitive_vertex_count,
+    read_glb_json,
+    scene_bounds,
+)
+
+
+def format_bytes(size):
+    """Human-readable signed or unsigned byte count"""
+    sign = '-' if size < 0 else ''
+    size = abs(size)
+    if size >= 1024 * 1024:
+        return f"{sign}{size / (1024 * 1024):.2f} MB"
+    if size >= 1024:
+        return f"{sign}{size / 1024:.1f} KB"
+    return f"{sign}{size} B"
+
+
+def format_delta(delta, formatter=None):
+    """Delta with an explicit sign"""
+    text = formatter(delta) if formatter else f"{delta:,}"
+    return text if delta < 0 else f"+{text}"
+
+
+def unique_name(name, used):
+    """Disambiguate repeated names with a #n suffix"""
+    key = name
+    n = 1
+    while key in used:
+        n += 1
+        key = f"{name}#{n}"
+    used.add(key)
+    return key
+
+
+def summarize_gltf(gltf, file_bytes):
+    """Reduce a glTF document to the sizes and counts the diff compares"""
+    accessors = gltf.get('accessors', [])
+    materials = gltf.get('materials', [])
+    views = gltf.get('bufferViews', [])
+
+    def material_name(index):
+        if index is None:
+            return '(default)'
+        return materials[index].get('name', f"material_{index}")
+
+    meshes = {}
+    attributes = {}
+    used_meshes = set()
+    for mesh_index, mesh in enumerate(gltf.get('meshes', [])):
+        primitives = {}
+        used_primitives = set()
+        for primitive in mesh.get('primitives', []):
+            attribute_bytes = {
+                semantic: accessor_byte_length(accessors[index])
+                for semantic, index in primitive.get('attributes', {}).items()
+            }
+            indices_bytes = accessor_byte_length(accessors[primitive['indices']]) if 'indices' in primitive else 0
+            key = unique_name(material_name(primitive.get('material')), used_primitives)
+            primitives[key] = {
+                "triangles": primitive_triangle_count(gltf, primitive),
+                "vertices": primitive_vertex_count(gltf, primitive),
+                "indices": indices_bytes,
+                "attributes": attribute_bytes,
+            }
+            for semantic, size in attribute_bytes.items():
+                attributes[semantic] = attributes.get(semantic, 0) + size
+            if indices_bytes:
+                attributes['indices'] = attributes.get('indices', 0) + indices_bytes
+        meshes[unique_name(mesh.get('name', f"mesh_{mesh_index}"), used_meshes)] = primitives
+
+    images = {}
+    used_images = set()
+    for image_index, image in enumerate(gltf.get('images', [])):
+        name = image.get('name') or image.get('uri') or f"image_{image_index}"
+        size = views[image['bufferView']]['byteLength'] if 'bufferView' in image else 0
+        images[unique_name(name, used_images)] = {"bytes": size, "mimeType": image.get('mimeType')}
+
+    textures = gltf.get('textures', [])
+    image_names = list(images)
+
+    def texture_slots(material):
+        slots = {}
+        for slot, info in material.get('pbrMetallicRoughness', {}).items():
+            if isinstance(info, dict) and 'index' in info:
+                slots[slot] = info['index']
+        for slot in ('normalTexture', 'occlusionTexture', 'emissiveTexture'):
+            if slot in material:
+                slots[slot] = material[slot]['index']
+        return {
+            slot: image_names[textures[index]['source']] if 'source' in textures[index] else None
+            for slot, index in slots.items()
+        }
+
+    material_summary = {}
+    used_materials = set()
+    for material_index, material in enumerate(materials):
+        material_summary[unique_name(material_name(material_index), used_materials)] = texture_slots(material)
+
+    bounds = scene_bounds(gltf)
+    json_bytes = len(json.dumps(gltf, separators=(',', ':')).encode('utf-8'))
+
+    return {
+        "bytes": file_bytes,
+        "json": json_bytes,
+        "triangles": sum(p['triangles'] for prims in meshes.values() for p in prims.values()),
+        "vertices": sum(p['vertices'] for prims in meshes.values() for p in prims.values()),
+        "attributes": attributes,
+        "meshes": meshes,
+        "materials": material_summary,
+        "images": images,
+        "bounds": {"min": bounds[0], "max": bounds[1]} if bounds else None,
+    }
+
+
+def summarize_glb(glb_path):
+    """Summary of a GLB on disk (JSON chunk only)"""
+    glb_path = Path(glb_path)
+    return summarize_gltf(read_glb_json(glb_path), glb_path.stat().st_size)
+
+
+def summarize_glb_at_revision(revision, glb_path):
+    """Summary of a GLB as committed at a git revision"""
+    glb_path = Path(glb_path).absolute()
+    result = subprocess.run(
+        ["git", "show", f"{revision}:./{glb_path.name}"],
+        cwd=glb_path.parent, capture_output=True, check=True
+    )
+    gltf, _ = parse_glb(result.stdout)
+    return summarize_gltf(gltf, len(result.stdout))
+
+
+def diff_keys(old, new):
+    """(added, removed, common) keys of two dicts, in stable order"""
+    added = [k for k in new if k not in old]
+    removed = [k for k in old if k not in new]
+    common = [k for k in new if k in old]
+    return added, removed, common
+
+
+def diff_summaries(old, new):
+    """List of (section, line) describing what changed between two summaries"""
+    lines = []
+
+    # Byte attribution per attribute semantic, largest change first
+    added, removed, common = diff_keys(old['attributes'], new['attributes'])
+    changes = [(k, new['attributes'][k], f"{k} added") for k in added]
+    changes += [(k, -old['attributes'][k], f"{k} removed") for k in removed]
+    changes += [(k, new['attributes'][k] - old['attributes'][k], k) for k in common]
+    for _, delta, label in sorted(changes, key=lambda c: -abs(c[1])):
+        if delta:
+            lines.append(("attributes", f"{label}: {format_delta(delta, format_bytes)}"))
+
+    json_delta = new['json'] - old['json']
+    if json_delta:
+        lines.append(("attributes", f"JSON chunk: {format_delta(json_delta, format_bytes)}"))
+
+    # Meshes and primitives
+    added, removed, common = diff_keys(old['meshes'], new['meshes'])
+    for name in added:
+        prims = new['meshes'][name].values()
+        lines.append(("meshes", f"{name} added: {sum(p['triangles'] for p in prims):,} triangles"))
+    for name in removed:
+        prims = old['meshes'][name].values()
+        lines.append(("meshes", f"{name} removed: {sum(p['triangles'] for p in prims):,} triangles"))
+    for name in common:
+        old_prims, new_prims = old['meshes'][name], new['meshes'][name]
+        p_added, p_removed, p_common = diff_keys(old_prims, new_prims)
+        for key in p_added:
+            lines.append(("meshes", f"{name}/{key} added: {new_prims[key]['triangles']:,} triangles"))
+        for key in p_removed:
+            lines.append(("meshes", f"{name}/{key} removed: {old_prims[key]['triangles']:,} triangles"))
+        for key in p_common:
+            a, b = old_prims[key], new_prims[key]
+            parts = []
+            for field in ('triangles', 'vertices'):
+                if b[field] != a[field]:
+                    parts.append(f"{field} {format_delta(b[field] - a[field])}")
+            if b['indices'] != a['indices']:
+                parts.append(f"indices {format_delta(b['indices'] - a['indices'], format_bytes)}")
+            s_added, s_removed, s_common = diff_keys(a['attributes'], b['attributes'])
+            parts += [f"{s} added {format_delta(b['attributes'][s], format_bytes)}" for s in s_added]
+            parts += [f"{s} removed {format_delta(-a['attributes'][s], format_bytes)}" for s in s_removed]
+            parts += [
+                f"{s} {format_delta(b['attributes'][s] - a['attributes'][s], format_bytes)}"
+                for s in s_common if b['attributes'][s] != a['attributes'][s]
+            ]
+            if parts:
+                lines.append(("meshes", f"{name}/{key}: {', '.join(parts)}"))
+
+    # Materials and their texture slots
+    added, removed, common = diff_keys(old['materials'], new['materials'])
+    lines += [("materials", f"{name} added") for name in added]
+    lines += [("materials", f"{name} removed") for name in removed]
+    for name in common:
+        a, b = old['materials'][name], new['materials'][name]
+        s_added, s_removed, s_common = diff_keys(a, b)
+        parts = [f"{s} added ({b[s]})" for s in s_added]
+        parts += [f"{s} removed" for s in s_removed]
+        parts += [f"{s} {a[s]} → {b[s]}" for s in s_common if a[s] != b[s]]
+        if parts:
+            lines.append(("materials", f"{name}: {', '.join(parts)}"))
+
+    # Images
+    added, removed, common = diff_keys(old['images'], new['images'])
+    lines += [("textures", f"{name} added: {format_bytes(new['images'][name]['bytes'])}") for name in added]
+    lines += [("textures", f"{name} removed: {format_delta(-old['images'][name]['bytes'], format_bytes)}") for name in removed]
+    for name in common:
+        delta = new['images'][name]['bytes'] - old['images'][name]['bytes']
+        if delta:
+            lines.append(("textures", f"{name}: {format_delta(delta, format_bytes)}"))
+
+    # Bounds
+    if old['bounds'] != new['bounds']:
+        if old['bounds'] is None or new['bounds'] is None:
+            lines.append(("bounds", f"{old['bounds']} → {new['bounds']}"))
+        else:
+            for corner in ('min', 'max'):
+                a, b = old['bounds'][corner], new['bounds'][corner]
+                deltas = [round(b[i] - a[i], 4) for i in range(3)]
+                if any(deltas):
+                    lines.append(("bounds", f"{corner}: {[round(v, 4) for v in a]} → {[round(v, 4) for v in b]} (Δ {deltas})"))
+
+    return lines
+
+
+def growth_percent(old_value, new_value):
+    """Percentage growth; 0 when both are zero"""
+    if old_value == 0:
+        return 0.0 if new_value == 0 else float('inf')
+    return (new_value - old_value) / old_value * 100
+
+
+def check_gates(old, new, max_growth=None, max_triangle_growth=None):
+    """Return the CI gate failures for a pair of summaries"""
+    failures = []
+    if max_growth is not None:
+        growth = growth_percent(old['bytes'], new['bytes'])
+        if growth > max_growth:
+            failures.append(f"file size grew {growth:.1f}% (limit {max_growth}%)")
+    if max_triangle_growth is not None:
+        growth = growth_percent(old['triangles'], new['triangles'])
+        if growth > max_triangle_growth:
+            failures.append(f"triangles grew {growth:.1f}% (limit {max_triangle_growth}%)")
+    return failures
+
+
+def print_diff(old_label, new_label, old, new, lines):
+    """Print a diff report"""
+    print(f"\n{'='*70}")
+    print(f"GLB Diff: {old_label} → {new_label}")
+    print(f"{'='*70}")
+    print(f"Size: {format_bytes(old['bytes'])} → {format_bytes(new['bytes'])} "
+          f"({format_delta(new['bytes'] - old['bytes'], format_bytes)})")
+    print(f"Triangles: {old['triangles']:,} → {new['triangles']:,} "
+          f"({format_delta(new['triangles'] - old['triangles'])})")
+    print(f"Vertices: {old['vertices']:,} → {new['vertices']:,} "
+          f"({format_delta(new['vertices'] - old['vertices'])})")
+
+    if not lines:
+        print("\n⊘ No structural differences")
+    current = None
+    for section, line in lines:
+        if section != current:
+            print(f"\n{section.capitalize()}:")
+            current = section
+        print(f"  {line}")
+    print(f"{'='*70}")
+
+
+def main():
+    """Main execution"""
+    parser = argparse.ArgumentParser(
+        description='Compare two GLB files by mesh, primitive, attribute, material and texture'
+    )
+    parser.add_argument('old', help='Baseline GLB (or the GLB to compare when --git is given)')
+    parser.add_argument('new', nargs='?', help='Changed GLB')
+    parser.add_argument('--git', metavar='REV', help='Compare the working copy of OLD with its version at REV')
+    parser.add_argument('--json', action='store_true', help='Print the diff as JSON')
+    parser.add_argument('--max-growth', type=float, metavar='PERCENT',
+                        help='Fail if the file grows by more than PERCENT')
+    parser.add_argument('--max-triangle-growth', type=float, metavar='PERCENT',
+                        help='Fail if the triangle count grows by more than PERCENT')
+
+    args = parser.parse_args()
+
+    if bool(args.git) == bool(args.new):
+        parser.error("give either OLD and NEW, or --git REV with a single GLB")
+
+    try:
+        if args.git:
+            new_label = args.old
+            old_label = f"{args.git}:{args.old}"
+            old = summarize_glb_at_revision(args.git, args.old)
+            new = summarize_glb(args.old)
+        else:
+            old_label, new_label = args.old, args.new
+            old = summarize_glb(args.old)
+            new = summarize_glb(args.new)
+    except FileNotFoundError as e:
+        print(f"✗ Error: {e}")
+        sys.exit(1)
+    except subprocess.CalledProcessError as e:
+        print(f"✗ Error: git show failed: {e.stderr.decode().strip()}")
+        sys.exit(1)
+    except ValueError as e:
+        print(f"✗ Error: {e}")
+        sys.exit(1)
+
+    lines = diff_summaries(old, new)
+    failures = check_gates(old, new, args.max_growth, args.max_triangle_growth)
+
+    if args.json:
+        print(json.dumps({
+            "old": old_label,
+            "new": new_label,
+            "bytes": [old['bytes'], new['bytes']],
+            "triangles": [old['triangles'], new['triangles']],
+            "vertices": [old['vertices'], new['vertices']],
+            "changes": [{"section": section, "change": line} for section, line in lines],
+            "failures": failures,
+        }, indent=2))
+    else:
+        print_diff(old_label, new_label, old, new, lines)
+        for failure in failures:
+            print(f"✗ {failure}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,521 @@
+#!/usr/bin/env python3
+"""
+GLB Utilities
+Pure-Python helpers for reading binary glTF files without Blender
+Used by the manifest, validation and optimization tools
+"""
+
+import array
+import hashlib
+import json
+import struct
+import sys
+from pathlib import Path
+
+GLB_MAGIC = b'glTF'
+CHUNK_JSON = 0x4E4F534A
+CHUNK_BIN = 0x004E4942
+
+COMPONENT_SIZES = {
+    5120: 1,  # BYTE
+    5121: 1,  # UNSIGNED_BYTE
+    5122: 2,  # SHORT
+    5123: 2,  # UNSIGNED_SHORT
+    5125: 4,  # UNSIGNED_INT
+    5126: 4,  # FLOAT
+}
+
+STRUCT_FORMATS = {
+    5120: 'b',
+    5121: 'B',
+    5122: 'h',
+    5123: 'H',
+    5125: 'I',
+    5126: 'f',
+}
+
+TYPE_COMPONENTS = {
+    'SCALAR': 1,
+    'VEC2': 2,
+    'VEC3': 3,
+    'VEC4': 4,
+    'MAT2': 4,
+    'MAT3': 9,
+    'MAT4': 16,
+}
+
+MODE_TRIANGLES = 4
+MODE_TRIANGLE_STRIP = 5
+MODE_TRIANGLE_FAN = 6
+
+
+def read_glb(glb_path):
+    """Read a GLB file and return (gltf_json, bin_chunk)"""
+    data = Path(glb_path).read_bytes()
+    return parse_glb(data)
+
+
+def parse_glb(data):
+    """Parse GLB bytes into (gltf_json, bin_chunk)"""
+    if len(data) < 20:
+        raise ValueError("File too small to be a GLB")
+
+    magic, version, length = struct.unpack_from('<4sII', data, 0)
+    if magic != GLB_MAGIC:
+        raise ValueError("Not a GLB file (bad magic)")
+    if version != 2:
+        raise ValueError(f"Unsupported GLB version: {version}")
+
+    gltf = None
+    bin_chunk = b''
+    offset = 12
+
+    while offset + 8 <= min(length, len(data)):
+        chunk_length, chunk_type = struct.unpack_from('<II', data, offset)
+        chunk = data[offset + 8:offset + 8 + chunk_length]
+
+        if chunk_type == CHUNK_JSON:
+            gltf = json.loads(chunk.decode('utf-8'))
+        elif chunk_type == CHUNK_BIN:
+            bin_chunk = chunk
+
+        offset += 8 + chunk_length
+
+    if gltf is None:
+        raise ValueError("GLB has no JSON chunk")
+
+    return gltf, bin_chunk
+
+
+def read_glb_json(glb_path):
+    """Read only the JSON chunk of a GLB file (the BIN chunk is never loaded)"""
+    with open(glb_path, 'rb') as f:
+        header = f.read(20)
+        if len(header) < 20:
+            raise ValueError("File too small to be a GLB")
+
+        magic, version, _, chunk_length, chunk_type = struct.unpack('<4sIIII', header)
+        if magic != GLB_MAGIC:
+            raise ValueError("Not a GLB file (bad magic)")
+        if version != 2:
+            raise ValueError(f"Unsupported GLB version: {version}")
+        if chunk_type != CHUNK_JSON:
+            raise ValueError("GLB does not start with a JSON chunk")
+
+        return json.loads(f.read(chunk_length).decode('utf-8'))
+
+
+def serialize_glb(gltf, bin_chunk, sort_keys=False):
+    """Serialize (gltf_json, bin_chunk) into GLB bytes"""
+    gltf = dict(gltf)
+    if bin_chunk:
+        buffers = [dict(b) for b in gltf.get('buffers', [{}])] or [{}]
+        buffers[0]['byteLength'] = len(bin_chunk)
+        gltf['buffers'] = buffers
+
+    json_chunk = json.dumps(gltf, separators=(',', ':'), sort_keys=sort_keys).encode('utf-8')
+    json_chunk += b' ' * (-len(json_chunk) % 4)
+    bin_chunk = bytes(bin_chunk) + b'\x00' * (-len(bin_chunk) % 4)
+
+    length = 12 + 8 + len(json_chunk) + (8 + len(bin_chunk) if bin_chunk else 0)
+    parts = [
+        struct.pack('<4sII', GLB_MAGIC, 2, length),
+        struct.pack('<II', len(json_chunk), CHUNK_JSON),
+        json_chunk,
+    ]
+    if bin_chunk:
+        parts += [struct.pack('<II', len(bin_chunk), CHUNK_BIN), bin_chunk]
+
+    return b''.join(parts)
+
+
+def write_glb(glb_path, gltf, bin_chunk, sort_keys=False):
+    """Write (gltf_json, bin_chunk) to a GLB file; returns bytes written"""
+    data = serialize_glb(gltf, bin_chunk, sort_keys=sort_keys)
+    Path(glb_path).write_bytes(data)
+    return len(data)
+
+
+def file_hash(path, length=None):
+    """SHA-256 hex digest of a file, optionally truncated"""
+    digest = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    return digest[:length] if length else digest
+
+
+def accessor_byte_length(accessor):
+    """Tightly packed byte length of an accessor's data"""
+    size = COMPONENT_SIZES[accessor['componentType']]
+    components = TYPE_COMPONENTS[accessor['type']]
+    return accessor['count'] * size * components
+
+
+def read_accessor(gltf, bin_chunk, accessor_index):
+    """Decode an accessor into a list of tuples (one tuple per element)"""
+    accessor = gltf['accessors'][accessor_index]
+    if 'sparse' in accessor:
+        raise ValueError(f"Sparse accessor {accessor_index} is not supported")
+
+    components = TYPE_COMPONENTS[accessor['type']]
+    count = accessor['count']
+
+    if 'bufferView' not in accessor:
+        return [(0,) * components] * count
+
+    view = gltf['bufferViews'][accessor['bufferView']]
+    if view.get('buffer', 0) != 0:
+        raise ValueError(f"Accessor {accessor_index} references an external buffer")
+
+    fmt = '<' + STRUCT_FORMATS[accessor['componentType']] * components
+    element_size = struct.calcsize(fmt)
+    stride = view.get('byteStride') or element_size
+    start = view.get('byteOffset', 0) + accessor.get('byteOffset', 0)
+
+    if stride == element_size:
+        return list(struct.iter_unpack(fmt, bin_chunk[start:start + count * element_size]))
+
+    return [struct.unpack_from(fmt, bin_chunk, start + i * stride) for i in range(count)]
+
+
+def accessor_bytes(gltf, bin_chunk, accessor_index):
+    """Raw bytes of an accessor, tightly packed (byteStride removed)"""
+    accessor = gltf['accessors'][accessor_index]
+    if 'sparse' in accessor:
+        raise ValueError(f"Sparse accessor {accessor_index} is not supported")
+    if 'bufferView' not in accessor:
+        return None
+
+    view = gltf['bufferViews'][accessor['bufferView']]
+    element_size = COMPONENT_SIZES[accessor['componentType']] * TYPE_COMPONENTS[accessor['type']]
+    stride = view.get('byteStride') or element_size
+    start = view.get('byteOffset', 0) + accessor.get('byteOffset', 0)
+
+    if stride == element_size:
+        return bytes(bin_chunk[start:start + accessor['count'] * element_size])
+
+    return b''.join(
+        bin_chunk[start + i * stride:start + i * stride + element_size]
+        for i in range(accessor['count'])
+    )
+
+
+def image_bytes(gltf, bin_chunk, image_index):
+    """Raw bytes of an image embedded in the BIN chunk, or None for URI images"""
+    image = gltf['images'][image_index]
+    if 'bufferView' not in image:
+        return None
+    view = gltf['bufferViews'][image['bufferView']]
+    start = view.get('byteOffset', 0)
+    return bytes(bin_chunk[start:start + view['byteLength']])
+
+
+def index_accessors(gltf):
+    """Set of accessor indices used as primitive indices"""
+    return {
+        primitive['indices']
+        for mesh in gltf.get('meshes', [])
+        for primitive in mesh.get('primitives', [])
+        if 'indices' in primitive
+    }
+
+
+def rebuild_buffer(gltf, accessor_data, image_data):
+    """Rewrite bufferViews as one tightly packed view per accessor and image
+
+    accessor_data is aligned with gltf['accessors'] (None for accessors
+    without data); image_data maps image index to bytes. Views are laid
+    out in accessor order, then image order, each 4-byte aligned.
+    Returns the new BIN chunk; gltf is updated in place.
+    """
+    indices = index_accessors(gltf)
+    vertex_attributes = {
+        accessor_index
+        for mesh in gltf.get('meshes', [])
+        for primitive in mesh.get('primitives', [])
+        for accessor_index in list(primitive.get('attributes', {}).values())
+        + [i for target in primitive.get('targets', []) for i in target.values()]
+    }
+
+    views = []
+    chunks = []
+    offset = 0
+
+    def add_view(data, target=None):
+        nonlocal offset
+        padding = -offset % 4
+        chunks.append(b'\x00' * padding)
+        offset += padding
+        view = {"buffer": 0, "byteOffset": offset, "byteLength": len(data)}
+        if target:
+            view["target"] = target
+        views.append(view)
+        chunks.append(data)
+        offset += len(data)
+        return len(views) - 1
+
+    for accessor_index, accessor in enumerate(gltf.get('accessors', [])):
+        accessor.pop('byteOffset', None)
+        data = accessor_data[accessor_index]
+        if data is None:
+            accessor.pop('bufferView', None)
+            continue
+        if accessor_index in indices:
+            target = 34963  # ELEMENT_ARRAY_BUFFER
+        elif accessor_index in vertex_attributes:
+            target = 34962  # ARRAY_BUFFER
+        else:
+            target = None
+        accessor['bufferView'] = add_view(data, target)
+
+    for image_index in sorted(image_data):
+        gltf['images'][image_index]['bufferView'] = add_view(image_data[image_index])
+
+    gltf['bufferViews'] = views
+    bin_chunk = b''.join(chunks)
+    bin_chunk += b'\x00' * (-len(bin_chunk) % 4)
+    gltf['buffers'] = [{"byteLength": len(bin_chunk)}]
+
+    return bin_chunk
+
+
+def byte_breakdown(glb_path):
+    """Attribute a GLB's bytes to JSON, indices, each vertex attribute and textures
+
+    Buffer views are attributed to the first accessor or image that uses
+    them; views nothing references are counted as unused. Headers and
+    padding land in 'other', so the categories sum to the file size.
+    """
+    glb_path = Path(glb_path)
+    file_bytes = glb_path.stat().st_size
+    gltf = read_glb_json(glb_path)
+    views = gltf.get('bufferViews', [])
+
+    view_category = {}
+    for mesh in gltf.get('meshes', []):
+        for primitive in mesh.get('primitives', []):
+            if 'indices' in primitive:
+                accessor = gltf['accessors'][primitive['indices']]
+                if 'bufferView' in accessor:
+                    view_category.setdefault(accessor['bufferView'], 'indices')
+            for semantic, index in sorted(primitive.get('attributes', {}).items()):
+                accessor = gltf['accessors'][index]
+                if 'bufferView' in accessor:
+                    view_category.setdefault(accessor['bufferView'], semantic)
+    for image in gltf.get('images', []):
+        if 'bufferView' in image:
+            view_category.setdefault(image['bufferView'], 'textures')
+    for accessor in gltf.get('accessors', []):
+        if 'bufferView' in accessor:
+            view_category.setdefault(accessor['bufferView'], 'animation')
+
+    with open(glb_path, 'rb') as f:
+        json_length = struct.unpack('<12xI', f.read(16))[0]
+
+    breakdown = {"json": json_length}
+    for view_index, view in enumerate(views):
+        category = view_category.get(view_index, 'unused')
+        breakdown[category] = breakdown.get(category, 0) + view['byteLength']
+
+    breakdown['other'] = file_bytes - sum(breakdown.values())
+    return breakdown
+
+
+def primitive_triangle_count(gltf, primitive):
+    """Exact triangle count of a single mesh primitive"""
+    mode = primitive.get('mode', MODE_TRIANGLES)
+
+    if 'indices' in primitive:
+        count = gltf['accessors'][primitive['indices']]['count']
+    else:
+        position = primitive.get('attributes', {}).get('POSITION')
+        if position is None:
+            return 0
+        count = gltf['accessors'][position]['count']
+
+    if mode == MODE_TRIANGLES:
+        return count // 3
+    if mode in (MODE_TRIANGLE_STRIP, MODE_TRIANGLE_FAN):
+        return max(count - 2, 0)
+
+    return 0  # Points and lines draw no triangles
+
+
+def read_indices(gltf, bin_chunk, accessor_index):
+    """Decode an unsigned scalar index accessor into a flat array (much faster than read_accessor)"""
+    accessor = gltf['accessors'][accessor_index]
+    indices = array.array(STRUCT_FORMATS[accessor['componentType']])
+    if 'bufferView' not in accessor:
+        return array.array(indices.typecode, bytes(accessor['count'] * indices.itemsize))
+    indices.frombytes(accessor_bytes(gltf, bin_chunk, accessor_index))
+    if sys.byteorder == 'big':
+        indices.byteswap()
+    return indices
+
+
+def triangle_indices(gltf, bin_chunk, primitive):
+    """Vertex index triples for every triangle a primitive draws"""
+    mode = primitive.get('mode', MODE_TRIANGLES)
+
+    if 'indices' in primitive:
+        indices = read_indices(gltf, bin_chunk, primitive['indices'])
+    else:
+        indices = range(primitive_vertex_count(gltf, primitive))
+
+    if mode == MODE_TRIANGLES:
+        end = len(indices) - len(indices) % 3
+        return list(zip(indices[0:end:3], indices[1:end:3], indices[2:end:3]))
+    if mode == MODE_TRIANGLE_STRIP:
+        return [
+            (indices[i], indices[i + 1], indices[i + 2]) if i % 2 == 0
+            else (indices[i + 1], indices[i], indices[i + 2])
+            for i in range(len(indices) - 2)
+        ]
+    if mode == MODE_TRIANGLE_FAN:
+        return [(indices[0], indices[i + 1], indices[i + 2]) for i in range(len(indices) - 2)]
+
+    return []
+
+
+def primitive_vertex_count(gltf, primitive):
+    """Vertex count of a single mesh primitive"""
+    position = primitive.get('attributes', {}).get('POSITION')
+    if position is None:
+        return 0
+    return gltf['accessors'][position]['count']
+
+
+def mesh_instances(gltf):
+    """Yield (node_index, world_matrix, mesh_index) for every mesh node in the default scene"""
+    scenes = gltf.get('scenes', [])
+    nodes = gltf.get('nodes', [])
+
+    if scenes:
+        roots = scenes[gltf.get('scene', 0)].get('nodes', [])
+    else:
+        roots = list(range(len(nodes)))
+
+    stack = [(root, _identity()) for root in roots]
+    while stack:
+        node_index, parent = stack.pop()
+        node = nodes[node_index]
+        world = _mat_mul(parent, _node_matrix(node))
+
+        if 'mesh' in node:
+            yield node_index, world, node['mesh']
+
+        for child in node.get('children', []):
+            stack.append((child, world))
+
+
+def count_triangles(gltf):
+    """Total triangles drawn by the default scene (instanced meshes counted per instance)"""
+    total = 0
+    for _, _, mesh_index in mesh_instances(gltf):
+        for primitive in gltf['meshes'][mesh_index].get('primitives', []):
+            total += primitive_triangle_count(gltf, primitive)
+    return total
+
+
+def count_vertices(gltf):
+    """Total vertices uploaded for the default scene (per instance)"""
+    total = 0
+    for _, _, mesh_index in mesh_instances(gltf):
+        for primitive in gltf['meshes'][mesh_index].get('primitives', []):
+            total += primitive_vertex_count(gltf, primitive)
+    return total
+
+
+def has_vertex_colors(gltf):
+    """Whether any mesh primitive carries a COLOR_0 attribute"""
+    return any(
+        'COLOR_0' in primitive.get('attributes', {})
+        for mesh in gltf.get('meshes', [])
+        for primitive in mesh.get('primitives', [])
+    )
+
+
+def scene_bounds(gltf):
+    """World-space axis-aligned bounds of the default scene as (min, max), or None
+
+    Uses the POSITION accessor min/max required by the glTF spec, so no
+    vertex data has to be decoded.
+    """
+    lo = [float('inf')] * 3
+    hi = [float('-inf')] * 3
+
+    for _, world, mesh_index in mesh_instances(gltf):
+        for primitive in gltf['meshes'][mesh_index].get('primitives', []):
+            position = primitive.get('attributes', {}).get('POSITION')
+            if position is None:
+                continue
+            accessor = gltf['accessors'][position]
+            if 'min' not in accessor or 'max' not in accessor:
+                continue
+
+            for corner in _box_corners(accessor['min'], accessor['max']):
+                point = transform_point(world, corner)
+                for axis in range(3):
+                    lo[axis] = min(lo[axis], point[axis])
+                    hi[axis] = max(hi[axis], point[axis])
+
+    if lo[0] == float('inf'):
+        return None
+
+    return lo, hi
+
+
+def glb_stats(glb_path):
+    """Summary stats for a GLB file: bytes, hash, triangles, vertices, bounds"""
+    glb_path = Path(glb_path)
+    gltf, _ = read_glb(glb_path)
+    bounds = scene_bounds(gltf)
+
+    return {
+        "bytes": glb_path.stat().st_size,
+        "hash": file_hash(glb_path),
+        "triangles": count_triangles(gltf),
+        "vertices": count_vertices(gltf),
+        "bounds": {
+            "min": [round(v, 4) for v in bounds[0]],
+            "max": [round(v, 4) for v in bounds[1]],
+        } if bounds else None,
+    }
+
+
+def _identity():
+    return [[1.0 if row == col else 0.0 for col in range(4)] for row in range(4)]
+
+
+def _mat_mul(a, b):
+    return [[sum(a[row][k] * b[k][col] for k in range(4)) for col in range(4)] for row in range(4)]
+
+
+def _node_matrix(node):
+    """Local transform of a node as a row-major 4x4 matrix"""
+    if 'matrix' in node:
+        m = node['matrix']  # glTF stores column-major
+        return [[m[col * 4 + row] for col in range(4)] for row in range(4)]
+
+    tx, ty, tz = node.get('translation', [0.0, 0.0, 0.0])
+    qx, qy, qz, qw = node.get('rotation', [0.0, 0.0, 0.0, 1.0])
+    sx, sy, sz = node.get('scale', [1.0, 1.0, 1.0])
+
+    return [
+        [(1 - 2 * (qy * qy + qz * qz)) * sx, (2 * (qx * qy - qz * qw)) * sy, (2 * (qx * qz + qy * qw)) * sz, tx],
+        [(2 * (qx * qy + qz * qw)) * sx, (1 - 2 * (qx * qx + qz * qz)) * sy, (2 * (qy * qz - qx * qw)) * sz, ty],
+        [(2 * (qx * qz - qy * qw)) * sx, (2 * (qy * qz + qx * qw)) * sy, (1 - 2 * (qx * qx + qy * qy)) * sz, tz],
+        [0.0, 0.0, 0.0, 1.0],
+    ]
+
+
+def transform_point(m, p):
+    """Apply a row-major 4x4 matrix to a 3D point"""
+    return [m[row][0] * p[0] + m[row][1] * p[1] + m[row][2] * p[2] + m[row][3] for row in range(3)]
+
+
+def _box_corners(lo, hi):
+    return [
+        (x, y, z)
+        for x in (lo[0], hi[0])
+        for y in (lo[1], hi[1])
+        for z in (lo[2], hi[2])
+    ]
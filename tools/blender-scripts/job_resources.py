@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Job Resources
+CPU-thread and memory budgets for concurrent Blender jobs, with per-asset
+peak memory history so each job is admitted on what it used last time
+Usage: python job_resources.py [--history assets/.cache/job-memory.json]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+HISTORY_PATH = Path(__file__).parent.parent.parent / "assets" / ".cache" / "job-memory.json"
+HISTORY_LENGTH = 5                  # Peaks remembered per asset
+DEFAULT_JOB_MEMORY = 2 * 1024 ** 3  # Estimate for an asset with no history at all
+MEMORY_HEADROOM = 1.2               # Safety margin over the worst remembered peak
+MEMORY_BUDGET_FRACTION = 0.8        # Share of available RAM jobs may use by default
+
+
+def cpu_budget():
+    """Threads the scheduler may hand out (CPUs this process may run on)"""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def available_memory():
+    """Bytes of RAM available for new work (MemAvailable on Linux, physical RAM elsewhere)"""
+    try:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+
+
+def memory_budget():
+    """Default memory budget in bytes"""
+    return int(available_memory() * MEMORY_BUDGET_FRACTION)
+
+
+def group_peak_memory(pgid):
+    """Peak resident memory of a process group in bytes, or None if it cannot be read
+
+    Linux sums each member's high-water mark (VmHWM); elsewhere the
+    group's current RSS from ps is returned and callers keep the maximum
+    sample. Blender may run behind a wrapper, so the whole group counts.
+    """
+    if os.path.isdir('/proc'):
+        total = 0
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f'/proc/{entry}/stat') as f:
+                    # Fields after the parenthesised command: state ppid pgrp ...
+                    if int(f.read().rsplit(')', 1)[1].split()[2]) != pgid:
+                        continue
+                with open(f'/proc/{entry}/status') as f:
+                    for line in f:
+                        if line.startswith('VmHWM:'):
+                            total += int(line.split()[1]) * 1024
+            except (OSError, IndexError, ValueError):
+                continue
+        return total or None
+
+    try:
+        result = subprocess.run(['ps', '-A', '-o', 'pgid=,rss='], capture_output=True, text=True)
+    except FileNotFoundError:
+        return None
+    total = 0
+    for line in result.stdout.splitlines():
+        fields = line.split()
+        if len(fields) == 2 and fields[0] == str(pgid):
+            total += int(fields[1]) * 1024
+    return total or None
+
+
+def load_history(path=HISTORY_PATH):
+    """Peak memory samples per asset ID"""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_history(history, path=HISTORY_PATH):
+    """Write the history atomically"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(history, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def record_peak(history, asset_id, peak):
+    """Remember a job's peak memory (keeps the last HISTORY_LENGTH samples)"""
+    if peak:
+        history[asset_id] = (history.get(asset_id, []) + [peak])[-HISTORY_LENGTH:]
+
+
+def estimate_memory(history, asset_id):
+    """Expected peak memory for a job: its worst recent peak, else the median of all assets"""
+    samples = history.get(asset_id)
+    if samples:
+        return int(max(samples) * MEMORY_HEADROOM)
+
+    peaks = sorted(max(values) for values in history.values() if values)
+    if peaks:
+        return int(peaks[len(peaks) // 2] * MEMORY_HEADROOM)
+    return DEFAULT_JOB_MEMORY
+
+
+def fits(running, threads, memory, max_threads, max_memory):
+    """Whether a job needing threads/memory fits next to the running (threads, memory) jobs
+
+    A job always fits on an idle box, so one oversized asset still builds.
+    """
+    if not running:
+        return True
+    used_threads = sum(t for t, _ in running)
+    used_memory = sum(m for _, m in running)
+    return used_threads + threads <= max_threads and used_memory + memory <= max_memory
+
+
+def format_gb(value):
+    """Bytes as GB with one decimal"""
+    return f"{value / 1024 ** 3:.1f} GB"
+
+
+def main():
+    """Main execution"""
+    parser = argparse.ArgumentParser(
+        description='Show the CPU and memory budget and per-asset memory estimates for Blender jobs'
+    )
+    parser.add_argument('--history', default=str(HISTORY_PATH), help='Peak memory history JSON')
+
+    args = parser.parse_args()
+
+    try:
+        history = load_history(args.history)
+    except (OSError, ValueError) as e:
+        print(f"✗ Error: {e}")
+        sys.exit(1)
+
+    print(f"\n{'='*70}")
+    print("Job Resources")
+    print(f"{'='*70}")
+    print(f"CPU budget: {cpu_budget()} thread(s)")
+    print(f"Memory budget: {format_gb(memory_budget())} of {format_gb(available_memory())} available")
+    print(f"{'='*70}")
+
+    if not history:
+        print(f"⊘ No history yet; jobs are estimated at {format_gb(DEFAULT_JOB_MEMORY)}")
+        return
+
+    for asset_id, samples in sorted(history.items()):
+        print(f"  {asset_id}: peak {format_gb(max(samples))} over {len(samples)} run(s), "
+              f"estimate {format_gb(estimate_memory(history, asset_id))}")
+
+
+if __name__ == "__main__":
+    main()
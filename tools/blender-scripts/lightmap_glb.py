@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+GLB Lightmap
+Embeds a baked lightmap as the occlusionTexture of every material drawn
+with the lightmap UV set and removes punctual lights, so the light ships
+baked into the GLB instead of being shaded per fragment at runtime
+Usage: python lightmap_glb.py assets/models/station-home.glb lightmap.png --texcoord 1 [--output out.glb]
+"""
+
+import argparse
+import copy
+import sys
+from pathlib import Path
+
+from glb_utils import accessor_bytes, image_bytes, read_glb, rebuild_buffer, write_glb
+
+LIGHTMAP_NAME = "lightmap"
+LIGHTS_EXTENSION = "KHR_lights_punctual"
+
+LINEAR = 9729
+LINEAR_MIPMAP_LINEAR = 9987
+CLAMP_TO_EDGE = 33071
+
+
+def remove_punctual_lights(gltf):
+    """Drop KHR_lights_punctual lights and node references; returns the number removed"""
+    lights = gltf.get('extensions', {}).pop(LIGHTS_EXTENSION, {}).get('lights', [])
+    if not gltf.get('extensions', True):
+        del gltf['extensions']
+
+    for node in gltf.get('nodes', []):
+        node.get('extensions', {}).pop(LIGHTS_EXTENSION, None)
+        if not node.get('extensions', True):
+            del node['extensions']
+
+    for key in ('extensionsUsed', 'extensionsRequired'):
+        if LIGHTS_EXTENSION in gltf.get(key, []):
+            gltf[key].remove(LIGHTS_EXTENSION)
+            if not gltf[key]:
+                del gltf[key]
+
+    return len(lights)
+
+
+def lightmap_gltf(gltf, bin_chunk, png, texcoord):
+    """Sample png through TEXCOORD_<texcoord> as occlusionTexture in place; returns (bin_chunk, report)
+
+    Only primitives carrying the lightmap UV set get the texture. A
+    material they share with primitives that lack it is copied, so every
+    material stays valid for all of its primitives.
+    """
+    semantic = f"TEXCOORD_{texcoord}"
+    materials = gltf.setdefault('materials', [])
+    primitives = [p for mesh in gltf.get('meshes', []) for p in mesh.get('primitives', [])]
+    lit = [p for p in primitives if semantic in p.get('attributes', {})]
+    lights_removed = remove_punctual_lights(gltf)
+    if not lit:
+        return bin_chunk, {"primitives": 0, "materials": 0, "lights_removed": lights_removed}
+
+    data = [accessor_bytes(gltf, bin_chunk, i) for i in range(len(gltf.get('accessors', [])))]
+    images = {i: image_bytes(gltf, bin_chunk, i) for i in range(len(gltf.get('images', [])))}
+
+    gltf.setdefault('images', []).append({"name": LIGHTMAP_NAME, "mimeType": "image/png"})
+    images[len(gltf['images']) - 1] = png
+    gltf.setdefault('samplers', []).append({
+        "magFilter": LINEAR, "minFilter": LINEAR_MIPMAP_LINEAR, "wrapS": CLAMP_TO_EDGE, "wrapT": CLAMP_TO_EDGE
+    })
+    gltf.setdefault('textures', []).append({"sampler": len(gltf['samplers']) - 1, "source": len(gltf['images']) - 1})
+    occlusion = {"index": len(gltf['textures']) - 1}
+    if texcoord:
+        occlusion["texCoord"] = texcoord
+
+    # A material is updated in place when every primitive using it has the lightmap UV set
+    shared = {p.get('material') for p in primitives if semantic not in p.get('attributes', {})}
+    remap = {}
+    for primitive in lit:
+        index = primitive.get('material')
+        if index not in remap:
+            if index is not None and index not in shared:
+                materials[index]['occlusionTexture'] = dict(occlusion)
+                remap[index] = index
+            else:
+                material = copy.deepcopy(materials[index]) if index is not None else {"name": LIGHTMAP_NAME}
+                material['occlusionTexture'] = dict(occlusion)
+                materials.append(material)
+                remap[index] = len(materials) - 1
+        primitive['material'] = remap[index]
+
+    bin_chunk = rebuild_buffer(gltf, data, {i: b for i, b in images.items() if b is not None})
+    report = {"primitives": len(lit), "materials": len(remap), "lights_removed": lights_removed}
+    return bin_chunk, report
+
+
+def lightmap_glb(glb_path, png, texcoord, output_path=None):
+    """Embed a lightmap PNG in a GLB in place (or to output_path); returns the report"""
+    output_path = output_path or glb_path
+    gltf, bin_chunk = read_glb(glb_path)
+    bin_chunk, report = lightmap_gltf(gltf, bin_chunk, png, texcoord)
+    write_glb(output_path, gltf, bin_chunk)
+    return report
+
+
+def print_report(glb_path, report):
+    """Print what the lightmap was applied to"""
+    print(f"[Lightmap] {Path(glb_path).name}")
+    if not report['primitives']:
+        print("  ⊘ No primitive carries the lightmap UV set")
+    else:
+        print(f"  ✓ Lightmap on {report['primitives']} primitive(s) across {report['materials']} material(s)")
+    if report['lights_removed']:
+        print(f"  ✓ Removed {report['lights_removed']} punctual light(s)")
+
+
+def main():
+    """Main execution"""
+    parser = argparse.ArgumentParser(
+        description='Embed a baked lightmap as the occlusion texture and remove punctual lights'
+    )
+    parser.add_argument('glb', help='GLB file to process')
+    parser.add_argument('lightmap', help='Lightmap PNG (linear, sampled through the lightmap UV set)')
+    parser.add_argument('--texcoord', type=int, default=1, help='UV set the lightmap uses (default: 1)')
+    parser.add_argument('--output', help='Output path (default: rewrite in place)')
+
+    args = parser.parse_args()
+
+    for path in (args.glb, args.lightmap):
+        if not Path(path).exists():
+            print(f"✗ Error: File not found: {path}")
+            sys.exit(1)
+
+    try:
+        report = lightmap_glb(args.glb, Path(args.lightmap).read_bytes(), args.texcoord, args.output)
+    except ValueError as e:
+        print(f"✗ Error: {e}")
+        sys.exit(1)
+
+    print_report(args.output or args.glb, report)
+
+
+if __name__ == "__main__":
+    main()
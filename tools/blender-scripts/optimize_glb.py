@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+GLB Optimizer
+Drops vertex attributes no material consumes, deduplicates accessors and
+images, and compacts the BIN chunk
+Usage: python optimize_glb.py assets/models/station-home.glb [--output out.glb]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from glb_utils import accessor_bytes, image_bytes, read_glb, rebuild_buffer, write_glb
+
+TEXTURE_SLOTS = ('normalTexture', 'occlusionTexture', 'emissiveTexture')
+PBR_TEXTURE_SLOTS = ('baseColorTexture', 'metallicRoughnessTexture')
+
+
+def material_textures(material):
+    """Texture info dicts a material samples, including extension textures"""
+    infos = [material[slot] for slot in TEXTURE_SLOTS if slot in material]
+    pbr = material.get('pbrMetallicRoughness', {})
+    infos += [pbr[slot] for slot in PBR_TEXTURE_SLOTS if slot in pbr]
+
+    for extension in material.get('extensions', {}).values():
+        for value in extension.values():
+            if isinstance(value, dict) and 'index' in value:
+                infos.append(value)
+
+    return infos
+
+
+def consumed_texcoords(material):
+    """UV set indices a material reads"""
+    texcoords = set()
+    for info in material_textures(material):
+        transform = info.get('extensions', {}).get('KHR_texture_transform', {})
+        texcoords.add(transform.get('texCoord', info.get('texCoord', 0)))
+    return texcoords
+
+
+def texcoord_set(semantic):
+    """UV set index of a TEXCOORD_n semantic, or None"""
+    return int(semantic.split('_')[1]) if semantic.startswith('TEXCOORD_') else None
+
+
+def renumber_texcoords(gltf):
+    """Renumber each material's UV sets to 0..n-1 in order, updating primitives and texCoord
+
+    glTF requires TEXCOORD_n to start at 0 and be consecutive, so once an
+    unused set is pruned (say TEXCOORD_0 below a TEXCOORD_1 lightmap) the
+    survivors shift down. Returns a list of (mesh, old, new) renames.
+    """
+    materials = gltf.get('materials', [])
+    primitives = [p for mesh in gltf.get('meshes', []) for p in mesh.get('primitives', [])]
+
+    present = {}
+    for primitive in primitives:
+        sets = {texcoord_set(s) for s in primitive.get('attributes', {})} - {None}
+        present.setdefault(primitive.get('material'), set()).update(sets)
+
+    remaps = {}
+    for index, sets in present.items():
+        remap = {old: new for new, old in enumerate(sorted(sets))}
+        if any(old != new for old, new in remap.items()):
+            remaps[index] = remap
+
+    renamed = []
+    for mesh in gltf.get('meshes', []):
+        for primitive in mesh.get('primitives', []):
+            remap = remaps.get(primitive.get('material'))
+            if not remap:
+                continue
+            for attributes in [primitive['attributes'], *primitive.get('targets', [])]:
+                moved = {s: f"TEXCOORD_{remap[texcoord_set(s)]}"
+                         for s in attributes if texcoord_set(s) in remap}
+                values = {moved[s]: attributes.pop(s) for s in list(moved)}
+                attributes.update(values)
+            renamed += [(mesh.get('name', ''), f"TEXCOORD_{old}", f"TEXCOORD_{new}")
+                        for old, new in sorted(remap.items()) if old != new]
+
+    for index, remap in remaps.items():
+        if index is None:
+            continue
+        for info in material_textures(materials[index]):
+            transform = info.get('extensions', {}).get('KHR_texture_transform', {})
+            for container in (info, transform):
+                if container.get('texCoord') in remap:
+                    container['texCoord'] = remap[container['texCoord']]
+
+    return list(dict.fromkeys(renamed))
+
+
+def prune_attributes(gltf):
+    """Remove attributes no material consumes; returns a list of (mesh, semantic) removed
+
+    TANGENT is only read with a normalTexture, TEXCOORD_n only when a
+    texture samples set n, and only COLOR_0 is part of core glTF shading.
+    """
+    materials = gltf.get('materials', [])
+    removed = []
+
+    for mesh in gltf.get('meshes', []):
+        for primitive in mesh.get('primitives', []):
+            material = materials[primitive['material']] if 'material' in primitive else {}
+            texcoords = consumed_texcoords(material)
+            attributes = primitive.get('attributes', {})
+
+            for semantic in list(attributes):
+                if semantic == 'TANGENT':
+                    unused = 'normalTexture' not in material
+                elif semantic.startswith('TEXCOORD_'):
+                    unused = texcoord_set(semantic) not in texcoords
+                elif semantic.startswith('COLOR_'):
+                    unused = semantic != 'COLOR_0'
+                else:
+                    unused = False
+
+                if unused:
+                    del attributes[semantic]
+                    removed.append((mesh.get('name', ''), semantic))
+
+            # Morph targets must mirror the base attributes
+            for target in primitive.get('targets', []):
+                for semantic in list(target):
+                    if semantic not in attributes and semantic not in ('POSITION', 'NORMAL'):
+                        del target[semantic]
+
+    return removed
+
+
+def accessor_references(gltf):
+    """Yield (container, key) for every place an accessor index is stored"""
+    for mesh in gltf.get('meshes', []):
+        for primitive in mesh.get('primitives', []):
+            if 'indices' in primitive:
+                yield primitive, 'indices'
+            for semantic in primitive.get('attributes', {}):
+                yield primitive['attributes'], semantic
+            for target in primitive.get('targets', []):
+                for semantic in target:
+                    yield target, semantic
+    for animation in gltf.get('animations', []):
+        for sampler in animation.get('samplers', []):
+            yield sampler, 'input'
+            yield sampler, 'output'
+    for skin in gltf.get('skins', []):
+        if 'inverseBindMatrices' in skin:
+            yield skin, 'inverseBindMatrices'
+    for node in gltf.get('nodes', []):
+        instancing = node.get('extensions', {}).get('EXT_mesh_gpu_instancing', {})
+        for semantic in instancing.get('attributes', {}):
+            yield instancing['attributes'], semantic
+
+
+def image_references(gltf):
+    """Yield (container, key) for every place an image index is stored
+
+    Besides textures[].source this covers the fallback-free sources of
+    texture extensions such as EXT_texture_webp and KHR_texture_basisu.
+    """
+    for texture in gltf.get('textures', []):
+        if 'source' in texture:
+            yield texture, 'source'
+        for extension in texture.get('extensions', {}).values():
+            if isinstance(extension, dict) and 'source' in extension:
+                yield extension, 'source'
+
+
+def accessor_identity(accessor, data):
+    """Everything that makes two accessors interchangeable"""
+    return (
+        accessor['componentType'],
+        accessor['type'],
+        accessor['count'],
+        accessor.get('normalized', False),
+        data,
+    )
+
+
+def optimize_gltf(gltf, bin_chunk):
+    """Prune, deduplicate and compact a glTF document in place
+
+    Returns (bin_chunk, report) where report lists removed attributes and
+    the number of duplicate accessors and images merged.
+    """
+    if 'KHR_draco_mesh_compression' in gltf.get('extensionsUsed', []):
+        raise ValueError("Draco-compressed GLBs must be optimized before compression")
+
+    removed_attributes = prune_attributes(gltf)
+    renumbered_texcoords = renumber_texcoords(gltf)
+
+    # Accessors: keep only referenced ones, one copy per distinct content
+    accessors = gltf.get('accessors', [])
+    data = [accessor_bytes(gltf, bin_chunk, i) for i in range(len(accessors))]
+    referenced = sorted({container[key] for container, key in accessor_references(gltf)})
+
+    canonical = {}
+    remap = {}
+    kept = []
+    for index in referenced:
+        identity = accessor_identity(accessors[index], data[index])
+        if data[index] is not None and identity in canonical:
+            remap[index] = canonical[identity]
+            continue
+        remap[index] = len(kept)
+        canonical.setdefault(identity, len(kept))
+        kept.append(index)
+
+    for container, key in list(accessor_references(gltf)):
+        container[key] = remap[container[key]]
+    gltf['accessors'] = [accessors[i] for i in kept]
+    accessor_data = [data[i] for i in kept]
+
+    # Images: keep only ones a texture uses, one copy per distinct content
+    images = gltf.get('images', [])
+    used_images = sorted({container[key] for container, key in image_references(gltf)})
+
+    image_canonical = {}
+    image_remap = {}
+    kept_images = []
+    for index in used_images:
+        content = image_bytes(gltf, bin_chunk, index)
+        identity = (images[index].get('mimeType'), content if content is not None else images[index].get('uri'))
+        if identity in image_canonical:
+            image_remap[index] = image_canonical[identity]
+            continue
+        image_remap[index] = len(kept_images)
+        image_canonical[identity] = len(kept_images)
+        kept_images.append((index, content))
+
+    for container, key in list(image_references(gltf)):
+        container[key] = image_remap[container[key]]
+    if images:
+        gltf['images'] = [images[i] for i, _ in kept_images]
+        if not gltf['images']:
+            del gltf['images']
+    image_data = {new: content for new, (_, content) in enumerate(kept_images) if content is not None}
+
+    new_bin = rebuild_buffer(gltf, accessor_data, image_data)
+
+    report = {
+        "removed_attributes": removed_attributes,
+        "renumbered_texcoords": renumbered_texcoords,
+        "merged_accessors": len(referenced) - len(kept),
+        "dropped_accessors": len(accessors) - len(referenced),
+        "merged_images": len(used_images) - len(kept_images),
+        "dropped_images": len(images) - len(used_images),
+    }
+    return new_bin, report
+
+
+def optimize_glb(glb_path, output_path=None):
+    """Optimize a GLB file; returns (bytes_before, bytes_after, report)"""
+    glb_path = Path(glb_path)
+    output_path = Path(output_path) if output_path else glb_path
+
+    before = glb_path.stat().st_size
+    gltf, bin_chunk = read_glb(glb_path)
+    bin_chunk, report = optimize_gltf(gltf, bin_chunk)
+    after = write_glb(output_path, gltf, bin_chunk)
+
+    return before, after, report
+
+
+def print_report(glb_path, before, after, report):
+    """Print what the optimizer removed and the bytes saved"""
+    removed = {}
+    for _, semantic in report['removed_attributes']:
+        removed[semantic] = removed.get(semantic, 0) + 1
+
+    print(f"[Optimize] {Path(glb_path).name}")
+    for semantic, count in sorted(removed.items()):
+        print(f"  - Dropped {semantic} from {count} primitive(s)")
+    for old, new in sorted({(old, new) for _, old, new in report['renumbered_texcoords']}):
+        print(f"  - Renumbered {old} → {new}")
+    for key, label in (('merged_accessors', 'duplicate accessor(s) merged'),
+                       ('dropped_accessors', 'unused accessor(s) dropped'),
+                       ('merged_images', 'duplicate image(s) merged'),
+                       ('dropped_images', 'unused image(s) dropped')):
+        if report[key]:
+            print(f"  - {report[key]} {label}")
+
+    saved = before - after
+    percent = saved / before * 100 if before else 0
+    print(f"  ✓ {before / 1024:.1f} KB → {after / 1024:.1f} KB (saved {saved / 1024:.1f} KB, {percent:.1f}%)")
+
+
+def main():
+    """Main execution"""
+    parser = argparse.ArgumentParser(
+        description='Drop unused attributes, deduplicate accessors and images, and compact GLB files'
+    )
+    parser.add_argument('glb', nargs='+', help='GLB file(s) to optimize in place')
+    parser.add_argument('--output', help='Write to this path instead (single input only)')
+
+    args = parser.parse_args()
+
+    if args.output and len(args.glb) > 1:
+        print("✗ Error: --output takes a single input GLB")
+        sys.exit(1)
+
+    for glb in args.glb:
+        if not Path(glb).exists():
+            print(f"✗ Error: GLB file not found: {glb}")
+            sys.exit(1)
+        try:
+            before, after, report = optimize_glb(glb, args.output)
+        except ValueError as e:
+            print(f"✗ Error: {glb}: {e}")
+            sys.exit(1)
+        print_report(glb, before, after, report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+GLB Palette Collapse
+Collapses flat-colour materials into one material that samples base colour,
+roughness and metalness from a small palette texture, and merges the
+primitives that end up sharing a material to cut draw calls
+Usage: python palette_glb.py assets/models/station-home.glb [--output out.glb]
+"""
+
+import argparse
+import json
+import struct
+import sys
+import zlib
+from pathlib import Path
+
+import numpy as np
+
+from glb_utils import MODE_TRIANGLES, accessor_bytes, read_glb, write_glb
+from optimize_glb import material_textures
+from simplify_glb import accessor_array, add_geometry, compact_accessors
+
+PALETTE_NAME = "palette"
+
+NEAREST = 9728
+CLAMP_TO_EDGE = 33071
+
+
+def encode_png(width, height, pixels):
+    """Encode 8-bit RGB pixels (bytes, row-major) as a PNG"""
+    def chunk(kind, payload):
+        body = kind + payload
+        return struct.pack('>I', len(payload)) + body + struct.pack('>I', zlib.crc32(body) & 0xFFFFFFFF)
+
+    stride = width * 3
+    raw = b''.join(b'\x00' + pixels[row * stride:(row + 1) * stride] for row in range(height))
+    return b''.join([
+        b'\x89PNG\r\n\x1a\n',
+        chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)),
+        chunk(b'IDAT', zlib.compress(raw, 9)),
+        chunk(b'IEND', b''),
+    ])
+
+
+def linear_to_srgb(value):
+    """Linear colour component to an 8-bit sRGB value (baseColorTexture is sRGB-encoded)"""
+    value = min(max(value, 0.0), 1.0)
+    if value <= 0.0031308:
+        encoded = value * 12.92
+    else:
+        encoded = 1.055 * value ** (1 / 2.4) - 0.055
+    return int(round(encoded * 255))
+
+
+def is_flat(material):
+    """True for opaque, untextured, non-emissive materials with no extensions"""
+    return (
+        not material_textures(material)
+        and not material.get('extensions')
+        and not any(material.get('emissiveFactor', [0, 0, 0]))
+        and material.get('alphaMode', 'OPAQUE') == 'OPAQUE'
+    )
+
+
+def palette_entry(material):
+    """Quantized (base colour, roughness, metallic) texel values for a flat material"""
+    pbr = material.get('pbrMetallicRoughness', {})
+    r, g, b = pbr.get('baseColorFactor', [1, 1, 1, 1])[:3]
+    return (
+        (linear_to_srgb(r), linear_to_srgb(g), linear_to_srgb(b)),
+        int(round(pbr.get('roughnessFactor', 1.0) * 255)),
+        int(round(pbr.get('metallicFactor', 1.0) * 255)),
+    )
+
+
+def build_palette(gltf):
+    """Plan material targets; returns (target per material index, palette entries, palette material keys)
+
+    A target is ('palette', doubleSided, texel) for flat materials and
+    ('material', canonical index) for everything else, where identical
+    materials (ignoring names) share one canonical index.
+    """
+    materials = gltf.get('materials', [])
+    entries = []
+    targets = {}
+    canonical = {}
+
+    for index, material in enumerate(materials):
+        if is_flat(material):
+            entry = palette_entry(material)
+            if entry not in entries:
+                entries.append(entry)
+            targets[index] = ('palette', material.get('doubleSided', False), entries.index(entry))
+        else:
+            key = json.dumps({k: v for k, v in material.items() if k != 'name'}, sort_keys=True)
+            targets[index] = ('material', canonical.setdefault(key, index))
+
+    return targets, entries
+
+
+def palette_images(entries):
+    """Base colour and metallic-roughness palette PNGs (one texel per entry)"""
+    base = b''.join(bytes(color) for color, _, _ in entries)
+    metallic_roughness = b''.join(bytes((0, roughness, metallic)) for _, roughness, metallic in entries)
+    return encode_png(len(entries), 1, base), encode_png(len(entries), 1, metallic_roughness)
+
+
+def palette_gltf(gltf, bin_chunk):
+    """Collapse flat materials into palette materials and merge primitives in place
+
+    Returns (bin_chunk, report). Emissive, textured, transparent and
+    extension materials are kept as they are (identical copies merged).
+    """
+    materials = gltf.get('materials', [])
+    targets, entries = build_palette(gltf)
+    if not entries:
+        return bin_chunk, None
+
+    data = [accessor_bytes(gltf, bin_chunk, i) for i in range(len(gltf.get('accessors', [])))]
+    primitives_before = sum(len(m.get('primitives', [])) for m in gltf.get('meshes', []))
+
+    # Palette textures
+    images = gltf.setdefault('images', [])
+    textures = gltf.setdefault('textures', [])
+    samplers = gltf.setdefault('samplers', [])
+    samplers.append({"magFilter": NEAREST, "minFilter": NEAREST, "wrapS": CLAMP_TO_EDGE, "wrapT": CLAMP_TO_EDGE})
+    new_images = {}
+    texture_indices = []
+    for suffix, png in zip(('base_color', 'metallic_roughness'), palette_images(entries)):
+        images.append({"name": f"{PALETTE_NAME}_{suffix}", "mimeType": "image/png"})
+        new_images[len(images) - 1] = png
+        textures.append({"sampler": len(samplers) - 1, "source": len(images) - 1})
+        texture_indices.append(len(textures) - 1)
+
+    # New material list: canonical originals first, then one palette material per doubleSided value
+    new_materials = []
+    material_remap = {}
+    for index, target in targets.items():
+        if target[0] == 'material' and target[1] == index:
+            material_remap[target] = len(new_materials)
+            new_materials.append(materials[index])
+    sidedness = sorted({t[1] for t in targets.values() if t[0] == 'palette'})
+    for double_sided in sidedness:
+        material_remap[('palette', double_sided)] = len(new_materials)
+        new_materials.append({
+            "name": f"{PALETTE_NAME}_double_sided" if double_sided and len(sidedness) > 1 else PALETTE_NAME,
+            "doubleSided": double_sided,
+            "pbrMetallicRoughness": {
+                "baseColorTexture": {"index": texture_indices[0]},
+                "metallicRoughnessTexture": {"index": texture_indices[1]},
+            },
+        })
+
+    for mesh in gltf.get('meshes', []):
+        groups = {}
+        kept = []
+        for primitive in mesh.get('primitives', []):
+            if (primitive.get('mode', MODE_TRIANGLES) != MODE_TRIANGLES or 'indices' not in primitive
+                    or primitive.get('targets') or 'material' not in primitive):
+                kept.append(primitive)
+                continue
+
+            target = targets[primitive['material']]
+            attributes = {
+                name: accessor_array(gltf, bin_chunk, index)
+                for name, index in primitive['attributes'].items()
+                if not (target[0] == 'palette' and name.startswith('TEXCOORD_'))
+            }
+            if target[0] == 'palette':
+                # Texel centre as normalized uint16: half the bytes of float UVs, exact enough for NEAREST
+                u = round((target[2] + 0.5) / len(entries) * 65535)
+                attributes['TEXCOORD_0'] = np.tile(np.array([[u, 32768]], dtype=np.uint16), (len(attributes['POSITION']), 1))
+                group_key = ('palette', target[1])
+            else:
+                group_key = target
+
+            signature = tuple(sorted(
+                (name, array.dtype.str, array.shape[1],
+                 name in primitive['attributes'] and bool(gltf['accessors'][primitive['attributes'][name]].get('normalized')))
+                for name, array in attributes.items()
+            ))
+            triangles = accessor_array(gltf, bin_chunk, primitive['indices']).astype(np.int64).reshape(-1, 3)
+            groups.setdefault((group_key, signature), []).append((primitive, attributes, triangles))
+
+        merged = []
+        for (group_key, _), members in groups.items():
+            offsets = np.cumsum([0] + [len(m[1]['POSITION']) for m in members[:-1]])
+            attributes = {
+                name: np.concatenate([m[1][name] for m in members])
+                for name in members[0][1]
+            }
+            triangles = np.concatenate([m[2] + offset for m, offset in zip(members, offsets)])
+            primitive = {key: value for key, value in members[0][0].items() if key not in ('attributes', 'indices')}
+            primitive['attributes'], primitive['indices'] = add_geometry(
+                gltf, data, members[0][0]['attributes'], attributes, triangles
+            )
+            primitive['material'] = material_remap[group_key]
+            merged.append(primitive)
+
+        for primitive in kept:
+            if 'material' in primitive:
+                target = targets[primitive['material']]
+                primitive['material'] = material_remap[('palette', target[1]) if target[0] == 'palette' else target]
+        mesh['primitives'] = merged + kept
+
+    gltf['materials'] = new_materials
+    bin_chunk = compact_accessors(gltf, data, bin_chunk, new_images)
+
+    report = {
+        "materials_before": len(materials),
+        "materials_after": len(new_materials),
+        "palette_entries": len(entries),
+        "draw_calls_before": primitives_before,
+        "draw_calls_after": sum(len(m.get('primitives', [])) for m in gltf.get('meshes', [])),
+    }
+    return bin_chunk, report
+
+
+def palette_glb(glb_path, output_path=None):
+    """Collapse a GLB's flat materials in place (or to output_path); returns the report"""
+    output_path = output_path or glb_path
+    gltf, bin_chunk = read_glb(glb_path)
+    bin_chunk, report = palette_gltf(gltf, bin_chunk)
+    write_glb(output_path, gltf, bin_chunk)
+    return report
+
+
+def print_report(glb_path, report):
+    """Print material and draw-call counts before and after"""
+    print(f"[Palette] {Path(glb_path).name}")
+    if report is None:
+        print("  ⊘ No flat materials to collapse")
+        return
+    print(f"  ✓ {report['materials_before']} → {report['materials_after']} material(s), "
+          f"{report['palette_entries']} palette colour(s)")
+    print(f"  ✓ {report['draw_calls_before']} → {report['draw_calls_after']} draw call(s)")
+
+
+def main():
+    """Main execution"""
+    parser = argparse.ArgumentParser(
+        description='Collapse flat-colour materials into a palette texture and merge primitives'
+    )
+    parser.add_argument('glb', help='GLB file to process')
+    parser.add_argument('--output', help='Output path (default: rewrite in place)')
+
+    args = parser.parse_args()
+
+    if not Path(args.glb).exists():
+        print(f"✗ Error: GLB file not found: {args.glb}")
+        sys.exit(1)
+
+    try:
+        report = palette_glb(args.glb, args.output)
+    except ValueError as e:
+        print(f"✗ Error: {e}")
+        sys.exit(1)
+
+    print_report(args.output or args.glb, report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Preload Planner
+Turns asset priority, size and scroll order into a byte-budgeted load schedule
+and writes matching <link rel=preload> hints into web/index.html
+Usage: python plan_preload.py --config assets/meta/asset-list.json
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+
+from build_scene_manifest import MANIFEST_NAME, build_manifest
+
+PLAN_VERSION = 1
+PLAN_NAME = "preload-plan.json"
+PRIORITY_RANK = {'high': 0, 'medium': 1, 'low': 2}
+
+DEFAULT_LOADING = {
+    "first_paint_budget_bytes": 2000000,
+    "idle_budget_bytes": 6000000,
+    "proximity_sections": 1
+}
+
+HINTS_START = "<!-- preload-hints:start -->"
+HINTS_END = "<!-- preload-hints:end -->"
+
+
+def load_json(path):
+    """Load a JSON file"""
+    with open(path) as f:
+        return json.load(f)
+
+
+def fetch_stages(entry):
+    """Files the site fetches for an asset, in order, as (path, bytes)
+
+    Mirrors ThreeScene.loadAsset: progressive assets fetch their stages,
+    everything else fetches the hash-versioned manifest URL.
+    """
+    stages = entry.get('progressive', {}).get('stages', [])
+    if stages:
+        return [(stage['file'], stage.get('fileSize', 0)) for stage in stages]
+    return [(entry.get('url', entry['file']), entry['bytes'])]
+
+
+def plan_schedule(asset_list, manifest, loading):
+    """Split completed assets into first-paint, idle and scroll-proximity tiers"""
+    sections = list(manifest.get('sections') or asset_list.get('sections', []))
+    section_rank = {section: i for i, section in enumerate(sections)}
+    priorities = {a['id']: a.get('priority', 'medium') for a in asset_list.get('assets', [])}
+    order = {asset_id: i for i, asset_id in enumerate(asset_list.get('generation_order', []))}
+
+    entries = sorted(
+        manifest['assets'],
+        key=lambda e: (
+            section_rank.get(e['section'], len(sections)),
+            PRIORITY_RANK.get(priorities.get(e['id']), len(PRIORITY_RANK)),
+            order.get(e['id'], len(order)),
+        )
+    )
+    entry_section = entries[0]['section'] if entries else None
+
+    first_paint, idle, proximity = [], [], []
+    first_paint_bytes = 0
+    idle_bytes = 0
+
+    for entry in entries:
+        stages = fetch_stages(entry)
+        rank = section_rank.get(entry['section'], len(sections))
+        base = {"id": entry['id'], "section": entry['section'], "priority": priorities.get(entry['id'])}
+
+        # Entry section blocks first paint; a progressive asset only needs its coarse stage
+        if entry['section'] == entry_section:
+            path, size = stages[0]
+            if first_paint_bytes + size <= loading['first_paint_budget_bytes'] or not first_paint:
+                first_paint.append({**base, "url": path, "bytes": size})
+                first_paint_bytes += size
+                stages = stages[1:]
+
+        for path, size in stages:
+            item = {**base, "url": path, "bytes": size}
+            if idle_bytes + size <= loading['idle_budget_bytes'] and priorities.get(entry['id']) != 'low':
+                idle.append(item)
+                idle_bytes += size
+            else:
+                # Fetch once the scroll position comes within N sections
+                trigger = sections[max(rank - loading['proximity_sections'], 0)] if sections else entry['section']
+                proximity.append({**item, "triggerSection": trigger})
+
+    return {
+        "version": PLAN_VERSION,
+        "budgets": {
+            "firstPaintBytes": loading['first_paint_budget_bytes'],
+            "idleBytes": loading['idle_budget_bytes']
+        },
+        "totals": {
+            "firstPaintBytes": first_paint_bytes,
+            "idleBytes": idle_bytes,
+            "proximityBytes": sum(item['bytes'] for item in proximity)
+        },
+        "firstPaint": first_paint,
+        "idle": idle,
+        "proximity": proximity
+    }
+
+
+def render_hints(plan):
+    """<link> hints: preload the manifest and first-paint payloads, prefetch idle ones"""
+    lines = [
+        f'<link rel="preload" href="/assets/meta/{MANIFEST_NAME}" as="fetch" type="application/json" crossorigin />'
+    ]
+    for item in plan['firstPaint']:
+        lines.append(f'<link rel="preload" href="/assets/{item["url"]}" as="fetch" type="model/gltf-binary" crossorigin />')
+    for item in plan['idle']:
+        lines.append(f'<link rel="prefetch" href="/assets/{item["url"]}" as="fetch" type="model/gltf-binary" crossorigin />')
+    return lines
+
+
+def write_html_hints(index_path, hint_lines):
+    """Replace the marked hint block in index.html (inserted before </head> on first run)"""
+    html = index_path.read_text()
+    indent = "    "
+    block = "\n".join([HINTS_START] + hint_lines + [HINTS_END])
+    block = block.replace("\n", "\n" + indent)
+
+    pattern = re.compile(re.escape(HINTS_START) + r".*?" + re.escape(HINTS_END), re.S)
+    if pattern.search(html):
+        html = pattern.sub(lambda _: block, html)
+    elif "  </head>" in html:
+        html = html.replace("  </head>", f"{indent}{block}\n  </head>", 1)
+    else:
+        raise ValueError(f"No </head> in {index_path}")
+
+    index_path.write_text(html)
+
+
+def main():
+    """Main execution"""
+    parser = argparse.ArgumentParser(
+        description='Plan byte-budgeted asset preloading and write preload hints'
+    )
+    parser.add_argument(
+        '--config',
+        default='assets/meta/asset-list.json',
+        help='Path to asset-list.json'
+    )
+    parser.add_argument(
+        '--html',
+        default='web/index.html',
+        help='HTML entry point to receive <link> hints'
+    )
+    parser.add_argument(
+        '--no-html',
+        action='store_true',
+        help='Only write the plan JSON'
+    )
+
+    args = parser.parse_args()
+
+    script_dir = Path(__file__).parent.absolute()
+    project_root = script_dir.parent.parent
+    config_path = project_root / args.config
+    assets_dir = project_root / "assets"
+    meta_dir = assets_dir / "meta"
+
+    if not config_path.exists():
+        print(f"✗ Error: Config file not found: {config_path}")
+        sys.exit(1)
+
+    asset_list = load_json(config_path)
+    style_path = meta_dir / "style-guide.json"
+    style = load_json(style_path) if style_path.exists() else {}
+    loading = {**DEFAULT_LOADING, **style.get('loading', {})}
+
+    try:
+        manifest = build_manifest(asset_list, meta_dir, assets_dir)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"✗ Error: {e}")
+        sys.exit(1)
+
+    plan = plan_schedule(asset_list, manifest, loading)
+
+    plan_path = meta_dir / PLAN_NAME
+    with open(plan_path, 'w') as f:
+        json.dump(plan, f, indent=2)
+
+    print(f"\n{'='*70}")
+    print("Preload Plan")
+    print(f"{'='*70}")
+    for tier, key in (("First paint", 'firstPaint'), ("Idle prefetch", 'idle'), ("Scroll proximity", 'proximity')):
+        items = plan[key]
+        total = sum(item['bytes'] for item in items)
+        print(f"{tier}: {len(items)} file(s), {total / 1024:.1f} KB")
+        for item in items:
+            print(f"  - {item['url']} ({item['bytes'] / 1024:.1f} KB, {item['section']})")
+    print(f"{'='*70}")
+    print(f"✓ Plan: {plan_path}")
+
+    if not args.no_html:
+        index_path = project_root / args.html
+        try:
+            write_html_hints(index_path, render_hints(plan))
+        except (FileNotFoundError, ValueError) as e:
+            print(f"✗ Error: {e}")
+            sys.exit(1)
+        print(f"✓ Preload hints: {index_path}")
+
+    if plan['totals']['firstPaintBytes'] > loading['first_paint_budget_bytes']:
+        print("⚠ Entry section exceeds the first-paint budget; consider --progressive packaging")
+
+
+if __name__ == "__main__":
+    main()
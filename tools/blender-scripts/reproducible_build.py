@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Reproducible Build Helpers
+Normalizes timestamps, ordering and float formatting so identical inputs
+give byte-identical GLB and JSON, and checks that two builds match
+Usage: python reproducible_build.py --check --id station-home --section home
+       python reproducible_build.py --compare build-a/ build-b/
+"""
+
+import argparse
+import filecmp
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+from glb_utils import accessor_bytes, image_bytes, read_glb, rebuild_buffer, write_glb
+from optimize_glb import accessor_references, image_references, material_textures
+from scene_layout import layout_lock
+
+FLOAT_DIGITS = 7  # float32 carries ~7 significant digits
+
+
+def build_timestamp(reproducible=False):
+    """ISO timestamp for metadata; SOURCE_DATE_EPOCH (or the epoch) in reproducible builds"""
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    if epoch is not None:
+        return datetime.fromtimestamp(int(epoch), tz=timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    if reproducible:
+        return datetime.fromtimestamp(0, tz=timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    return datetime.now().isoformat()
+
+
+def round_floats(value, digits=FLOAT_DIGITS):
+    """Recursively round floats to a fixed number of significant digits"""
+    if isinstance(value, float):
+        return float(f"{value:.{digits}g}")
+    if isinstance(value, dict):
+        return {k: round_floats(v, digits) for k, v in value.items()}
+    if isinstance(value, list):
+        return [round_floats(v, digits) for v in value]
+    return value
+
+
+def write_metadata_json(path, metadata, reproducible=False):
+    """Write metadata JSON; reproducible builds get fixed float formatting and a trailing newline
+
+    The write is atomic and takes the layout lock, so it cannot interleave
+    with another job's update_scene_layout.
+    """
+    path = Path(path)
+    tmp_path = path.with_suffix('.tmp')
+    with layout_lock(path.parent):
+        with open(tmp_path, 'w') as f:
+            if reproducible:
+                json.dump(round_floats(metadata), f, indent=2)
+                f.write('\n')
+            else:
+                json.dump(metadata, f, indent=2)
+        os.replace(tmp_path, path)
+
+
+def first_use_order(count, uses):
+    """Indices 0..count-1 ordered by first appearance in uses, unused ones last"""
+    order = list(dict.fromkeys(index for index in uses if index is not None))
+    used = set(order)
+    return order + [index for index in range(count) if index not in used]
+
+
+def reorder(gltf, key, order):
+    """Reorder gltf[key] to order; returns {old index: new index}"""
+    if key in gltf:
+        gltf[key] = [gltf[key][i] for i in order]
+    return {old: new for new, old in enumerate(order)}
+
+
+def canonical_node_order(gltf):
+    """Nodes depth-first from the scene roots, roots and children sorted by name"""
+    nodes = gltf.get('nodes', [])
+
+    def by_name(indices):
+        return sorted(indices, key=lambda i: (nodes[i].get('name', ''), i))
+
+    order = []
+    seen = set()
+    stack = []
+    for scene in gltf.get('scenes', []):
+        stack.extend(reversed(by_name(scene.get('nodes', []))))
+        while stack:
+            index = stack.pop()
+            if index in seen:
+                continue
+            seen.add(index)
+            order.append(index)
+            stack.extend(reversed(by_name(nodes[index].get('children', []))))
+
+    return order + by_name(i for i in range(len(nodes)) if i not in seen)
+
+
+def canonicalize_gltf(gltf, bin_chunk):
+    """Put nodes, materials, textures, images, samplers, primitives, accessors and buffer views in a stable order
+
+    Nodes are walked depth-first from the scene roots with siblings
+    sorted by name, materials are sorted by name and primitives by
+    material, textures, images and samplers by first use from the
+    materials, and accessors by first use (meshes, then animations, skins
+    and instancing) so the layout no longer depends on Blender's
+    internal iteration order. Returns the new BIN chunk; gltf is updated
+    in place.
+    """
+    # Nodes depth-first by name
+    node_remap = reorder(gltf, 'nodes', canonical_node_order(gltf))
+    for scene in gltf.get('scenes', []):
+        scene['nodes'] = sorted(node_remap[i] for i in scene.get('nodes', []))
+    for node in gltf.get('nodes', []):
+        if 'children' in node:
+            node['children'] = sorted(node_remap[i] for i in node['children'])
+    for skin in gltf.get('skins', []):
+        skin['joints'] = [node_remap[i] for i in skin.get('joints', [])]
+        if 'skeleton' in skin:
+            skin['skeleton'] = node_remap[skin['skeleton']]
+    for animation in gltf.get('animations', []):
+        for channel in animation.get('channels', []):
+            target = channel.get('target', {})
+            if 'node' in target:
+                target['node'] = node_remap[target['node']]
+
+    # Materials by name
+    materials = gltf.get('materials', [])
+    material_order = sorted(range(len(materials)), key=lambda i: (materials[i].get('name', ''), i))
+    material_remap = {old: new for new, old in enumerate(material_order)}
+    gltf['materials'] = [materials[i] for i in material_order]
+
+    for mesh in gltf.get('meshes', []):
+        for primitive in mesh.get('primitives', []):
+            if 'material' in primitive:
+                primitive['material'] = material_remap[primitive['material']]
+        mesh['primitives'] = sorted(
+            mesh.get('primitives', []),
+            key=lambda p: p.get('material', -1)
+        )
+
+    # Textures by first use from the materials, then images and samplers by first use from the textures
+    texture_infos = [info for material in gltf['materials'] for info in material_textures(material)]
+    texture_remap = reorder(gltf, 'textures', first_use_order(
+        len(gltf.get('textures', [])), [info['index'] for info in texture_infos]
+    ))
+    for info in texture_infos:
+        info['index'] = texture_remap[info['index']]
+
+    images = {i: image_bytes(gltf, bin_chunk, i) for i in range(len(gltf.get('images', [])))}
+    image_remap = reorder(gltf, 'images', first_use_order(
+        len(gltf.get('images', [])), [container[key] for container, key in image_references(gltf)]
+    ))
+    for container, key in list(image_references(gltf)):
+        container[key] = image_remap[container[key]]
+    images = {image_remap[i]: b for i, b in images.items() if b is not None}
+
+    sampler_remap = reorder(gltf, 'samplers', first_use_order(
+        len(gltf.get('samplers', [])), [texture.get('sampler') for texture in gltf.get('textures', [])]
+    ))
+    for texture in gltf.get('textures', []):
+        if 'sampler' in texture:
+            texture['sampler'] = sampler_remap[texture['sampler']]
+
+    # Accessors by first reference
+    accessors = gltf.get('accessors', [])
+    data = [accessor_bytes(gltf, bin_chunk, i) for i in range(len(accessors))]
+
+    for mesh in gltf.get('meshes', []):
+        for primitive in mesh.get('primitives', []):
+            primitive['attributes'] = dict(sorted(primitive.get('attributes', {}).items()))
+            if 'targets' in primitive:
+                primitive['targets'] = [dict(sorted(target.items())) for target in primitive['targets']]
+
+    order = first_use_order(len(accessors), [container[key] for container, key in accessor_references(gltf)])
+    remap = {old: new for new, old in enumerate(order)}
+    gltf['accessors'] = [accessors[i] for i in order]
+    data = [data[i] for i in order]
+    for container, key in list(accessor_references(gltf)):
+        container[key] = remap[container[key]]
+
+    return rebuild_buffer(gltf, data, images)
+
+
+def canonicalize_glb(glb_path):
+    """Rewrite a GLB in canonical order with fixed float formatting; returns its size"""
+    gltf, bin_chunk = read_glb(glb_path)
+    bin_chunk = canonicalize_gltf(gltf, bin_chunk)
+    rounded = round_floats(gltf)
+
+    # Accessor bounds must match the data exactly (three.js culls with them); they
+    # are computed from the buffer, so they are deterministic without rounding
+    for accessor, source in zip(rounded.get('accessors', []), gltf.get('accessors', [])):
+        for key in ('min', 'max'):
+            if key in source:
+                accessor[key] = source[key]
+
+    return write_glb(glb_path, rounded, bin_chunk, sort_keys=True)
+
+
+def compare_outputs(dir_a, dir_b):
+    """Compare every GLB/JSON in two build directories; returns a list of differences"""
+    dir_a, dir_b = Path(dir_a), Path(dir_b)
+    names_a = {p.relative_to(dir_a) for p in dir_a.rglob('*') if p.suffix in ('.glb', '.json')}
+    names_b = {p.relative_to(dir_b) for p in dir_b.rglob('*') if p.suffix in ('.glb', '.json')}
+
+    differences = [f"only in {dir_a}: {name}" for name in sorted(names_a - names_b)]
+    differences += [f"only in {dir_b}: {name}" for name in sorted(names_b - names_a)]
+    for name in sorted(names_a & names_b):
+        if not filecmp.cmp(dir_a / name, dir_b / name, shallow=False):
+            differences.append(f"differs: {name}")
+
+    if not names_a and not names_b:
+        differences.append("no GLB or JSON outputs found")
+
+    return differences
+
+
+def run_build(generator, asset_id, section, output_dir, extra_args=()):
+    """Run one reproducible generator build into output_dir"""
+    cmd = [
+        "blender", "-b", "--factory-startup",
+        "-P", str(generator),
+        "--",
+        "--id", asset_id,
+        "--section", section,
+        "--output-dir", str(output_dir),
+        "--meta-dir", str(output_dir),
+        "--reproducible",
+        *extra_args
+    ]
+    print(f"Running: {' '.join(cmd)}")
+    env = {**os.environ, "SOURCE_DATE_EPOCH": os.environ.get("SOURCE_DATE_EPOCH", "0")}
+    subprocess.run(cmd, check=True, capture_output=True, text=True, env=env)
+
+
+def main():
+    """Main execution"""
+    parser = argparse.ArgumentParser(
+        description='Check that asset builds are byte-reproducible'
+    )
+    parser.add_argument('--check', action='store_true', help='Build twice and compare the outputs')
+    parser.add_argument('--compare', nargs=2, metavar='DIR', help='Compare two existing build directories')
+    parser.add_argument('--id', default='station-home', help='Asset ID for --check')
+    parser.add_argument('--section', default='home', help='Section for --check')
+    parser.add_argument('--generator', help='Generator script for --check')
+
+    args = parser.parse_args()
+
+    script_dir = Path(__file__).parent.absolute()
+
+    if args.compare:
+        differences = compare_outputs(*args.compare)
+    elif args.check:
+        generator = Path(args.generator) if args.generator else script_dir / "generate_cinematic_station.py"
+        with tempfile.TemporaryDirectory() as tmp:
+            builds = [Path(tmp) / "a", Path(tmp) / "b"]
+            try:
+                for build_dir in builds:
+                    run_build(generator, args.id, args.section, build_dir)
+            except FileNotFoundError:
+                print("✗ Error: Blender not found in PATH")
+                sys.exit(1)
+            except subprocess.CalledProcessError as e:
+                print(f"✗ Build failed with exit code {e.returncode}")
+                print(e.stdout)
+                print(e.stderr)
+                sys.exit(1)
+            differences = compare_outputs(*builds)
+    else:
+        parser.print_help()
+        sys.exit(1)
+
+    if differences:
+        print("✗ Builds are not byte-identical:")
+        for line in differences:
+            print(f"  - {line}")
+        sys.exit(1)
+
+    print("✓ Builds are byte-identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Scene Layout
+Computes asset bounds from exported GLBs, lays sections out along the
+scroll path and writes a BVH spatial index for culling and streaming
+Usage: python scene_layout.py --config assets/meta/asset-list.json
+"""
+
+import argparse
+import fcntl
+import json
+import os
+import sys
+from contextlib import contextmanager
+from math import sqrt
+from pathlib import Path
+
+from glb_utils import mesh_instances, read_accessor, read_glb, scene_bounds, transform_point
+
+INDEX_VERSION = 1
+INDEX_NAME = "spatial-index.json"
+LOCK_NAME = "scene-layout.lock"
+AXES = {'x': 0, 'y': 1, 'z': 2}
+
+DEFAULT_LAYOUT = {
+    "scroll_axis": "x",
+    "section_gap": 6.0,
+    "default_extent": 24.0
+}
+
+
+def load_json(path):
+    """Load a JSON file"""
+    with open(path) as f:
+        return json.load(f)
+
+
+@contextmanager
+def layout_lock(meta_dir):
+    """Exclusive flock on the metadata directory, held by every metadata writer
+
+    Concurrent jobs each rewrite all metadata in update_scene_layout, so the
+    read-modify-write has to be serialized with them and with generators
+    writing their own metadata.
+    """
+    meta_dir = Path(meta_dir)
+    meta_dir.mkdir(parents=True, exist_ok=True)
+    with open(meta_dir / LOCK_NAME, 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def write_json(path, data):
+    """Write JSON atomically so readers never see a half-written file"""
+    path = Path(path)
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def compute_asset_bounds(glb_path):
+    """Axis-aligned box and bounding sphere of a GLB in its own space, or None"""
+    gltf, bin_chunk = read_glb(glb_path)
+    box = scene_bounds(gltf)
+    if box is None:
+        return None
+
+    lo, hi = box
+    center = [(lo[i] + hi[i]) / 2 for i in range(3)]
+
+    # Sphere around the box center, tightened to the farthest actual vertex
+    radius_sq = 0.0
+    for _, world, mesh_index in mesh_instances(gltf):
+        for primitive in gltf['meshes'][mesh_index].get('primitives', []):
+            position = primitive.get('attributes', {}).get('POSITION')
+            if position is None:
+                continue
+            for vertex in read_accessor(gltf, bin_chunk, position):
+                p = transform_point(world, vertex)
+                d = (p[0] - center[0]) ** 2 + (p[1] - center[1]) ** 2 + (p[2] - center[2]) ** 2
+                radius_sq = max(radius_sq, d)
+
+    return {
+        "min": _rounded(lo),
+        "max": _rounded(hi),
+        "center": _rounded(center),
+        "radius": round(sqrt(radius_sq), 4)
+    }
+
+
+def layout_sections(asset_list, bounds_by_id, layout):
+    """Position each asset along the scroll axis so section extents never overlap
+
+    The first section is centered on the origin; each following section
+    starts section_gap after the previous one ends. Assets without bounds
+    reserve default_extent.
+    """
+    axis = AXES[layout.get('scroll_axis', 'x')]
+    gap = layout.get('section_gap', DEFAULT_LAYOUT['section_gap'])
+    default_extent = layout.get('default_extent', DEFAULT_LAYOUT['default_extent'])
+
+    assets = asset_list.get('assets', [])
+    sections = list(asset_list.get('sections', []))
+    for asset in assets:
+        if asset['section'] not in sections:
+            sections.append(asset['section'])
+
+    # Widest asset in each section sets the slot width
+    extents = {}
+    for asset in assets:
+        bounds = bounds_by_id.get(asset['id'])
+        extent = bounds['max'][axis] - bounds['min'][axis] if bounds else default_extent
+        extents[asset['section']] = max(extents.get(asset['section'], 0.0), extent)
+
+    slot_centers = {}
+    cursor = None
+    for section in sections:
+        if section not in extents:
+            continue
+        extent = extents[section]
+        if cursor is None:
+            cursor = -extent / 2
+        slot_centers[section] = cursor + extent / 2
+        cursor += extent + gap
+
+    positions = {}
+    for asset in assets:
+        bounds = bounds_by_id.get(asset['id'])
+        local_center = bounds['center'][axis] if bounds else 0.0
+        position = [0.0, 0.0, 0.0]
+        position[axis] = round(slot_centers[asset['section']] - local_center, 4)
+        positions[asset['id']] = position
+
+    return positions
+
+
+def world_bounds(bounds, position, scale=(1.0, 1.0, 1.0), rotation=(0, 0, 0)):
+    """Place local bounds in the world; rotated assets fall back to their sphere"""
+    scale_max = max(abs(s) for s in scale)
+    center = [bounds['center'][i] * scale[i] + position[i] for i in range(3)]
+    radius = bounds['radius'] * scale_max
+
+    if any(rotation):
+        lo = [center[i] - radius for i in range(3)]
+        hi = [center[i] + radius for i in range(3)]
+    else:
+        corners = [bounds['min'][i] * scale[i] + position[i] for i in range(3)], \
+                  [bounds['max'][i] * scale[i] + position[i] for i in range(3)]
+        lo = [min(corners[0][i], corners[1][i]) for i in range(3)]
+        hi = [max(corners[0][i], corners[1][i]) for i in range(3)]
+
+    return {"min": _rounded(lo), "max": _rounded(hi), "center": _rounded(center), "radius": round(radius, 4)}
+
+
+def build_bvh(items, max_leaf_size=1):
+    """Build a flat BVH over (asset_id, world_bounds) items
+
+    Nodes are stored in a list with the root at index 0. Inner nodes carry
+    'left'/'right' child indices, leaves carry 'assets'.
+    """
+    nodes = []
+
+    def build(subset):
+        lo = [min(b['min'][i] for _, b in subset) for i in range(3)]
+        hi = [max(b['max'][i] for _, b in subset) for i in range(3)]
+        index = len(nodes)
+        nodes.append({"min": _rounded(lo), "max": _rounded(hi)})
+
+        if len(subset) <= max_leaf_size:
+            nodes[index]["assets"] = [asset_id for asset_id, _ in subset]
+            return index
+
+        # Median split along the axis with the widest spread of centers
+        spreads = [
+            max(b['center'][i] for _, b in subset) - min(b['center'][i] for _, b in subset)
+            for i in range(3)
+        ]
+        axis = spreads.index(max(spreads))
+        ordered = sorted(subset, key=lambda item: (item[1]['center'][axis], item[0]))
+        middle = len(ordered) // 2
+
+        nodes[index]["left"] = build(ordered[:middle])
+        nodes[index]["right"] = build(ordered[middle:])
+        return index
+
+    if items:
+        build(list(items))
+
+    return nodes
+
+
+def update_scene_layout(project_root, config_path=None):
+    """Recompute bounds and positions for every asset and write the spatial index
+
+    config_path defaults to assets/meta/asset-list.json. Holds the layout
+    lock throughout, so concurrent generators update one at a time.
+    """
+    with layout_lock(project_root / "assets" / "meta"):
+        return _update_scene_layout(project_root, config_path)
+
+
+def _update_scene_layout(project_root, config_path):
+    assets_dir = project_root / "assets"
+    meta_dir = assets_dir / "meta"
+
+    asset_list = load_json(config_path or meta_dir / "asset-list.json")
+    style_path = meta_dir / "style-guide.json"
+    style = load_json(style_path) if style_path.exists() else {}
+    layout = {**DEFAULT_LAYOUT, **style.get('layout', {})}
+
+    # Bounds come from the exported GLB, never from hardcoded extents
+    metadata_by_id = {}
+    bounds_by_id = {}
+    for asset in asset_list.get('assets', []):
+        meta_path = meta_dir / f"{asset['id']}.json"
+        if not meta_path.exists():
+            continue
+        metadata = load_json(meta_path)
+        metadata_by_id[asset['id']] = metadata
+
+        glb_path = assets_dir / metadata.get('file', '')
+        if glb_path.is_file():
+            bounds = compute_asset_bounds(glb_path)
+            if bounds:
+                bounds_by_id[asset['id']] = bounds
+
+    positions = layout_sections(asset_list, bounds_by_id, layout)
+
+    index_assets = {}
+    for asset_id, metadata in metadata_by_id.items():
+        metadata['position'] = positions[asset_id]
+        bounds = bounds_by_id.get(asset_id)
+        if bounds:
+            metadata['bounds'] = bounds
+            index_assets[asset_id] = {
+                "section": metadata.get('section'),
+                **world_bounds(
+                    bounds,
+                    metadata['position'],
+                    metadata.get('scale', [1.0, 1.0, 1.0]),
+                    metadata.get('rotation', [0, 0, 0])
+                )
+            }
+
+        write_json(meta_dir / f"{asset_id}.json", metadata)
+
+    index = {
+        "version": INDEX_VERSION,
+        "layout": {
+            "scrollAxis": layout['scroll_axis'],
+            "sectionGap": layout['section_gap']
+        },
+        "assets": index_assets,
+        "nodes": build_bvh(sorted(index_assets.items()))
+    }
+
+    index_path = meta_dir / INDEX_NAME
+    write_json(index_path, index)
+
+    for asset_id, position in positions.items():
+        if asset_id in metadata_by_id:
+            print(f"  {asset_id}: position {position}")
+    print(f"✓ Spatial index: {index_path} ({len(index_assets)} asset(s))")
+
+    return index
+
+
+def _rounded(values):
+    return [round(v, 4) for v in values]
+
+
+def main():
+    """Main execution"""
+    parser = argparse.ArgumentParser(
+        description='Compute asset bounds, section layout and the BVH spatial index'
+    )
+    parser.add_argument(
+        '--config',
+        default='assets/meta/asset-list.json',
+        help='Path to asset-list.json'
+    )
+
+    args = parser.parse_args()
+
+    script_dir = Path(__file__).parent.absolute()
+    project_root = script_dir.parent.parent
+    config_path = project_root / args.config
+
+    if not config_path.exists():
+        print(f"✗ Error: Config file not found: {config_path}")
+        sys.exit(1)
+
+    try:
+        update_scene_layout(project_root, config_path)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"✗ Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,517 @@
+#!/usr/bin/env python3
+"""
+GLB Simplifier
+Blender-free quadric error metric (QEM) decimation of GLB meshes with NumPy;
+UV/normal seams and material boundaries are preserved
+Usage: python simplify_glb.py assets/models/station-home.glb --ratios 0.5,0.25
+       python simplify_glb.py in.glb --ratios 0.3 --output out.glb
+       python simplify_glb.py in.glb --ratios 0.5,0.25 --check
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from glb_utils import (
+    MODE_TRIANGLES,
+    TYPE_COMPONENTS,
+    accessor_bytes,
+    image_bytes,
+    read_glb,
+    rebuild_buffer,
+    write_glb,
+)
+from optimize_glb import accessor_references
+
+NUMPY_DTYPES = {
+    5120: np.int8,
+    5121: np.uint8,
+    5122: np.int16,
+    5123: np.uint16,
+    5125: np.uint32,
+    5126: np.float32,
+}
+
+COMPONENT_TYPES = {dtype: component for component, dtype in NUMPY_DTYPES.items()}
+
+# Integer data for these semantics is only valid normalized
+NORMALIZED_SEMANTICS = ('TEXCOORD_', 'COLOR_', 'WEIGHTS_')
+
+# Reject collapses that turn a triangle normal by more than ~78 degrees
+MIN_NORMAL_DOT = 0.2
+
+# Fraction of the remaining reduction attempted per batch before costs are refreshed
+BATCH_FRACTION = 0.5
+
+# --check: simplified triangle centroids sampled per primitive, and how far
+# (as a fraction of the primitive's bounding box diagonal) they may sit off
+# the source surface
+CHECK_SAMPLES = 128
+SURFACE_TOLERANCE = 0.02
+
+
+def accessor_array(gltf, bin_chunk, accessor_index):
+    """Accessor data as a (count, components) NumPy array"""
+    accessor = gltf['accessors'][accessor_index]
+    data = accessor_bytes(gltf, bin_chunk, accessor_index)
+    dtype = NUMPY_DTYPES[accessor['componentType']]
+    components = TYPE_COMPONENTS[accessor['type']]
+    if data is None:
+        return np.zeros((accessor['count'], components), dtype=dtype)
+    return np.frombuffer(data, dtype=dtype).reshape(accessor['count'], components)
+
+
+def attribute_rows(attributes):
+    """Every attribute of each vertex as one row of raw bytes, in attribute order"""
+    count = len(next(iter(attributes.values())))
+    return np.concatenate(
+        [np.ascontiguousarray(a).view(np.uint8).reshape(count, -1) for a in attributes.values()],
+        axis=1
+    )
+
+
+def row_keys(rows):
+    """One comparable void scalar per byte row"""
+    rows = np.ascontiguousarray(rows)
+    return rows.view(np.dtype((np.void, rows.shape[1]))).ravel()
+
+
+def weld_vertices(attributes, triangles):
+    """Merge vertices whose every attribute is identical; returns (attributes, triangles)"""
+    rows = attribute_rows(attributes)
+    _, first, inverse = np.unique(rows, axis=0, return_index=True, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    # Welded vertices keep the order of their first occurrence
+    keep = np.sort(first)
+    new_index = np.searchsorted(keep, first)[inverse]
+    return {name: a[keep] for name, a in attributes.items()}, new_index[triangles]
+
+
+def locked_vertices(positions, triangles):
+    """Vertices that must not move: open borders, non-manifold edges and attribute seams
+
+    Returns (locked mask, position id per vertex). Seams are positions
+    shared by several distinct vertices (split normals, UVs or colours).
+    """
+    _, position_id = np.unique(positions, axis=0, return_inverse=True)
+    position_id = position_id.reshape(-1)
+
+    twins = np.bincount(position_id)
+    locked = twins[position_id] > 1
+
+    # Edges in position space used by exactly two triangles are manifold
+    p = position_id[triangles]
+    edges = np.concatenate([p[:, [0, 1]], p[:, [1, 2]], p[:, [2, 0]]])
+    edges = np.sort(edges, axis=1)
+    keys, uses = np.unique(edges[:, 0] * len(twins) + edges[:, 1], return_counts=True)
+    bad = keys[uses != 2]
+    bad_positions = np.zeros(len(twins), dtype=bool)
+    bad_positions[bad // len(twins)] = True
+    bad_positions[bad % len(twins)] = True
+    locked |= bad_positions[position_id]
+
+    return locked, position_id
+
+
+def cross(a, b):
+    """Row-wise cross product (np.cross is slow on the small arrays used per collapse)"""
+    return np.stack([
+        a[:, 1] * b[:, 2] - a[:, 2] * b[:, 1],
+        a[:, 2] * b[:, 0] - a[:, 0] * b[:, 2],
+        a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0],
+    ], axis=1)
+
+
+def triangle_quadrics(positions, triangles):
+    """Area-weighted plane quadric (4x4) for each triangle"""
+    p0, p1, p2 = (positions[triangles[:, i]] for i in range(3))
+    normals = cross(p1 - p0, p2 - p0)
+    doubled_area = np.linalg.norm(normals, axis=1)
+    safe = np.where(doubled_area > 0, doubled_area, 1.0)
+    planes = np.concatenate([normals / safe[:, None], -np.einsum('ij,ij->i', normals / safe[:, None], p0)[:, None]], axis=1)
+    return np.einsum('ni,nj->nij', planes, planes) * (doubled_area / 2)[:, None, None]
+
+
+def vertex_triangles(triangles, vertex_count):
+    """CSR adjacency: triangles around each vertex as (order, starts)"""
+    flat = triangles.ravel()
+    order = np.argsort(flat, kind='stable')
+    starts = np.searchsorted(flat[order], np.arange(vertex_count + 1))
+    return order // 3, starts
+
+
+def simplify_triangles(positions, triangles, locked, position_id, target):
+    """Greedy batched half-edge collapses until the triangle count reaches target
+
+    Each batch ranks every collapsible half-edge (u -> v, u unlocked) by
+    quadric error at v, then applies the cheapest ones that touch disjoint
+    neighbourhoods, rejecting collapses that break the link condition or
+    flip a triangle. Returns the surviving triangles.
+    """
+    positions = positions.astype(np.float64)
+    triangles = triangles.astype(np.int64).copy()
+    alive = np.ones(len(triangles), dtype=bool)
+
+    quadrics = np.zeros((position_id.max() + 1, 4, 4))
+    np.add.at(quadrics, position_id[triangles].ravel(),
+              np.repeat(triangle_quadrics(positions, triangles), 3, axis=0))
+
+    while alive.sum() > target:
+        live = np.flatnonzero(alive)
+        t = triangles[live]
+
+        half_edges = np.concatenate([t[:, [0, 1]], t[:, [1, 2]], t[:, [2, 0]], t[:, [1, 0]], t[:, [2, 1]], t[:, [0, 2]]])
+        half_edges = half_edges[~locked[half_edges[:, 0]]]
+        if not len(half_edges):
+            break
+
+        # Unique on a packed 1-D key; np.unique(axis=0) is far slower
+        keys = np.unique(half_edges[:, 0] * len(positions) + half_edges[:, 1])
+        u, v = keys // len(positions), keys % len(positions)
+        q = quadrics[position_id[u]] + quadrics[position_id[v]]
+        vh = np.concatenate([positions[v], np.ones((len(v), 1))], axis=1)
+        cost = np.einsum('ni,nij,nj->n', vh, q, vh)
+        cost += 1e-9 * np.einsum('ij,ij->i', positions[u] - positions[v], positions[u] - positions[v])
+
+        tri_of, starts = vertex_triangles(triangles, len(positions))
+        touched = np.zeros(len(positions), dtype=bool)
+        goal = max(int((alive.sum() - target) * BATCH_FRACTION), 1)
+        removed = 0
+
+        for index in np.argsort(cost, kind='stable'):
+            a, b = u[index], v[index]
+            if touched[a] or touched[b]:
+                continue
+
+            around_a = tri_of[starts[a]:starts[a + 1]]
+            around_a = around_a[alive[around_a]]
+            around_b = tri_of[starts[b]:starts[b + 1]]
+            around_b = around_b[alive[around_b]]
+            shared_mask = (triangles[around_a] == b).any(axis=1)
+            shared = around_a[shared_mask]
+            moving = around_a[~shared_mask]
+            if not len(shared):
+                continue
+
+            # Link condition: u and v may only share the vertices opposite their common edge
+            ring_a = set(triangles[around_a].ravel().tolist())
+            ring_b = set(triangles[around_b].ravel().tolist())
+            if len(ring_a & ring_b) - 2 > len(shared):
+                continue
+
+            # Flip check on the triangles that move with u
+            if len(moving):
+                corners = triangles[moving]
+                before = positions[corners]
+                after = before.copy()
+                after[corners == a] = positions[b]
+                n_before = cross(before[:, 1] - before[:, 0], before[:, 2] - before[:, 0])
+                n_after = cross(after[:, 1] - after[:, 0], after[:, 2] - after[:, 0])
+                dots = (n_before * n_after).sum(axis=1)
+                norms = np.sqrt((n_before * n_before).sum(axis=1) * (n_after * n_after).sum(axis=1))
+                if (norms == 0).any() or (dots < MIN_NORMAL_DOT * norms).any():
+                    continue
+
+                corners[corners == a] = b
+                triangles[moving] = corners
+
+            alive[shared] = False
+            quadrics[position_id[b]] += quadrics[position_id[a]]
+            touched[list(ring_a | ring_b)] = True
+
+            removed += len(shared)
+            if removed >= goal:
+                break
+
+        if removed == 0:
+            break
+
+    return triangles[alive]
+
+
+def simplify_primitive(gltf, bin_chunk, primitive, ratio):
+    """Simplify one primitive; returns (attributes dict, triangles) or None if skipped"""
+    if primitive.get('mode', MODE_TRIANGLES) != MODE_TRIANGLES or 'indices' not in primitive:
+        return None
+    if primitive.get('targets') or 'JOINTS_0' in primitive.get('attributes', {}):
+        return None  # Morph targets and skins would need their own quadrics
+
+    attributes = {
+        name: accessor_array(gltf, bin_chunk, index)
+        for name, index in primitive['attributes'].items()
+    }
+    triangles = accessor_array(gltf, bin_chunk, primitive['indices']).astype(np.int64).reshape(-1, 3)
+
+    attributes, triangles = weld_vertices(attributes, triangles)
+    positions = attributes['POSITION']
+    locked, position_id = locked_vertices(positions, triangles)
+
+    target = max(int(len(triangles) * ratio), 1)
+    triangles = simplify_triangles(positions, triangles, locked, position_id, target)
+
+    # Drop vertices no surviving triangle uses
+    used, triangles = np.unique(triangles, return_inverse=True)
+    triangles = triangles.reshape(-1, 3)
+    return {name: a[used] for name, a in attributes.items()}, triangles
+
+
+def add_geometry(gltf, data, source_attributes, attributes, triangles):
+    """Append accessors for new vertex arrays and triangles; returns (attributes, indices)
+
+    Component type and element type follow each array's dtype and width;
+    normalization carries over from the accessor in source_attributes
+    the array was read from, and integer UVs, colours and weights are
+    always normalized as glTF requires.
+    """
+    accessors = gltf['accessors']
+    element_types = {components: name for name, components in TYPE_COMPONENTS.items() if name.startswith(('SCALAR', 'VEC'))}
+    attribute_indices = {}
+
+    for name, array in attributes.items():
+        accessor = {
+            "componentType": COMPONENT_TYPES[array.dtype.type],
+            "type": element_types[array.shape[1]],
+            "count": len(array),
+        }
+        integer_attribute = array.dtype.kind in 'iu' and name.startswith(NORMALIZED_SEMANTICS)
+        if integer_attribute or (name in source_attributes and accessors[source_attributes[name]].get('normalized')):
+            accessor['normalized'] = True
+        if name == 'POSITION':
+            accessor['min'] = array.min(axis=0).tolist()
+            accessor['max'] = array.max(axis=0).tolist()
+        accessors.append(accessor)
+        data.append(np.ascontiguousarray(array).tobytes())
+        attribute_indices[name] = len(accessors) - 1
+
+    index_type = 5123 if len(attributes['POSITION']) < 65536 else 5125
+    accessors.append({"componentType": index_type, "type": "SCALAR", "count": triangles.size})
+    data.append(triangles.astype(NUMPY_DTYPES[index_type]).tobytes())
+
+    return attribute_indices, len(accessors) - 1
+
+
+def compact_accessors(gltf, data, bin_chunk, new_images=None):
+    """Drop accessors nothing references and repack the buffer; returns the new BIN chunk
+
+    new_images maps image index to bytes for images not yet in bin_chunk.
+    """
+    accessors = gltf['accessors']
+    referenced = sorted({container[key] for container, key in accessor_references(gltf)})
+    remap = {old: new for new, old in enumerate(referenced)}
+    for container, key in list(accessor_references(gltf)):
+        container[key] = remap[container[key]]
+    gltf['accessors'] = [accessors[i] for i in referenced]
+    data = [data[i] for i in referenced]
+
+    new_images = new_images or {}
+    images = {
+        i: new_images[i] if i in new_images else image_bytes(gltf, bin_chunk, i)
+        for i in range(len(gltf.get('images', [])))
+    }
+    return rebuild_buffer(gltf, data, {i: b for i, b in images.items() if b is not None})
+
+
+def simplify_gltf(gltf, bin_chunk, ratio):
+    """Simplify every mesh primitive in place; returns (bin_chunk, triangles_before, triangles_after)"""
+    data = [accessor_bytes(gltf, bin_chunk, i) for i in range(len(gltf.get('accessors', [])))]
+    before = after = 0
+
+    for mesh in gltf.get('meshes', []):
+        for primitive in mesh.get('primitives', []):
+            result = simplify_primitive(gltf, bin_chunk, primitive, ratio)
+            if result is None:
+                continue
+            attributes, triangles = result
+
+            before += gltf['accessors'][primitive['indices']]['count'] // 3
+            after += len(triangles)
+
+            primitive['attributes'], primitive['indices'] = add_geometry(
+                gltf, data, primitive['attributes'], attributes, triangles
+            )
+
+    return compact_accessors(gltf, data, bin_chunk), before, after
+
+
+def simplify_glb(glb_path, output_path, ratio):
+    """Write a simplified copy of a GLB; returns (triangles_before, triangles_after, bytes)"""
+    gltf, bin_chunk = read_glb(glb_path)
+    bin_chunk, before, after = simplify_gltf(gltf, bin_chunk, ratio)
+    size = write_glb(output_path, gltf, bin_chunk)
+    return before, after, size
+
+
+def triangle_set(attributes, triangles):
+    """Triangles as sorted rows of vertex attribute bytes, each rotated to start at its smallest corner"""
+    unique_rows, vertex_id = np.unique(attribute_rows(attributes), axis=0, return_inverse=True)
+    corners = vertex_id.reshape(-1)[triangles]
+    shift = np.argmin(corners, axis=1)
+    rotated = corners[np.arange(len(corners))[:, None], (shift[:, None] + np.arange(3)) % 3]
+    return np.sort(row_keys(unique_rows[rotated].reshape(len(rotated), -1)))
+
+
+def surface_distances(points, positions, triangles, chunk=64):
+    """Distance from each point to the nearest triangle of a mesh"""
+    a, b, c = (positions[triangles[:, i]].astype(np.float64) for i in range(3))
+    ab, ac, bc = b - a, c - a, c - b
+    normals = cross(ab, ac)
+    normal_lengths = np.linalg.norm(normals, axis=1)
+    unit = normals / np.where(normal_lengths > 0, normal_lengths, 1.0)[:, None]
+
+    def segment(p, start, edge):
+        length = np.maximum(np.einsum('ij,ij->i', edge, edge), 1e-30)
+        t = np.clip(np.einsum('pij,ij->pi', p - start, edge) / length, 0, 1)
+        return np.linalg.norm(p - start - t[..., None] * edge, axis=2)
+
+    distances = []
+    for first in range(0, len(points), chunk):
+        p = points[first:first + chunk, None, :].astype(np.float64)
+        # Inside the prism over a triangle the distance is to its plane, else to its nearest edge
+        plane = np.einsum('pij,ij->pi', p - a, unit)
+        foot = p - plane[..., None] * unit
+        inside = (
+            (np.einsum('pij,ij->pi', cross_rows(ab, foot - a), unit) >= 0)
+            & (np.einsum('pij,ij->pi', cross_rows(bc, foot - b), unit) >= 0)
+            & (np.einsum('pij,ij->pi', cross_rows(-ac, foot - c), unit) >= 0)
+            & (normal_lengths > 0)
+        )
+        edges = np.minimum(np.minimum(segment(p, a, ab), segment(p, b, bc)), segment(p, a, ac))
+        distances.append(np.where(inside, np.abs(plane), edges).min(axis=1))
+    return np.concatenate(distances) if distances else np.zeros(0)
+
+
+def cross_rows(edge, vectors):
+    """Cross product of each triangle edge with per-point vectors of shape (points, triangles, 3)"""
+    return np.stack([
+        edge[:, 1] * vectors[..., 2] - edge[:, 2] * vectors[..., 1],
+        edge[:, 2] * vectors[..., 0] - edge[:, 0] * vectors[..., 2],
+        edge[:, 0] * vectors[..., 1] - edge[:, 1] * vectors[..., 0],
+    ], axis=-1)
+
+
+def check_primitive(gltf, bin_chunk, primitive, ratio):
+    """Check one primitive's simplification; returns (passed, message) or None if skipped
+
+    At ratio 1.0 the output must hold exactly the source triangles; below
+    it, sampled output triangle centroids must lie on the source surface.
+    """
+    result = simplify_primitive(gltf, bin_chunk, primitive, ratio)
+    if result is None:
+        return None
+    attributes, triangles = result
+
+    source = {
+        name: accessor_array(gltf, bin_chunk, index)
+        for name, index in primitive['attributes'].items()
+    }
+    source_triangles = accessor_array(gltf, bin_chunk, primitive['indices']).astype(np.int64).reshape(-1, 3)
+
+    if ratio >= 1.0:
+        same = bool(np.array_equal(triangle_set(source, source_triangles), triangle_set(attributes, triangles)))
+        return same, f"{len(triangles):,} triangles {'identical to' if same else 'differ from'} the source"
+
+    # Collapses only remove vertices, so every survivor must be a source vertex unchanged
+    if not np.isin(row_keys(attribute_rows(attributes)), row_keys(attribute_rows(source))).all():
+        return False, f"{len(triangles):,} triangles, vertex attributes not found in the source"
+
+    positions = source['POSITION'].astype(np.float64)
+    diagonal = np.linalg.norm(positions.max(axis=0) - positions.min(axis=0)) or 1.0
+    step = max(len(triangles) // CHECK_SAMPLES, 1)
+    centroids = attributes['POSITION'][triangles[::step]].astype(np.float64).mean(axis=1)
+    error = surface_distances(centroids, positions, source_triangles).max() / diagonal
+    return bool(error <= SURFACE_TOLERANCE), f"{len(triangles):,} triangles, max surface error {error:.2%} of the diagonal"
+
+
+def check_glb(glb_path, ratio):
+    """Simplify in memory and check every primitive; returns [(mesh name, passed, message)]"""
+    gltf, bin_chunk = read_glb(glb_path)
+    results = []
+    for mesh_index, mesh in enumerate(gltf.get('meshes', [])):
+        for primitive in mesh.get('primitives', []):
+            checked = check_primitive(gltf, bin_chunk, primitive, ratio)
+            if checked is not None:
+                results.append((mesh.get('name', f"mesh {mesh_index}"), *checked))
+    return results
+
+
+def lod_path(glb_path, level):
+    """Output path for LOD level n next to the source GLB"""
+    glb_path = Path(glb_path)
+    return glb_path.with_name(f"{glb_path.stem}.lod{level}.glb")
+
+
+def check(glb_path, ratios):
+    """Print check results for each ratio; exit 1 if any primitive fails"""
+    print(f"\n{'='*70}")
+    print(f"Checking simplification: {glb_path.name}")
+    print(f"{'='*70}")
+
+    all_passed = True
+    for ratio in ratios:
+        print(f"[Ratio {ratio:g}]")
+        for name, passed, message in check_glb(glb_path, ratio):
+            all_passed = all_passed and passed
+            print(f"  {'✓' if passed else '✗'} {name}: {message}")
+
+    print(f"{'='*70}")
+    if not all_passed:
+        sys.exit(1)
+
+
+def main():
+    """Main execution"""
+    parser = argparse.ArgumentParser(
+        description='Simplify GLB meshes with quadric error metrics (no Blender required)'
+    )
+    parser.add_argument('glb', help='Source GLB')
+    parser.add_argument('--ratios', default='0.5', help='Comma-separated target triangle ratios (default: 0.5)')
+    parser.add_argument('--output', help='Output path (single ratio only; default: <name>.lod<n>.glb)')
+    parser.add_argument('--check', action='store_true',
+                        help='Write nothing; check that 1.0 reproduces the source and the ratios stay on its surface')
+
+    args = parser.parse_args()
+
+    glb_path = Path(args.glb)
+    if not glb_path.exists():
+        print(f"✗ Error: GLB file not found: {glb_path}")
+        sys.exit(1)
+
+    try:
+        ratios = [float(r) for r in args.ratios.split(',')]
+    except ValueError:
+        print(f"✗ Error: Invalid --ratios: {args.ratios}")
+        sys.exit(1)
+    if any(not 0 < r <= 1 for r in ratios):
+        print("✗ Error: Ratios must be in (0, 1]")
+        sys.exit(1)
+    if args.output and len(ratios) > 1:
+        print("✗ Error: --output takes a single ratio")
+        sys.exit(1)
+
+    if args.check:
+        check(glb_path, sorted(set(ratios) | {1.0}, reverse=True))
+        return
+
+    print(f"\n{'='*70}")
+    print(f"Simplifying: {glb_path.name}")
+    print(f"{'='*70}")
+
+    for level, ratio in enumerate(ratios, 1):
+        output_path = Path(args.output) if args.output else lod_path(glb_path, level)
+        start = time.perf_counter()
+        try:
+            before, after, size = simplify_glb(glb_path, output_path, ratio)
+        except ValueError as e:
+            print(f"✗ Error: {e}")
+            sys.exit(1)
+        print(f"✓ {output_path.name}: {before:,} → {after:,} triangles "
+              f"(target {ratio:.0%}), {size / 1024:.1f} KB, {time.perf_counter() - start:.2f}s")
+
+    print(f"{'='*70}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,12 @@ Usage: python validate_metadata.py assets/meta/station-home.json
 import json
 import sys
 from pathlib import Path
-import jsonschema
+
+from asset_budgets import check_asset_budget, load_budgets, measure_asset
+from glb_utils import mesh_instances, primitive_vertex_count, read_glb, triangle_indices
+
+# Vertices per triangle above this usually means split normals/UV seams
+SPLIT_VERTEX_RATIO = 1.0
 
 
 def load_schema(schema_path):
@@ -25,6 +30,9 @@ def load_metadata(metadata_path):
 
 def validate_metadata(metadata, schema):
     """Validate metadata against schema"""
+    # Imported here so --help and the other checks do not pay for it
+    import jsonschema
+
     errors = []
 
     try:
@@ -69,6 +77,81 @@ def check_filesize_matches(metadata, project_root):
     return True, None
 
 
+def check_budget(metadata, project_root, style):
+    """Check the asset's GLB files against the style guide download-size budgets"""
+    try:
+        report = measure_asset(metadata, project_root / 'assets', compressed=False)
+    except (FileNotFoundError, KeyError):
+        return True, None  # Already caught by file exists check
+
+    violations = check_asset_budget(report, load_budgets(style), metadata.get('category'))
+    if violations:
+        largest = max(
+            ((c, v) for c, v in report['breakdown'].items() if c != 'other'),
+            key=lambda item: item[1]
+        )
+        return False, f"{'; '.join(violations)} (largest buffer: {largest[0]} {largest[1] / 1024:.1f} KB)"
+
+    return True, None
+
+
+def count_glb_geometry(glb_path):
+    """Exact per-primitive triangle, degenerate-triangle and vertex counts from GLB index data"""
+    gltf, bin_chunk = read_glb(glb_path)
+    materials = gltf.get('materials', [])
+    primitives = []
+
+    for _, _, mesh_index in mesh_instances(gltf):
+        mesh = gltf['meshes'][mesh_index]
+        for primitive in mesh.get('primitives', []):
+            triangles = triangle_indices(gltf, bin_chunk, primitive)
+            material = materials[primitive['material']].get('name') if 'material' in primitive else None
+            primitives.append({
+                "name": f"{mesh.get('name', mesh_index)}/{material or '(default)'}",
+                "triangles": len(triangles),
+                "degenerate": sum(1 for a, b, c in triangles if a == b or b == c or a == c),
+                "vertices": primitive_vertex_count(gltf, primitive),
+            })
+
+    return {
+        "triangles": sum(p['triangles'] for p in primitives),
+        "degenerate": sum(p['degenerate'] for p in primitives),
+        "vertices": sum(p['vertices'] for p in primitives),
+        "primitives": primitives,
+    }
+
+
+def check_polycount_matches(metadata, geometry):
+    """Check metadata.polycount against the triangles actually in the GLB"""
+    polycount = metadata.get('metadata', {}).get('polycount')
+    if polycount is None:
+        return None, "Not recorded in metadata"
+    if polycount != geometry['triangles']:
+        return False, f"metadata={polycount:,}, GLB={geometry['triangles']:,} triangles"
+    return True, f"{polycount:,} triangles"
+
+
+def check_polycount_budget(category, geometry, style):
+    """Check GLB triangles against the style guide target_polycount for the category"""
+    target = style.get('geometry', {}).get('target_polycount', {}).get(category)
+    if target is None:
+        return None, f"No target_polycount for category '{category}'"
+    if geometry['triangles'] > target:
+        return False, f"{geometry['triangles']:,} triangles exceeds the {category} target of {target:,}"
+    return True, f"{geometry['triangles']:,} of {target:,} triangles"
+
+
+def asset_list_category(project_root, asset_id):
+    """Category an asset is planned under in asset-list.json, if listed"""
+    list_path = project_root / "assets" / "meta" / "asset-list.json"
+    if not list_path.exists():
+        return None
+    for asset in load_metadata(list_path).get('assets', []):
+        if asset.get('id') == asset_id:
+            return asset.get('category')
+    return None
+
+
 def main():
     """Main execution"""
     if len(sys.argv) < 2:
@@ -131,7 +214,44 @@ def main():
         checks.append(("✗", "File size matches", f"Failed: {error}"))
         all_passed = False
 
-    # 4. Required fields check
+    # 4. Download-size budget
+    style_path = project_root / "assets" / "meta" / "style-guide.json"
+    style = load_metadata(style_path) if style_path.exists() else {}
+    within, error = check_budget(metadata, project_root, style)
+    if within:
+        checks.append(("✓", "Within budget", "Passed"))
+    else:
+        checks.append(("✗", "Within budget", f"Failed: {error}"))
+        all_passed = False
+
+    # 5. Triangle counts read from the GLB
+    glb_path = project_root / 'assets' / metadata.get('file', '')
+    geometry = None
+    if glb_path.is_file():
+        try:
+            geometry = count_glb_geometry(glb_path)
+        except ValueError as e:
+            checks.append(("✗", "GLB geometry", f"Failed: {e}"))
+            all_passed = False
+
+    if geometry:
+        category = metadata.get('category')
+        if category not in style.get('geometry', {}).get('target_polycount', {}):
+            category = asset_list_category(project_root, metadata.get('id')) or category
+
+        for check_name, (ok, result) in (
+            ("Polycount matches", check_polycount_matches(metadata, geometry)),
+            ("Polycount budget", check_polycount_budget(category, geometry, style)),
+        ):
+            if ok is None:
+                checks.append(("⊘", check_name, result))
+            elif ok:
+                checks.append(("✓", check_name, result))
+            else:
+                checks.append(("✗", check_name, f"Failed: {result}"))
+                all_passed = False
+
+    # 6. Required fields check
     required_fields = ['id', 'category', 'file', 'section']
     missing_fields = [f for f in required_fields if f not in metadata]
 
@@ -160,6 +280,17 @@ def main():
         print(f"File size: {meta.get('fileSize', 0) / 1024:.1f} KB")
         print(f"Version: {meta.get('version', 'N/A')}")
 
+    if geometry:
+        ratio = geometry['vertices'] / geometry['triangles'] if geometry['triangles'] else 0
+        print(f"\nGLB triangles: {geometry['triangles']:,} "
+              f"({geometry['degenerate']:,} degenerate)")
+        print(f"GLB vertices: {geometry['vertices']:,} ({ratio:.2f} per triangle)")
+        for primitive in geometry['primitives']:
+            p_ratio = primitive['vertices'] / primitive['triangles'] if primitive['triangles'] else 0
+            flag = "  ⚠ split-vertex bloat" if p_ratio > SPLIT_VERTEX_RATIO else ""
+            print(f"  {primitive['name']}: {primitive['triangles']:,} tris, "
+                  f"{primitive['vertices']:,} verts ({p_ratio:.2f}){flag}")
+
     print(f"{'='*70}\n")
 
     if all_passed:
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Asset Watch Mode
+Keeps one Blender session warm, watches the style guide, asset list and
+generator scripts, and regenerates only the assets each change affects
+Usage: blender -b -P watch_assets.py -- [--generator generate_cinematic_station.py] [--id station-home]
+"""
+
+import argparse
+import ast
+import importlib
+import importlib.util
+import json
+import sys
+import time
+import traceback
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent.absolute()
+PROJECT_ROOT = SCRIPT_DIR.parent.parent
+META_DIR = PROJECT_ROOT / "assets" / "meta"
+
+# Blender does not put the script directory on sys.path
+sys.path.insert(0, str(SCRIPT_DIR))
+
+# Pure-Python helpers the generators import; editing one rebuilds everything
+SHARED_MODULES = ['glb_utils', 'scene_layout', 'reproducible_build', 'component_cache', 'optimize_glb',
+                  'simplify_glb', 'chunk_glb', 'palette_glb', 'lightmap_glb', 'build_metrics']
+
+# Style guide keys that never change generated geometry
+STYLE_LAYOUT_KEYS = {'layout'}
+STYLE_IGNORED_KEYS = {'loading', 'name', 'version', 'theme', 'description'}
+
+
+def load_json(path):
+    """Load a JSON file, or None if it is missing or mid-write"""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def load_generator(path):
+    """Import (or re-import) a generator script as a module"""
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def shared_imports(path):
+    """Shared modules a script imports, by either import form"""
+    names = set()
+    for node in ast.walk(ast.parse(path.read_text())):
+        if isinstance(node, ast.Import):
+            names |= {alias.name for alias in node.names}
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names.add(node.module)
+    return names & set(SHARED_MODULES)
+
+
+def reload_order(changed, dependencies):
+    """Changed shared modules plus every module importing them, each after its dependencies
+
+    importlib.reload only re-executes the module it is given, so a
+    dependent that did `from glb_utils import read_glb` keeps the old
+    function until it is reloaded too, after glb_utils.
+    """
+    affected = set(changed)
+    grown = True
+    while grown:
+        dependents = {name for name, deps in dependencies.items() if deps & affected}
+        grown = not dependents <= affected
+        affected |= dependents
+
+    order = []
+    seen = set()
+
+    def visit(name):
+        if name in seen:
+            return
+        seen.add(name)
+        for dep in sorted(dependencies.get(name, set()) & affected):
+            visit(dep)
+        order.append(name)
+
+    for name in sorted(affected):
+        visit(name)
+    return order
+
+
+def watched_assets(asset_list, asset_id=None):
+    """Assets the watcher keeps fresh: completed ones, or just the requested ID"""
+    assets = (asset_list or {}).get('assets', [])
+    if asset_id:
+        return {a['id']: a for a in assets if a['id'] == asset_id}
+    return {a['id']: a for a in assets if a.get('status') == 'complete'}
+
+
+def style_change_impact(old_style, new_style, assets):
+    """Work out what a style guide edit affects
+
+    Returns (asset_ids_to_rebuild, relayout_needed).
+    """
+    old_style = old_style or {}
+    new_style = new_style or {}
+    changed = {
+        key for key in set(old_style) | set(new_style)
+        if old_style.get(key) != new_style.get(key)
+    }
+
+    rebuild = set()
+    relayout = bool(changed & STYLE_LAYOUT_KEYS)
+
+    for key in changed - STYLE_LAYOUT_KEYS - STYLE_IGNORED_KEYS:
+        if key == 'stations':
+            # Per-station settings only touch that section's assets
+            old_stations = old_style.get('stations', {})
+            new_stations = new_style.get('stations', {})
+            for section in set(old_stations) | set(new_stations):
+                if old_stations.get(section) != new_stations.get(section):
+                    rebuild |= {aid for aid, a in assets.items() if a['section'] == section}
+        else:
+            rebuild |= set(assets)
+
+    return rebuild, relayout
+
+
+def asset_list_impact(old_list, new_list, assets):
+    """Asset IDs whose asset-list entries were added or changed"""
+    old_entries = {a['id']: a for a in (old_list or {}).get('assets', [])}
+    return {
+        asset_id for asset_id, asset in assets.items()
+        if old_entries.get(asset_id) != asset
+    }
+
+
+def snapshot(paths):
+    """Modification times of the watched files"""
+    return {path: path.stat().st_mtime_ns if path.exists() else None for path in paths}
+
+
+class AssetWatcher:
+    """Warm-session rebuild loop"""
+
+    def __init__(self, generator_path, asset_id=None, build_options=None):
+        self.generator_path = generator_path
+        self.asset_id = asset_id
+        self.build_options = build_options or {}
+        self.style_path = META_DIR / "style-guide.json"
+        self.list_path = META_DIR / "asset-list.json"
+        self.shared_paths = {SCRIPT_DIR / f"{name}.py": name for name in SHARED_MODULES}
+
+        self.style = load_json(self.style_path)
+        self.asset_list = load_json(self.list_path)
+        self.generator = load_generator(generator_path)
+        self.mtimes = snapshot(self.watched_paths())
+
+    def watched_paths(self):
+        return [self.style_path, self.list_path, self.generator_path, *self.shared_paths]
+
+    def poll(self):
+        """Return the watched paths that changed since the last poll"""
+        current = snapshot(self.watched_paths())
+        changed = [path for path in current if current[path] != self.mtimes.get(path)]
+        self.mtimes = current
+        return changed
+
+    def plan(self, changed):
+        """Turn changed files into (asset_ids, relayout_needed) and refresh cached inputs"""
+        assets = watched_assets(self.asset_list, self.asset_id)
+        rebuild = set()
+        relayout = False
+
+        if self.style_path in changed:
+            new_style = load_json(self.style_path)
+            if new_style is not None:
+                style_rebuild, relayout = style_change_impact(self.style, new_style, assets)
+                rebuild |= style_rebuild
+                self.style = new_style
+
+        if self.list_path in changed:
+            new_list = load_json(self.list_path)
+            if new_list is not None:
+                new_assets = watched_assets(new_list, self.asset_id)
+                rebuild |= asset_list_impact(self.asset_list, new_list, new_assets)
+                self.asset_list = new_list
+                assets = new_assets
+
+        # Reload shared modules before re-executing the generator, so its imports bind the new code
+        shared = [self.shared_paths[path] for path in changed if path in self.shared_paths]
+        try:
+            if shared:
+                dependencies = {name: shared_imports(path) for path, name in self.shared_paths.items()}
+                for name in reload_order(shared, dependencies):
+                    if name in sys.modules:
+                        importlib.reload(sys.modules[name])
+            if shared or self.generator_path in changed:
+                self.generator = load_generator(self.generator_path)
+                rebuild |= set(assets)
+        except Exception:
+            # Typically a half-saved file; the next save triggers another reload
+            traceback.print_exc()
+            print("✗ Reload failed; keeping the previous code until the next change")
+            return [], False
+
+        return sorted(rebuild & set(assets)), relayout
+
+    def rebuild(self, asset_ids):
+        """Rebuild each asset in the warm session, printing per-asset latency"""
+        assets = watched_assets(self.asset_list, self.asset_id)
+        for asset_id in asset_ids:
+            start = time.perf_counter()
+            try:
+                self.generator.build_asset(
+                    PROJECT_ROOT, asset_id, assets[asset_id]['section'], self.style,
+                    **self.build_options
+                )
+                print(f"✓ Rebuilt {asset_id} in {time.perf_counter() - start:.2f}s")
+            except Exception:
+                traceback.print_exc()
+                print(f"✗ Rebuild of {asset_id} failed after {time.perf_counter() - start:.2f}s")
+
+    def run(self, interval):
+        print(f"Watching {len(self.watched_paths())} file(s); Ctrl+C to stop")
+        while True:
+            time.sleep(interval)
+            changed = self.poll()
+            if not changed:
+                continue
+
+            start = time.perf_counter()
+            names = ', '.join(path.name for path in changed)
+            print(f"\n{'='*60}")
+            print(f"Changed: {names}")
+
+            asset_ids, relayout = self.plan(changed)
+            if asset_ids:
+                print(f"Affected: {', '.join(asset_ids)}")
+                self.rebuild(asset_ids)
+            elif relayout:
+                self.generator.update_scene_layout(PROJECT_ROOT)
+            else:
+                print("⊘ No assets affected")
+
+            print(f"Change handled in {time.perf_counter() - start:.2f}s")
+            print(f"{'='*60}")
+
+
+def main():
+    """Main execution"""
+    argv = sys.argv
+    argv = argv[argv.index("--") + 1:] if "--" in argv else []
+
+    parser = argparse.ArgumentParser(description='Regenerate affected assets on change in a warm Blender session')
+    parser.add_argument('--generator', default='generate_cinematic_station.py',
+                        help='Generator script (name in tools/blender-scripts or a path)')
+    parser.add_argument('--id', help='Only watch this asset ID')
+    parser.add_argument('--interval', type=float, default=0.5, help='Polling interval in seconds')
+    parser.add_argument('--initial-build', action='store_true', help='Build watched assets once on start')
+
+    args = parser.parse_args(argv)
+
+    generator_path = Path(args.generator)
+    if not generator_path.is_absolute() and not generator_path.exists():
+        generator_path = SCRIPT_DIR / generator_path
+    generator_path = generator_path.absolute()
+
+    if not generator_path.exists():
+        print(f"✗ Error: Generator script not found: {generator_path}")
+        sys.exit(1)
+
+    try:
+        watcher = AssetWatcher(generator_path, asset_id=args.id)
+    except ImportError as e:
+        print(f"✗ Error: {e}")
+        print("Run inside Blender: blender -b -P watch_assets.py -- [options]")
+        sys.exit(1)
+
+    print(f"\n{'='*60}")
+    print("Asset Watch Mode")
+    print(f"Generator: {generator_path.name}")
+    print(f"Assets: {', '.join(watched_assets(watcher.asset_list, args.id)) or 'none'}")
+    print(f"{'='*60}\n")
+
+    if args.initial_build:
+        watcher.rebuild(sorted(watched_assets(watcher.asset_list, args.id)))
+
+    try:
+        watcher.run(args.interval)
+    except KeyboardInterrupt:
+        print("\n⊘ Watch mode stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,13 +10,26 @@ import { Loader } from './components/Loader';
 import { ThreeScene } from './threeScene';
 import { ScrollAnimations } from './scrollAnimations';
 import { sceneConfig } from './sceneConfig';
-import { loadAllAssetMetadata, calculateProgress } from './utils/assetLoader';
+import {
+  loadAllAssetMetadata,
+  loadPreloadPlan,
+  prefetchIdleAssets,
+  proximityAssetsFor,
+  calculateProgress,
+} from './utils/assetLoader';
+import type { PreloadPlan } from './utils/assetLoader';
+import type { AssetMetadata } from './threeScene';
+import { loadSpatialIndex } from './utils/spatialIndex';
 import './styles/global.css';
 
 function App() {
   const canvasRef = useRef<HTMLCanvasElement>(null);
   const sceneRef = useRef<ThreeScene | null>(null);
   const animationsRef = useRef<ScrollAnimations | null>(null);
+  const planRef = useRef<PreloadPlan | null>(null);
+  // Assets the preload plan deferred past first paint, by ID
+  const deferredRef = useRef<Map<string, AssetMetadata>>(new Map());
+  const activeSectionRef = useRef('home');
 
   const [loading, setLoading] = useState(true);
   const [loadingProgress, setLoadingProgress] = useState(0);
@@ -41,24 +54,36 @@ function App() {
         const allMetadata = await loadAllAssetMetadata();
         console.log('[App] Loaded metadata for', allMetadata.length, 'assets:', allMetadata);
 
+        // Whole-asset frustum culling from the BVH scene_layout.py writes
+        threeScene.setSpatialIndex(await loadSpatialIndex().catch(() => null));
+
+        // The preload plan decides what blocks first paint; without one everything does
+        const plan = await loadPreloadPlan().catch(() => null);
+        planRef.current = plan;
+        const firstPaintIds = new Set(plan ? plan.firstPaint.map((item) => item.id) : allMetadata.map((meta) => meta.id));
+        const initialMetadata = allMetadata.filter((meta) => firstPaintIds.has(meta.id));
+        allMetadata
+          .filter((meta) => !firstPaintIds.has(meta.id))
+          .forEach((meta) => deferredRef.current.set(meta.id, meta));
+
         // Track loading progress
         const loadingMap = new Map<string, number>();
-        allMetadata.forEach((meta) => loadingMap.set(meta.id, 0));
+        initialMetadata.forEach((meta) => loadingMap.set(meta.id, 0));
 
         // Load assets with progress tracking
         console.log('[App] Starting to load assets...');
-        await threeScene.loadAllAssets(allMetadata, (assetId, progress) => {
+        await threeScene.loadAllAssets(initialMetadata, (assetId, progress) => {
           if (!mounted) return;
 
           console.log(`[App] Loading ${assetId}: ${progress.toFixed(0)}%`);
           loadingMap.set(assetId, progress);
           const totalProgress = calculateProgress(
             loadingMap,
-            allMetadata.length
+            initialMetadata.length
           );
           setLoadingProgress(totalProgress);
         });
-        console.log('[App] All assets loaded!');
+        console.log(`[App] First-paint assets loaded (${deferredRef.current.size} deferred)`);
 
         // Initialize scroll animations
         const scrollAnims = new ScrollAnimations({
@@ -71,7 +96,7 @@ function App() {
         scrollAnims.setupSectionAnimations();
 
         // Apply asset-specific animations from metadata
-        allMetadata.forEach((meta) => {
+        initialMetadata.forEach((meta) => {
           if (meta.animation) {
             scrollAnims.animateAsset(meta.id, meta.animation);
           }
@@ -80,6 +105,11 @@ function App() {
         // Start render loop
         threeScene.animate();
 
+        // Warm the HTTP cache with the idle tier; deferred assets join the scene on scroll proximity
+        if (plan) {
+          prefetchIdleAssets(plan);
+        }
+
         // Mark loading complete
         if (mounted) {
           setLoadingProgress(100);
@@ -132,6 +162,39 @@ function App() {
     return () => window.removeEventListener('scroll', handleScroll);
   }, []);
 
+  // Bring in the plan's proximity assets (and anything deferred in this section) as sections are reached
+  useEffect(() => {
+    const plan = planRef.current;
+    const threeScene = sceneRef.current;
+    const deferred = deferredRef.current;
+    activeSectionRef.current = activeSection;
+    if (!plan || !threeScene || deferred.size === 0) return;
+
+    const ids = new Set(proximityAssetsFor(plan, activeSection).map((item) => item.id));
+    deferred.forEach((meta) => {
+      if (meta.section === activeSection) ids.add(meta.id);
+    });
+
+    ids.forEach((id) => {
+      const meta = deferred.get(id);
+      if (!meta) return;
+      deferred.delete(id);
+
+      threeScene
+        .loadAsset(meta)
+        .then(() => {
+          // Its section trigger already fired if we are in it, so show it directly
+          if (meta.section === activeSectionRef.current) {
+            threeScene.setAssetVisibility(meta.id, true);
+          }
+          if (meta.animation) {
+            animationsRef.current?.animateAsset(meta.id, meta.animation);
+          }
+        })
+        .catch((error) => console.warn(`[App] Deferred asset ${id} failed to load:`, error));
+    });
+  }, [activeSection, loading]);
+
   const handleLoaderComplete = () => {
     setLoading(false);
   };
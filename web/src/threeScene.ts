@@ -9,6 +9,8 @@ import { DRACOLoader } from 'three/examples/jsm/loaders/DRACOLoader.js';
 import { sceneConfig } from './sceneConfig';
 import { PostProcessingManager } from './postProcessing';
 import { RenderDebugger } from './utils/renderDebug';
+import { queryFrustum } from './utils/spatialIndex';
+import type { SpatialIndex } from './utils/spatialIndex';
 
 export interface AssetMetadata {
   id: string;
@@ -27,6 +29,39 @@ export interface AssetMetadata {
     type: string;
     params?: Record<string, any>;
   };
+  // Populated by the scene manifest
+  url?: string;
+  hash?: string;
+  bytes?: number;
+  triangles?: number;
+  bounds?: {
+    min: [number, number, number];
+    max: [number, number, number];
+    center?: [number, number, number];
+    radius?: number;
+  };
+  // Coarse-first streaming: stages load in order, each replacing the previous
+  progressive?: {
+    stages: { name: string; file: string; fileSize?: number }[];
+  };
+  // Device quality tiers (mobile/desktop/high), lightest first; the manifest adds a hashed url per tier
+  tiers?: {
+    name: string;
+    file: string;
+    fileSize?: number;
+    triangles?: number;
+    vertexOcclusion?: boolean;
+    url?: string;
+    hash?: string;
+    bytes?: number;
+  }[];
+  // Baked assets ship their light as the glTF occlusion texture, scaled down by lightMapIntensity;
+  // vertex AO arrives as COLOR_0, which GLTFLoader already applies as vertex colours
+  lighting?: {
+    baked?: boolean;
+    vertexOcclusion?: boolean;
+    lightMapIntensity?: number;
+  };
 }
 
 export class ThreeScene {
@@ -36,6 +71,9 @@ export class ThreeScene {
   private loader: GLTFLoader;
   private dracoLoader: DRACOLoader;
   private assets: Map<string, THREE.Object3D> = new Map();
+  // Each asset sits in its own group so culling never touches the visibility scroll animations drive
+  private cullGroups: Map<string, THREE.Group> = new Map();
+  private spatialIndex: SpatialIndex | null = null;
   private clock: THREE.Clock;
   private postProcessing: PostProcessingManager | null = null;
 
@@ -133,7 +171,12 @@ export class ThreeScene {
     onProgress?: (progress: number) => void
   ): Promise<THREE.Object3D> {
     return new Promise((resolve, reject) => {
-      const assetPath = `/assets/${metadata.file}`;
+      // Manifest URLs carry a content hash so they can be cached immutably.
+      // Progressive assets render their coarse stage first; tiered assets load the tier for this device.
+      const stages = metadata.progressive?.stages ?? [];
+      const tierFile = this.selectTier(metadata);
+      const firstFile = stages.length > 0 ? stages[0].file : (tierFile ?? metadata.url ?? metadata.file);
+      const assetPath = `/assets/${firstFile}`;
       console.log(`[ThreeScene] Loading asset from: ${assetPath}`);
 
       this.loader.load(
@@ -183,6 +226,7 @@ export class ThreeScene {
           });
 
           console.log(`[ThreeScene] ✓ Loaded ${materialCount} materials (${emissiveCount} emissive)`);
+          this.applyBakedLighting(model, metadata);
 
           // Run diagnostic on first asset load
           if (this.assets.size === 0) {
@@ -195,12 +239,21 @@ export class ThreeScene {
           this.assets.set(metadata.id, model);
 
           // Add to scene
-          this.scene.add(model);
+          const cullGroup = new THREE.Group();
+          cullGroup.name = `${metadata.id}:cull`;
+          cullGroup.add(model);
+          this.cullGroups.set(metadata.id, cullGroup);
+          this.scene.add(cullGroup);
           console.log('[ThreeScene] Model added to scene at position:', model.position);
           console.log('[ThreeScene] Model children count:', model.children.length);
           console.log('[ThreeScene] Model visible:', model.visible);
           console.log('[ThreeScene] Scene total objects:', this.scene.children.length);
 
+          // Stream remaining refinement stages in the background
+          if (stages.length > 1) {
+            this.streamRefinements(model, metadata, stages.slice(1).map((stage) => stage.file));
+          }
+
           resolve(model);
         },
         (progress) => {
@@ -222,6 +275,106 @@ export class ThreeScene {
     });
   }
 
+  private selectTier(metadata: AssetMetadata): string | undefined {
+    const tiers = metadata.tiers ?? [];
+    if (tiers.length === 0) return undefined;
+
+    // deviceMemory is Chromium-only; assume a mid-range device elsewhere
+    const memory = (navigator as Navigator & { deviceMemory?: number }).deviceMemory ?? 4;
+    const mobile = window.matchMedia('(pointer: coarse)').matches || memory <= 2;
+    const high = !mobile && memory >= 8 && this.renderer.capabilities.maxTextureSize >= 8192;
+    const wanted = mobile ? 'mobile' : high ? 'high' : 'desktop';
+
+    // Manifest tiers carry a content-hashed URL, like the main file
+    const tier = tiers.find((candidate) => candidate.name === wanted);
+    return tier ? tier.url ?? tier.file : undefined;
+  }
+
+  private applyBakedLighting(object: THREE.Object3D, metadata: AssetMetadata): void {
+    if (!metadata.lighting?.baked) return;
+    const intensity = metadata.lighting.lightMapIntensity ?? 1;
+
+    // The light is already in the texture, so baked materials go unlit; the scene's
+    // ambient/directional/hemisphere lights would otherwise add to it a second time
+    object.traverse((child) => {
+      const mesh = child as THREE.Mesh;
+      if (!mesh.isMesh) return;
+      const materials = Array.isArray(mesh.material) ? mesh.material : [mesh.material];
+      const unlit = (materials as THREE.MeshStandardMaterial[]).map((material) => {
+        if (!material.aoMap) return material;
+        const basic = this.unlitMaterial(material, intensity);
+        material.dispose();
+        return basic;
+      });
+      mesh.material = Array.isArray(mesh.material) ? unlit : unlit[0];
+    });
+  }
+
+  private unlitMaterial(material: THREE.MeshStandardMaterial, intensity: number): THREE.MeshBasicMaterial {
+    const basic = new THREE.MeshBasicMaterial({
+      name: material.name,
+      color: material.color,
+      map: material.map,
+      vertexColors: material.vertexColors,
+      transparent: material.transparent,
+      opacity: material.opacity,
+      alphaTest: material.alphaTest,
+      side: material.side,
+    });
+    basic.userData.baked = true;
+
+    // GLTFLoader reads the occlusion texture as aoMap; for baked assets it is the light map.
+    // The diffuse bake does not contain emission, so emitters show their emissive colour instead
+    if (material.emissive.getHex() !== 0x000000) {
+      basic.color.copy(material.emissive).multiplyScalar(material.emissiveIntensity);
+      basic.map = material.emissiveMap ?? material.map;
+    } else {
+      basic.lightMap = material.aoMap;
+      basic.lightMapIntensity = intensity;
+    }
+    return basic;
+  }
+
+  private async streamRefinements(model: THREE.Object3D, metadata: AssetMetadata, files: string[]): Promise<void> {
+    for (const file of files) {
+      try {
+        const gltf = await this.loader.loadAsync(`/assets/${file}`);
+
+        gltf.scene.traverse((child) => {
+          if ((child as THREE.Mesh).isMesh) {
+            (child as THREE.Mesh).geometry.computeVertexNormals();
+          }
+        });
+
+        this.applyBakedLighting(gltf.scene, metadata);
+
+        // Swap geometry under the same root so transforms and animations carry over
+        this.disposeObject(model);
+        model.clear();
+        model.add(...gltf.scene.children);
+        console.log(`[ThreeScene] ✓ Refined ${model.name} with ${file}`);
+      } catch (error) {
+        console.warn(`[ThreeScene] Refinement ${file} failed, keeping current stage:`, error);
+        return;
+      }
+    }
+  }
+
+  private disposeObject(object: THREE.Object3D): void {
+    object.traverse((child) => {
+      if ((child as THREE.Mesh).isMesh) {
+        const mesh = child as THREE.Mesh;
+        mesh.geometry?.dispose();
+
+        if (Array.isArray(mesh.material)) {
+          mesh.material.forEach((mat) => mat.dispose());
+        } else {
+          mesh.material?.dispose();
+        }
+      }
+    });
+  }
+
   public async loadAllAssets(
     metadataList: AssetMetadata[],
     onProgress?: (assetId: string, progress: number) => void
@@ -248,7 +401,30 @@ export class ThreeScene {
     }
   }
 
+  /**
+   * Cull whole assets against the precomputed BVH instead of per-mesh bounds
+   */
+  public setSpatialIndex(index: SpatialIndex | null): void {
+    this.spatialIndex = index;
+  }
+
+  public hasAsset(id: string): boolean {
+    return this.assets.has(id);
+  }
+
+  private cullAssets(): void {
+    if (!this.spatialIndex) return;
+
+    this.camera.updateMatrixWorld();
+    const inView = new Set(queryFrustum(this.spatialIndex, this.camera));
+    this.cullGroups.forEach((group, id) => {
+      // Assets the index does not know about are never culled
+      group.visible = inView.has(id) || !(id in this.spatialIndex!.assets);
+    });
+  }
+
   public render(): void {
+    this.cullAssets();
     if (this.postProcessing) {
       this.postProcessing.render();
     } else {
@@ -303,22 +479,10 @@ export class ThreeScene {
     window.removeEventListener('resize', this.handleResize.bind(this));
 
     // Dispose assets
-    this.assets.forEach((asset) => {
-      asset.traverse((child) => {
-        if ((child as THREE.Mesh).isMesh) {
-          const mesh = child as THREE.Mesh;
-          mesh.geometry?.dispose();
-
-          if (Array.isArray(mesh.material)) {
-            mesh.material.forEach((mat) => mat.dispose());
-          } else {
-            mesh.material?.dispose();
-          }
-        }
-      });
-    });
+    this.assets.forEach((asset) => this.disposeObject(asset));
 
     this.assets.clear();
+    this.cullGroups.clear();
   }
 }
 
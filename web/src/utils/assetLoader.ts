@@ -19,9 +19,39 @@ export async function loadAssetMetadata(assetId: string): Promise<AssetMetadata>
 }
 
 /**
- * Load all asset metadata from asset-list.json
+ * Compact scene manifest compiled by build_scene_manifest.py
+ */
+export interface SceneManifest {
+  version: number;
+  catalogHash: string;
+  totalBytes: number;
+  sections: string[];
+  assets: AssetMetadata[];
+}
+
+/**
+ * Load the precomputed scene manifest (one request for the whole catalog)
+ */
+export async function loadSceneManifest(): Promise<SceneManifest | null> {
+  const response = await fetch('/assets/meta/scene-manifest.json', { cache: 'no-cache' });
+
+  if (!response.ok) {
+    return null;
+  }
+
+  return response.json();
+}
+
+/**
+ * Load all asset metadata, preferring the scene manifest and
+ * falling back to asset-list.json plus one request per asset
  */
 export async function loadAllAssetMetadata(): Promise<AssetMetadata[]> {
+  const manifest = await loadSceneManifest().catch(() => null);
+  if (manifest) {
+    return manifest.assets;
+  }
+
   const response = await fetch('/assets/meta/asset-list.json');
 
   if (!response.ok) {
@@ -48,10 +78,68 @@ export async function loadSectionAssets(sectionId: string): Promise<AssetMetadat
 }
 
 /**
- * Preload critical assets (home section)
+ * Byte-budgeted load schedule compiled by plan_preload.py
+ */
+export interface PreloadPlan {
+  version: number;
+  budgets: { firstPaintBytes: number; idleBytes: number };
+  firstPaint: PreloadItem[];
+  idle: PreloadItem[];
+  proximity: (PreloadItem & { triggerSection: string })[];
+}
+
+export interface PreloadItem {
+  id: string;
+  section: string;
+  url: string;
+  bytes: number;
+}
+
+/**
+ * Load the preload plan (null if it has not been built yet)
+ */
+export async function loadPreloadPlan(): Promise<PreloadPlan | null> {
+  const response = await fetch('/assets/meta/preload-plan.json');
+
+  if (!response.ok) {
+    return null;
+  }
+
+  return response.json();
+}
+
+/**
+ * Preload critical assets: the plan's first-paint set, or the home section without a plan
  */
 export async function preloadCriticalAssets(): Promise<AssetMetadata[]> {
-  return loadSectionAssets('home');
+  const plan = await loadPreloadPlan().catch(() => null);
+  if (!plan) {
+    return loadSectionAssets('home');
+  }
+
+  const critical = new Set(plan.firstPaint.map((item) => item.id));
+  const allMetadata = await loadAllAssetMetadata();
+  return allMetadata.filter((meta) => critical.has(meta.id));
+}
+
+/**
+ * Warm the HTTP cache with the plan's idle tier once the browser is idle
+ */
+export function prefetchIdleAssets(plan: PreloadPlan): void {
+  const schedule = (window as any).requestIdleCallback ?? ((cb: () => void) => setTimeout(cb, 1));
+
+  schedule(() => {
+    plan.idle.forEach((item) => {
+      fetch(`/assets/${item.url}`).catch(() => undefined);
+    });
+  });
+}
+
+/**
+ * Plan entries to fetch once the given section is reached
+ */
+export function proximityAssetsFor(plan: PreloadPlan, sectionId: string): PreloadItem[] {
+  return plan.proximity.filter((item) => item.triggerSection === sectionId);
 }
 
 /**
@@ -73,8 +161,12 @@ export function calculateProgress(
 
 export default {
   loadAssetMetadata,
+  loadSceneManifest,
   loadAllAssetMetadata,
   loadSectionAssets,
+  loadPreloadPlan,
   preloadCriticalAssets,
+  prefetchIdleAssets,
+  proximityAssetsFor,
   calculateProgress,
 };
@@ -122,13 +122,14 @@ export class RenderDebugger {
           hasIssues = true;
         } else if (Array.isArray(mesh.material)) {
           mesh.material.forEach((mat, index) => {
-            if (mat.type === 'MeshBasicMaterial') {
+            if (mat.type === 'MeshBasicMaterial' && !mat.userData.baked) {
               issues.push(`Mesh "${mesh.name}" material[${index}] is basic (should be PBR)`);
               hasIssues = true;
             }
           });
         } else {
-          if (mesh.material.type === 'MeshBasicMaterial') {
+          // Baked-lighting materials are unlit on purpose
+          if (mesh.material.type === 'MeshBasicMaterial' && !mesh.material.userData.baked) {
             issues.push(`Mesh "${mesh.name}" has basic material (should be PBR)`);
             hasIssues = true;
           }
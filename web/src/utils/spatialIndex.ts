@@ -0,0 +1,100 @@
+/**
+ * Spatial Index Utilities
+ * Queries the precomputed asset BVH written by scene_layout.py,
+ * so culling and streaming never have to inspect geometry at runtime
+ */
+
+import * as THREE from 'three';
+
+export interface IndexedAsset {
+  section: string;
+  min: [number, number, number];
+  max: [number, number, number];
+  center: [number, number, number];
+  radius: number;
+}
+
+export interface BVHNode {
+  min: [number, number, number];
+  max: [number, number, number];
+  left?: number;
+  right?: number;
+  assets?: string[];
+}
+
+export interface SpatialIndex {
+  version: number;
+  layout: { scrollAxis: string; sectionGap: number };
+  assets: Record<string, IndexedAsset>;
+  nodes: BVHNode[];
+}
+
+/**
+ * Load the spatial index (null if it has not been built yet)
+ */
+export async function loadSpatialIndex(): Promise<SpatialIndex | null> {
+  const response = await fetch('/assets/meta/spatial-index.json');
+
+  if (!response.ok) {
+    return null;
+  }
+
+  return response.json();
+}
+
+function toBox(node: { min: number[]; max: number[] }): THREE.Box3 {
+  return new THREE.Box3(
+    new THREE.Vector3(node.min[0], node.min[1], node.min[2]),
+    new THREE.Vector3(node.max[0], node.max[1], node.max[2])
+  );
+}
+
+/**
+ * Walk the BVH, descending only into nodes that pass the test
+ */
+function query(index: SpatialIndex, test: (box: THREE.Box3) => boolean): string[] {
+  const hits: string[] = [];
+  if (index.nodes.length === 0) return hits;
+
+  const stack = [0];
+  while (stack.length > 0) {
+    const node = index.nodes[stack.pop()!];
+    if (!test(toBox(node))) continue;
+
+    if (node.assets) {
+      hits.push(...node.assets);
+    } else {
+      if (node.left !== undefined) stack.push(node.left);
+      if (node.right !== undefined) stack.push(node.right);
+    }
+  }
+
+  return hits;
+}
+
+/**
+ * Asset IDs whose bounds intersect the camera frustum
+ */
+export function queryFrustum(index: SpatialIndex, camera: THREE.Camera): string[] {
+  const frustum = new THREE.Frustum().setFromProjectionMatrix(
+    new THREE.Matrix4().multiplyMatrices(camera.projectionMatrix, camera.matrixWorldInverse)
+  );
+  return query(index, (box) => frustum.intersectsBox(box));
+}
+
+/**
+ * Asset IDs whose bounds come within `distance` of a point (for distance-based loading)
+ */
+export function queryDistance(
+  index: SpatialIndex,
+  point: THREE.Vector3,
+  distance: number
+): string[] {
+  return query(index, (box) => box.distanceToPoint(point) <= distance);
+}
+
+export default {
+  loadSpatialIndex,
+  queryFrustum,
+  queryDistance,
+};